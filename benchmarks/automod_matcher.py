@@ -0,0 +1,85 @@
+"""
+Benchmark the automod word filter throughput
+
+Compare the compiled matcher with the old per-word loop.
+
+Usage: python benchmarks/automod_matcher.py --rules 500 --messages 20000
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from cogs.modtools.automod import AutomodManagerChild  # noqa: E402
+
+
+def legacy_check(words, message: str) -> bool:
+    """The old check loop, a regex match and a substring test per word"""
+    msg_data = message.lower()
+    for word in words:
+        if isinstance(word, re.Pattern):
+            if word.match(msg_data) is not None:
+                return True
+        elif word in msg_data:
+            return True
+    return False
+
+
+def generate_rules(rules: int, rng: random.Random):
+    regex_count = max(1, rules // 25)
+    words = set()
+    while len(words) < rules - regex_count:
+        words.add("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 10))))
+    all_rules = list(words)
+    for _ in range(regex_count):
+        base = "".join(rng.choice(string.ascii_lowercase) for _ in range(4))
+        all_rules.append(f"|regex|.*{base}[0-9]+")
+    return all_rules
+
+
+def generate_messages(count: int, rules, rng: random.Random):
+    vocabulary = ["halo", "apa", "kabar", "anime", "episode", "baru", "sudah", "rilis", "nonton", "kapan"]
+    messages = []
+    for _ in range(count):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(3, 30))]
+        if rng.random() < 0.01:
+            words.append(rng.choice(rules).replace("|regex|.*", "").replace("[0-9]+", "1"))
+        messages.append(" ".join(words))
+    return messages
+
+
+def main(rules: int, messages: int):
+    rng = random.Random(4649)
+    all_rules = generate_rules(rules, rng)
+    all_messages = generate_messages(messages, all_rules, rng)
+
+    child = AutomodManagerChild(1)
+    child += all_rules
+    start = time.perf_counter()
+    child.matcher
+    build_time = time.perf_counter() - start
+
+    print(f"{len(child.words)} rules, {len(all_messages)} messages, matcher built in {build_time * 1000:.2f} ms")
+    results = {}
+    for name, func in (
+        ("legacy", lambda msg: legacy_check(child.words, msg)),
+        ("compiled", child.check),
+    ):
+        start = time.perf_counter()
+        results[name] = sum(1 for message in all_messages if func(message))
+        elapsed = time.perf_counter() - start
+        print(f"{name:<10} {len(all_messages) / elapsed:>12.0f} msg/s  triggered={results[name]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=500)
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.rules, args.messages)
@@ -0,0 +1,109 @@
+"""
+Benchmark the argument resolving overhead of the ntevent and SocketServer dispatch
+
+Compare the precomputed callback adapter with the old per-dispatch ``inspect.signature`` call.
+
+Usage: python benchmarks/event_dispatch.py --events 200000
+"""
+
+import argparse
+import sys
+import time
+from inspect import signature
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from naotimes.socket import EventCallback, SocketEvent  # noqa: E402
+from naotimes.utils import get_indexed  # noqa: E402
+
+
+class DummyCog:
+    def on_showtimes_update(self, guild_id, project, is_final=False):
+        return guild_id
+
+    def on_socket_event(self, sid, data):
+        return data
+
+
+def legacy_kwarguments(callback, *args, **kwargs):
+    """The old EventManager argument builder, called on every dispatch"""
+    valid_kwargs = {}
+    missing_kwargs = []
+    sigmaballs = signature(callback)
+    for idx, param in enumerate(sigmaballs.parameters.values()):
+        kw = kwargs.get(param.name)
+        if param.default != param.empty:
+            if kw is not None:
+                valid_kwargs[param.name] = kw
+            else:
+                valid_kwargs[param.name] = param.default
+            continue
+
+        args_index = get_indexed(args, idx)
+        if args_index is not None:
+            valid_kwargs[param.name] = args_index
+        else:
+            missing_kwargs.append({"index": idx, "name": param.name})
+
+    if len(missing_kwargs) > 0:
+        return False, None
+    return True, valid_kwargs
+
+
+def legacy_socket_argument(func, sid, data):
+    """The old SocketServer argument builder, called on every message"""
+    available_args = []
+    sigmaballs = signature(func)
+    for param in sigmaballs.parameters.values():
+        if param.default != param.empty:
+            continue
+        available_args.append(param)
+    if len(available_args) == 0:
+        return []
+    if len(available_args) == 1:
+        return [sid]
+    return [sid, data]
+
+
+def bench(name: str, events: int, func):
+    start = time.perf_counter()
+    for _ in range(events):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {elapsed / events * 1e6:>8.3f} us/event")
+
+
+def main(events: int):
+    cog = DummyCog()
+    event_cb = EventCallback(cog.on_showtimes_update)
+    socket_cb = SocketEvent(cog.on_socket_event)
+    args = (1234567890, {"id": "1"})
+    kwargs = {"is_final": True}
+    payload = {"event": "socket_event"}
+
+    def _legacy_event():
+        _, real_kwargs = legacy_kwarguments(cog.on_showtimes_update, *args, **kwargs)
+        cog.on_showtimes_update(**real_kwargs)
+
+    def _adapter_event():
+        cog.on_showtimes_update(**event_cb.bind(args, kwargs))
+
+    def _legacy_socket():
+        cog.on_socket_event(*legacy_socket_argument(cog.on_socket_event, "sid", payload))
+
+    def _adapter_socket():
+        socket_cb.invoke("sid", payload)
+
+    print(f"{events} dispatch per case")
+    bench("ntevent legacy", events, _legacy_event)
+    bench("ntevent precomputed", events, _adapter_event)
+    bench("ntsocket legacy", events, _legacy_socket)
+    bench("ntsocket precomputed", events, _adapter_socket)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.events)
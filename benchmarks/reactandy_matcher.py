@@ -0,0 +1,104 @@
+"""
+Benchmark the custom reaction lookup on every message
+
+Compare the per-guild compiled matcher with the old linear scan of every guild and reaction.
+
+Usage: python benchmarks/reactandy_matcher.py --guilds 1000 --triggers 200 --messages 20000
+"""
+
+import argparse
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from cogs.fun.reactandy import MATCH_EXACT, MATCH_SUBSTRING, Reaction, ReactionManager  # noqa: E402
+
+
+def legacy_check(guilds, guild_id: int, message: str):
+    """The old lookup, a linear scan of the guilds and then the guild reactions"""
+    for guild in guilds:
+        if guild[0] == guild_id:
+            for reaction in guild[1]:
+                if reaction.is_reaction(message):
+                    return reaction
+            return None
+    return None
+
+
+def random_word(rng: random.Random, min_len: int = 4, max_len: int = 10):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(min_len, max_len)))
+
+
+def generate_reactions(guilds: int, triggers: int, rng: random.Random):
+    substring_count = max(1, triggers // 10)
+    all_reactions = {}
+    for guild_id in range(guilds):
+        reactions = []
+        for n in range(triggers):
+            match = MATCH_SUBSTRING if n < substring_count else MATCH_EXACT
+            reactions.append(Reaction(f"{guild_id}-{n}", guild_id, random_word(rng), "ok", match))
+        all_reactions[guild_id] = reactions
+    return all_reactions
+
+
+def generate_messages(count: int, all_reactions, rng: random.Random):
+    vocabulary = ["halo", "apa", "kabar", "anime", "episode", "baru", "sudah", "rilis", "nonton", "kapan"]
+    messages = []
+    guild_ids = list(all_reactions.keys())
+    for _ in range(count):
+        guild_id = rng.choice(guild_ids)
+        roll = rng.random()
+        if roll < 0.05:
+            # Whole message trigger
+            message = rng.choice(all_reactions[guild_id]).action
+        else:
+            words = [rng.choice(vocabulary) for _ in range(rng.randint(3, 30))]
+            if roll < 0.07:
+                words.append(rng.choice(all_reactions[guild_id]).action)
+            message = " ".join(words)
+        messages.append((guild_id, message))
+    return messages
+
+
+def main(guilds: int, triggers: int, messages: int):
+    rng = random.Random(4649)
+    all_reactions = generate_reactions(guilds, triggers, rng)
+    all_messages = generate_messages(messages, all_reactions, rng)
+
+    legacy_guilds = [(guild_id, reactions) for guild_id, reactions in all_reactions.items()]
+    manager = ReactionManager()
+    for guild_id, reactions in all_reactions.items():
+        manager.bulk_add_to_child(guild_id, reactions)
+    start = time.perf_counter()
+    for child in manager:
+        child.matcher
+    build_time = time.perf_counter() - start
+
+    print(
+        f"{guilds} guilds x {triggers} triggers, {len(all_messages)} messages, "
+        f"matchers built in {build_time * 1000:.2f} ms"
+    )
+    for name, func in (
+        ("legacy", lambda guild_id, msg: legacy_check(legacy_guilds, guild_id, msg)),
+        ("compiled", manager.child_has_reaction),
+    ):
+        start = time.perf_counter()
+        triggered = sum(1 for guild_id, message in all_messages if func(guild_id, message) is not None)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{name:<10} {len(all_messages) / elapsed:>12.0f} msg/s "
+            f"{elapsed / len(all_messages) * 1e6:>8.2f} us/msg  triggered={triggered}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--guilds", type=int, default=1000)
+    parser.add_argument("--triggers", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.guilds, args.triggers, args.messages)
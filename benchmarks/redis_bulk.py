@@ -0,0 +1,68 @@
+"""
+Benchmark the RedisBridge bulk read against the old KEYS + GET-per-key loop.
+
+Requires a local Redis server, the benchmark will use a dedicated key prefix
+and remove it after it's done.
+
+Usage: python benchmarks/redis_bulk.py --host 127.0.0.1 --port 6379 --keys 10000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from naotimes.redis import RedisBridge  # noqa: E402
+
+PREFIX = "ntbench_bulk_"
+
+
+async def command_calls(client: RedisBridge) -> int:
+    stats = await client.client.info("commandstats")
+    return sum(value["calls"] for key, value in stats.items() if key.startswith("cmdstat_"))
+
+
+async def measure(client: RedisBridge, name: str, coro_func):
+    await client.client.config_resetstat()
+    start = time.perf_counter()
+    result = await coro_func()
+    elapsed = time.perf_counter() - start
+    # The INFO call itself is not counted since the stats is taken before it's executed.
+    calls = await command_calls(client)
+    print(f"{name:<28} {len(result):>7} values {calls:>7} round trips {elapsed * 1000:>10.2f}ms")
+
+
+async def legacy_getall(client: RedisBridge):
+    all_keys = await client.keys(PREFIX + "*")
+    return [await client.get(key) for key in all_keys]
+
+
+async def main(host: str, port: int, amount: int, batch_size: int):
+    client = RedisBridge(host, port, loop=asyncio.get_event_loop())
+    await client.connect()
+    print(f"Preparing {amount} keys...")
+    pipe = client.client.pipeline(transaction=False)
+    for idx in range(amount):
+        pipe.set(f"{PREFIX}{idx}", client.stringify({"id": str(idx), "prefix": "!", "channels": [idx, idx + 1]}))
+    await pipe.execute()
+
+    await measure(client, "KEYS + GET per key", lambda: legacy_getall(client))
+    await measure(client, f"getall (batch {batch_size})", lambda: client.getall(PREFIX + "*", batch_size))
+    await measure(client, f"getalldict (batch {batch_size})", lambda: client.getalldict(PREFIX + "*", batch_size))
+
+    removed = await client.bulkrm(PREFIX + "*", batch_size)
+    print(f"Cleaned up {removed} keys")
+    await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.host, args.port, args.keys, args.batch_size))
@@ -0,0 +1,92 @@
+"""
+Benchmark partial serialization of Showtimes against the full serialization.
+
+Toggle a single role on a 200 projects server and compare the bytes written
+and the CPU time needed to create the document.
+
+Usage: python benchmarks/showtimes_dirty.py --projects 200 --episodes 24
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import orjson
+from bson import ObjectId
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from naotimes.redis import ShowtimesEncoderDefault  # noqa: E402
+from naotimes.showtimes import Showtimes  # noqa: E402
+
+ROLES = ["TL", "TLC", "ENC", "ED", "TM", "TS", "QC"]
+
+
+def generate_server(projects: int, episodes: int) -> dict:
+    all_projects = []
+    for idx in range(projects):
+        all_projects.append(
+            {
+                "id": str(100000 + idx),
+                "mal_id": idx,
+                "title": f"Project number {idx}",
+                "role_id": "123456789012345678",
+                "start_time": 1640995200,
+                "assignments": {role: {"id": "123456789012345678", "name": f"Staff {role}"} for role in ROLES},
+                "status": [
+                    {
+                        "episode": episode,
+                        "is_done": episode < episodes // 2,
+                        "progress": {role: episode < episodes // 2 for role in ROLES},
+                        "airtime": 1640995200 + episode * 604800,
+                    }
+                    for episode in range(1, episodes + 1)
+                ],
+                "poster_data": {"url": "https://example.com/poster.png", "color": 0x1EB5A6},
+                "aliases": [f"alias {idx}"],
+                "kolaborasi": [],
+                "last_update": 1640995200,
+            }
+        )
+    return {
+        "_id": ObjectId(),
+        "id": "123456789012345678",
+        "name": "Benchmark Server",
+        "serverowner": ["123456789012345678"],
+        "announce_channel": None,
+        "fsdb_id": None,
+        "anime": all_projects,
+        "konfirmasi": [],
+    }
+
+
+def dumps(data) -> bytes:
+    return orjson.dumps(data, default=ShowtimesEncoderDefault)
+
+
+def main(projects: int, episodes: int, number: int):
+    server = Showtimes.from_dict(generate_server(projects, episodes))
+    project = server.projects[projects // 2]
+    episode = project.get_current()
+    episode.progress.toggle("TL", True)
+    project.status = episode
+
+    full_bytes = len(dumps(server.serialize()))
+    partial_bytes = len(dumps(server.to_set_document()))
+    full_time = timeit.timeit(lambda: dumps(server.serialize()), number=number) / number
+    partial_time = timeit.timeit(lambda: dumps(server.to_set_document()), number=number) / number
+
+    print(f"Server with {projects} projects x {episodes} episodes, toggled 1 role")
+    print(f"{'full serialize':<18} {full_bytes:>10} bytes {full_time * 1000:>10.3f}ms")
+    print(f"{'$set document':<18} {partial_bytes:>10} bytes {partial_time * 1000:>10.3f}ms")
+    print(f"Changed paths: {', '.join(server.dirty_paths().keys())}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--episodes", type=int, default=24)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+    main(args.projects, args.episodes, args.number)
@@ -0,0 +1,215 @@
+"""
+Benchmark the memory usage and parse time of Showtimes.from_dict
+
+Compare the __slots__ models with a copy of the old plain __dict__ models.
+
+Usage: python benchmarks/showtimes_parse.py --projects 200 --episodes 24
+"""
+
+import argparse
+import gc
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Optional
+
+import arrow
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from showtimes_dirty import generate_server  # noqa: E402
+
+from naotimes.showtimes import Showtimes  # noqa: E402
+
+ROLES = ["TL", "TLC", "ENC", "ED", "TM", "TS", "QC"]
+
+
+def legacy_to_bool(data) -> bool:
+    """The old to_bool, the quick map was created on every call"""
+    quick_map = {
+        "y": True,
+        "yes": True,
+        "1": True,
+        1: True,
+        "true": True,
+        "n": False,
+        "no": False,
+        "0": False,
+        0: False,
+        "false": False,
+    }
+    if data is not None:
+        if isinstance(data, str):
+            data = data.lower()
+            return quick_map.get(data, False)
+        elif isinstance(data, int):
+            if data > 0:
+                return True
+            return False
+        elif isinstance(data, bool):
+            return data
+    return False
+
+
+class LegacyAssignee:
+    """The old plain __dict__ models, only the parts that is used by from_dict"""
+
+    def __init__(self, id: Optional[int] = None, name: Optional[str] = None):
+        self._id = id
+        self._name = name
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        try:
+            user_id = int(data.get("id"))
+        except (ValueError, TypeError):
+            user_id = None
+        return cls(user_id, data.get("name"))
+
+
+class LegacyAssignment:
+    def __init__(self, tlor, tlcer, encoder, editor, timer, tser, qcer):
+        self._tlor = tlor
+        self._tlcer = tlcer
+        self._encoder = encoder
+        self._editor = editor
+        self._timer = timer
+        self._tser = tser
+        self._qcer = qcer
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(*[LegacyAssignee.from_dict(data.get(role)) for role in ROLES])
+
+
+class LegacyEpisodeStatusChild:
+    def __init__(self, tl=False, tlc=False, enc=False, ed=False, tm=False, ts=False, qc=False):
+        self._tl = tl
+        self._tlc = tlc
+        self._enc = enc
+        self._ed = ed
+        self._tm = tm
+        self._ts = ts
+        self._qc = qc
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(*[legacy_to_bool(data.get(role, False)) for role in ROLES])
+
+
+class LegacyEpisodeStatus:
+    def __init__(self, episode: int, progress: LegacyEpisodeStatusChild, airtime=None, is_finished=False):
+        self._ep = episode
+        self._progress = progress
+        self._is_finished = is_finished
+        self._airtime = airtime
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        progress = LegacyEpisodeStatusChild.from_dict(data.get("progress", {}))
+        return cls(data.get("episode"), progress, data.get("airtime", None), data.get("is_done", False))
+
+
+class LegacyPoster:
+    def __init__(self, url: str, color: int = 0x1EB5A6):
+        self._url = url
+        self._color = color
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data.get("url"), data.get("color", 0x1EB5A6))
+
+
+class LegacyProject:
+    def __init__(self, id, title, mal_id, role_id, start_time, assignment, status, poster, aliases, kolaborasi, update):
+        self._id = id
+        self._title = title
+        self._mal_id = mal_id
+        self._role_id = role_id
+        self._start_time = start_time
+        self._assignment = assignment
+        self._status = status
+        self._poster_data = poster
+        self._aliases = aliases
+        self._kolaborasi = kolaborasi
+        self._fsdb_data = None
+        self._last_update = update
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        try:
+            role_id = int(data.get("role_id"))
+        except (ValueError, TypeError):
+            role_id = None
+        all_status = []
+        for status_data in data.get("status", []):
+            all_status.append(LegacyEpisodeStatus.from_dict(status_data))
+        return cls(
+            data.get("id"),
+            data.get("title"),
+            data.get("mal_id"),
+            role_id,
+            data.get("start_time"),
+            LegacyAssignment.from_dict(data.get("assignments")),
+            all_status,
+            LegacyPoster.from_dict(data.get("poster_data", {})),
+            data.get("aliases", []),
+            list(map(int, data.get("kolaborasi", []))),
+            data.get("last_update", arrow.utcnow().int_timestamp),
+        )
+
+
+class LegacyShowtimes:
+    def __init__(self, id: int, projects: list, owner: list, announce_channel=None, name=None, fsdb_id=None):
+        self._mongo_id = None
+        self._id = id
+        self._projects = projects
+        self._admins = owner
+        self._confirmations = []
+        self._announce_channel = announce_channel
+        self._name = name
+        self._fsdb_id = fsdb_id
+
+    @property
+    def projects(self):
+        return self._projects
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        parsed_project = []
+        for project in data.get("anime", []):
+            parsed_project.append(LegacyProject.from_dict(project))
+        owners = list(map(int, data.get("serverowner", [])))
+        new_cls = cls(int(data["id"]), parsed_project, owners, None, data.get("name"), data.get("fsdb_id"))
+        new_cls._mongo_id = data.get("_id")
+        return new_cls
+
+
+def bench(name: str, model, raw_server: dict, number: int):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    server = model.from_dict(raw_server)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del server
+
+    parse_time = timeit.timeit(lambda: model.from_dict(raw_server), number=number) / number
+    print(f"{name:<8} {(after - before) / 1024:>10.2f} KiB per server {parse_time * 1000:>10.3f} ms from_dict")
+
+
+def main(projects: int, episodes: int, number: int):
+    raw_server = generate_server(projects, episodes)
+    print(f"Server with {projects} projects x {episodes} episodes")
+    bench("dict", LegacyShowtimes, raw_server, number)
+    bench("slots", Showtimes, raw_server, number)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--episodes", type=int, default=24)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+    main(args.projects, args.episodes, args.number)
@@ -0,0 +1,125 @@
+"""
+Load test the SocketServer over loopback
+
+Compare the legacy one request per connection protocol with the framed protocol.
+By default it will start a SocketServer in the same process with a simple echo event,
+use --host and --port to test against an already running server (the password is sent as ``auth``).
+
+Usage: python benchmarks/socket_loadtest.py --requests 20000 --connections 8 --window 32
+"""
+
+import argparse
+import asyncio
+import itertools
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from naotimes.socket import SocketServer  # noqa: E402
+
+FRAME_MAGIC = SocketServer.FRAME_MAGIC
+FRAME_HEADER = SocketServer.FRAME_HEADER
+
+
+def make_request(event: str, password: Optional[str], index: int) -> bytes:
+    request = {"event": event, "data": {"index": index}}
+    if password is not None:
+        request["auth"] = password
+    return orjson.dumps(request)
+
+
+async def legacy_worker(host: str, port: int, requests: int, event: str, password: Optional[str]):
+    for index in range(requests):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(make_request(event, password, index) + b"\x04")
+        await writer.drain()
+        answer = orjson.loads((await reader.readuntil(b"\x04"))[:-1])
+        if answer["success"] != 1:
+            raise RuntimeError(f"Request failed: {answer}")
+        writer.close()
+        await writer.wait_closed()
+
+
+async def framed_worker(host: str, port: int, requests: int, window: int, event: str, password: Optional[str]):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(FRAME_MAGIC)
+    await writer.drain()
+    if await reader.readexactly(len(FRAME_MAGIC)) != FRAME_MAGIC:
+        raise RuntimeError("Server does not support the framed protocol")
+
+    waiters: Dict[int, asyncio.Future] = {}
+    slots = asyncio.Semaphore(window)
+
+    async def _receiver():
+        for _ in range(requests):
+            size, request_id = FRAME_HEADER.unpack(await reader.readexactly(FRAME_HEADER.size))
+            answer = orjson.loads(await reader.readexactly(size))
+            waiters.pop(request_id).set_result(answer)
+            slots.release()
+
+    receiver = asyncio.create_task(_receiver())
+    request_ids = itertools.count(1)
+    for index in range(requests):
+        await slots.acquire()
+        request_id = next(request_ids)
+        waiters[request_id] = asyncio.get_running_loop().create_future()
+        payload = make_request(event, password, index)
+        writer.write(FRAME_HEADER.pack(len(payload), request_id) + payload)
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args: argparse.Namespace):
+    server = None
+    host = args.host
+    if host is None:
+        host = "127.0.0.1"
+        server = SocketServer(args.port, args.password)
+
+        async def echo(sid: str, data: dict):
+            return data
+
+        server.on(args.event, (echo, False))
+        # Wait for the server to start listening
+        while server._server is None:
+            await asyncio.sleep(0.01)
+
+    per_connection = args.requests // args.connections
+    total = per_connection * args.connections
+    print(f"{total} requests with {args.connections} connections (window={args.window})")
+    modes = {
+        "legacy": lambda: legacy_worker(host, args.port, per_connection, args.event, args.password),
+        "framed": lambda: framed_worker(host, args.port, per_connection, args.window, args.event, args.password),
+    }
+    for name, worker in modes.items():
+        if args.mode not in ("both", name):
+            continue
+        start = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(args.connections)])
+        elapsed = time.perf_counter() - start
+        print(f"{name:<8} {total / elapsed:>10.0f} req/s  {elapsed * 1000:>10.2f} ms total")
+
+    if server is not None:
+        server.close()
+        await asyncio.sleep(0.1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default=None, help="Test an already running server instead")
+    parser.add_argument("--port", type=int, default=25671)
+    parser.add_argument("--password", default=None)
+    parser.add_argument("--event", default="loadtest_echo")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--window", type=int, default=32)
+    parser.add_argument("--mode", choices=("both", "legacy", "framed"), default="both")
+    args = parser.parse_args()
+    asyncio.run(run(args))
@@ -0,0 +1,89 @@
+"""
+Benchmark the vote tallying of a giveaway with a lot of entrants
+
+Compare the set-based VoteManager with the old list-based voter storage.
+
+Usage: python benchmarks/vote_giveaway.py --entrants 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from cogs.vote.listener import UserVote, VoteData, VoteManager, VoteMetadata, VoteType  # noqa: E402
+
+
+class ListVoteManager:
+    """The old voter storage, a plain list of user ID"""
+
+    def __init__(self, voter: List[int]):
+        self.voter = voter
+
+    def __contains__(self, user: int):
+        return user in self.voter
+
+    def add_vote(self, user: int):
+        if user not in self.voter:
+            self.voter.append(user)
+
+    def remove_vote(self, user: int):
+        if user in self.voter:
+            self.voter.remove(user)
+
+
+def generate_events(entrants: int, seed: int = 4649):
+    rng = random.Random(seed)
+    users = rng.sample(range(100000000000000000, 999999999999999999), entrants)
+    events = [(user, False) for user in users]
+    # Some people react twice and some retract their entry
+    events.extend((user, False) for user in rng.sample(users, entrants // 10))
+    events.extend((user, True) for user in rng.sample(users, entrants // 20))
+    rng.shuffle(events)
+    return events
+
+
+def bench_list(events):
+    choice = ListVoteManager([])
+    start = time.perf_counter()
+    for user, removed in events:
+        if removed:
+            choice.remove_vote(user)
+        elif user not in choice:
+            choice.add_vote(user)
+    elapsed = time.perf_counter() - start
+    return elapsed, len(choice.voter)
+
+
+def bench_set(events):
+    metadata = VoteMetadata(1, 1, 1, "Giveaway")
+    vote = VoteData(metadata, [VoteManager("giveaway", "Giveaway", "🎉")], 0, VoteType.GIVEAWAY)
+    start = time.perf_counter()
+    for user, removed in events:
+        user_vote = UserVote(1, user, "giveaway", removed)
+        if removed:
+            vote.remove_vote(user_vote)
+        else:
+            vote.add_vote(user_vote)
+    elapsed = time.perf_counter() - start
+    choice = vote.choices[0]
+    return elapsed, choice.tally
+
+
+def main(entrants: int):
+    events = generate_events(entrants)
+    print(f"Giveaway with {entrants} entrants ({len(events)} reaction events)")
+    for name, func in (("list", bench_list), ("set", bench_set)):
+        elapsed, tally = func(events)
+        print(f"{name:<6} {elapsed * 1000:>10.2f} ms total {elapsed / len(events) * 1e6:>8.2f} us/event tally={tally}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entrants", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.entrants)
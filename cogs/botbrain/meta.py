@@ -209,6 +209,15 @@ class BotbrainMeta(commands.Cog):
             all_stat_test.append("**naoTimesDB**: Not connected")
         all_stat_test.append(f"**FansubDB**: {yn_stat(is_fsdb_loaded)}")
         embed.add_field(name="Connection Status", value="\n".join(all_stat_test))
+        http_stats = []
+        if self.bot.http_pool is not None:
+            for name, stats in self.bot.http_pool.stats.items():
+                http_stats.append(
+                    f"**{name}**: {stats['requests']} req, {stats['errors']} err, "
+                    f"avg {stats['average_latency'] * 1000:.0f} ms, max {stats['max_latency'] * 1000:.0f} ms"
+                )
+        if len(http_stats) > 0:
+            embed.add_field(name="HTTP Stats", value="\n".join(http_stats)[:1024], inline=False)
         embed.set_footer(text=f"naoTimes versi {self.bot.semver}")
         await ctx.send(embed=embed)
 
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, TypeVar, Union
+from typing import Dict, List, Optional, Tuple, TypeVar, Union
 
 import arrow
 import disnake
@@ -10,6 +10,7 @@ from disnake.ext import commands
 from naotimes.bot import naoTimesBot
 from naotimes.config import naoTimesTicketConfig
 from naotimes.context import naoTimesContext
+from naotimes.redis import RedisBridge
 
 
 class naoTixAttachment:
@@ -152,12 +153,13 @@ class naoTixHandler:
         self,
         user: naoTixUser,
         channel: naoTixChannel,
-        messages: List[naoTixMessage],
+        messages: Optional[List[naoTixMessage]] = None,
         timestamp: Optional[int] = None,
     ):
         self._user = user
         self._channel = channel
-        self._messages = messages
+        # Only used by the old format, the messages are stored separately in the TicketStore
+        self._messages = messages or []
         self._timestamp = timestamp or arrow.utcnow().int_timestamp
         self._closed_by: Optional[naoTixUser] = None
 
@@ -181,6 +183,9 @@ class naoTixHandler:
     def messages(self) -> List[naoTixMessage]:
         return self._messages
 
+    def clear_messages(self):
+        self._messages = []
+
     @property
     def timestamp(self):
         return self._timestamp
@@ -203,7 +208,7 @@ class naoTixHandler:
     def from_dict(cls, data: dict):
         base = cls(
             user=naoTixUser.from_dict(data["user"]),
-            messages=[naoTixMessage.from_dict(message) for message in data["messages"]],
+            messages=[naoTixMessage.from_dict(message) for message in data.get("messages", [])],
             channel=naoTixChannel.from_dict(data["channel"]),
             timestamp=data["timestamp"],
         )
@@ -211,29 +216,77 @@ class naoTixHandler:
             base.set_closed(naoTixUser.from_dict(data["closed_by"]))
         return base
 
-    def serialize(self):
+    def serialize(self, include_messages: bool = True):
         closed_by = None
         if self._closed_by is not None:
             closed_by = self._closed_by.serialize()
-        return {
+        data = {
             "user": self._user.serialize(),
-            "messages": [message.serialize() for message in self._messages],
             "channel": self._channel.serialize(),
             "timestamp": self._timestamp,
             "closed_by": closed_by,
         }
+        if include_messages:
+            data["messages"] = [message.serialize() for message in self._messages]
+        return data
 
     def is_valid(self, target_id: int):
         return self._user.id == target_id or self._channel.id == target_id
 
 
+class TicketStore:
+    """The ticket storage in redis.
+
+    The ticket metadata is kept separately from the messages, every message is
+    appended to a list so a new message doesn't need to rewrite the whole transcript.
+    """
+
+    META_KEY = "nttixv3_"
+    MESSAGE_KEY = "nttixmsg_"
+
+    def __init__(self, redis_client: RedisBridge):
+        self._db = redis_client
+
+    async def load_all(self) -> List[naoTixHandler]:
+        all_tickets: List[naoTixHandler] = []
+        async for _, ticket in self._db.iterscan(f"{self.META_KEY}*"):
+            handler = naoTixHandler.from_dict(ticket)
+            if ticket.get("messageStore") != "list":
+                # Old format, move the messages to the list.
+                await self._db.rpush(
+                    f"{self.MESSAGE_KEY}{handler.id}", [message.serialize() for message in handler.messages]
+                )
+                handler.clear_messages()
+                await self.save(handler)
+            all_tickets.append(handler)
+        return all_tickets
+
+    async def save(self, handler: naoTixHandler):
+        await self._db.set(
+            f"{self.META_KEY}{handler.id}", {**handler.serialize(include_messages=False), "messageStore": "list"}
+        )
+
+    async def append_message(self, handler: naoTixHandler, message: naoTixMessage):
+        await self._db.rpush(f"{self.MESSAGE_KEY}{handler.id}", [message.serialize()])
+
+    async def get_messages(self, handler: naoTixHandler) -> List[naoTixMessage]:
+        messages = await self._db.lrange(f"{self.MESSAGE_KEY}{handler.id}")
+        return [naoTixMessage.from_dict(message) for message in messages]
+
+    async def delete(self, handler: naoTixHandler):
+        await self._db.rmmany([f"{self.META_KEY}{handler.id}", f"{self.MESSAGE_KEY}{handler.id}"])
+
+
 class BotBrainTicketing(commands.Cog):
     def __init__(self, bot: naoTimesBot) -> None:
         self.bot = bot
         self.logger = logging.getLogger("BotBrain.Ticketing")
         self.db = bot.redisdb
+        self._store = TicketStore(bot.redisdb)
 
-        self._manager: List[naoTixHandler] = []
+        # Indexed by the user and the ticket channel
+        self._manager: Dict[int, naoTixHandler] = {}
+        self._channel_manager: Dict[int, naoTixHandler] = {}
 
         self._ticket_queue = asyncio.Queue[TicketForwarder]()
         self._ticket_done_queue = asyncio.Queue[naoTixHandler]()
@@ -302,10 +355,9 @@ class BotBrainTicketing(commands.Cog):
         self._log_channel = log_channel
 
         self.logger.info("Loading tickets...")
-        all_tickets = await self.db.getall("nttixv3_*")
-        for ticket in all_tickets:
-            handler = naoTixHandler.from_dict(ticket)
-            self._manager.append(handler)
+        all_tickets = await self._store.load_all()
+        for handler in all_tickets:
+            self._index_manager(handler)
         self.logger.info(f"Loaded {len(all_tickets)} tickets")
         self._is_ready = True
 
@@ -317,36 +369,33 @@ class BotBrainTicketing(commands.Cog):
     def _find_manager(
         self, author: disnake.User = None, channel: disnake.TextChannel = None
     ) -> Tuple[Optional[naoTixHandler], bool]:
-        if author is None and channel is None:
-            return None, False
-        for manager in self._manager:
-            if author is not None and manager.is_valid(author.id):
+        if author is not None:
+            manager = self._manager.get(author.id)
+            if manager is not None:
                 return manager, False
-            elif channel is not None and manager.is_valid(channel.id):
+        if channel is not None:
+            manager = self._channel_manager.get(channel.id)
+            if manager is not None:
                 return manager, True
         return None, False
 
+    def _index_manager(self, manager: naoTixHandler):
+        old_manager = self._manager.get(manager.id)
+        if old_manager is not None and old_manager.channel is not None:
+            self._channel_manager.pop(old_manager.channel.id, None)
+        self._manager[manager.id] = manager
+        if manager.channel is not None:
+            self._channel_manager[manager.channel.id] = manager
+
     async def _update_manager(self, manager: naoTixHandler):
-        indx = -1
-        for i, m in enumerate(self._manager):
-            if m.id == manager.id:
-                indx = i
-                break
-        if indx == -1:
-            self._manager.append(manager)
-        else:
-            self._manager[indx] = manager
-        await self.db.set(f"nttixv3_{manager.id}", manager.serialize())
+        self._index_manager(manager)
+        await self._store.save(manager)
 
     async def _delete_manager(self, manager: naoTixHandler):
-        indx = -1
-        for i, m in enumerate(self._manager):
-            if m.id == manager.id:
-                indx = i
-                break
-        if indx >= 0:
-            del self._manager[indx]
-        await self.db.rm(f"nttixv3_{manager.id}")
+        self._manager.pop(manager.id, None)
+        if manager.channel is not None:
+            self._channel_manager.pop(manager.channel.id, None)
+        await self._store.delete(manager)
 
     async def _actually_forward_message(self, forward: TicketForwarder):
         channel_target: Union[disnake.DMChannel, disnake.TextChannel] = None
@@ -418,7 +467,8 @@ class BotBrainTicketing(commands.Cog):
 
     async def _upload_ticket_log(self, ticket: naoTixHandler):
         author = ticket.user
-        messages = ticket.messages
+        # The transcript is only assembled when the ticket is closed
+        messages = await self._store.get_messages(ticket)
         closed_by = ticket.closed_by
         timestamp = ticket.timestamp
 
@@ -641,8 +691,7 @@ class BotBrainTicketing(commands.Cog):
             channel_target = manager.channel
 
         self.logger.info(f"Will be forwarding to {channel_target}")
-        manager.add_message(parsed_message)
-        await self._update_manager(manager)
+        await self._store.append_message(manager, parsed_message)
         await self._ticket_queue.put(TicketForwarder(parsed_message, channel_target, message))
 
     @commands.command(name="ticket", aliases=["tiket"])
@@ -652,8 +701,8 @@ class BotBrainTicketing(commands.Cog):
         if self.bot.config.ticket is None:
             return await ctx.send("Maaf, owner bot tidak mengaktifkan fitur ticketing.")
 
-        existing_ticket = self._find_manager(author.id)
-        if existing_ticket is None:
+        existing_ticket, _ = self._find_manager(author)
+        if existing_ticket is not None:
             return await ctx.send("Masih ada tiket yang berlangsung, silakan hentikan terlebih dahulu.")
 
         user_dm = author.dm_channel
@@ -665,7 +714,7 @@ class BotBrainTicketing(commands.Cog):
             return await ctx.send("Dibatalkan")
 
         await ctx.send("Membuka tiket baru...")
-        startup = naoTixHandler(naoTixUser.from_user(author), None, [])
+        startup = naoTixHandler(naoTixUser.from_user(author), None)
         await self._ticket_start_queue.put(startup)
 
     @commands.command(name="enableticket")
@@ -3,14 +3,15 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Tuple, Type, Union
 
-import arrow
 import disnake
 from disnake.ext import commands
 
 from naotimes.bot import naoTimesBot
 from naotimes.context import naoTimesAppContext, naoTimesContext
+from naotimes.redis import RedisBridge
+from naotimes.scheduler import ScheduledTimer
 from naotimes.timeparse import TimeString, TimeStringParseError
 
 
@@ -50,55 +51,163 @@ class SimpleReminder:
         }
 
 
+class ReminderStore:
+    """The reminder storage in redis.
+
+    The reminders are kept in a sorted set ordered by the target time, with the payload
+    in a separate hash so we can only fetch the nearest one.
+    Each user also have their own sorted set for listing and cancelling.
+    """
+
+    DUE_KEY = "ntreminders_due"
+    DATA_KEY = "ntreminders_data"
+    USER_KEY = "ntreminders_user_"
+
+    def __init__(self, redis_client: RedisBridge):
+        self._db = redis_client
+
+    def _parse(self, results: List[Tuple[str, float, Optional[dict]]]) -> List[SimpleReminder]:
+        reminders: List[SimpleReminder] = []
+        for _, _, payload in results:
+            if payload is None:
+                continue
+            reminders.append(SimpleReminder.from_dict(payload))
+        return reminders
+
+    async def add(self, reminder: SimpleReminder):
+        await self._db.zadd_with_data(
+            self.DUE_KEY, self.DATA_KEY, {reminder.message: (reminder.target, reminder.to_dict())}
+        )
+        await self._db.zadd(self.USER_KEY + reminder.user, {reminder.message: reminder.target})
+
+    async def remove(self, reminder_id: str, user: str):
+        await self._db.zrem_with_data(self.DUE_KEY, self.DATA_KEY, [reminder_id])
+        await self._db.zrem(self.USER_KEY + user, [reminder_id])
+
+    async def is_owner(self, reminder_id: str, user: str) -> bool:
+        scores = await self._db.zscores(self.USER_KEY + user, [reminder_id])
+        return scores[0] is not None
+
+    async def get_due(self, min_target: Union[float, str], count: int) -> List[SimpleReminder]:
+        results = await self._db.zrange_with_data(self.DUE_KEY, self.DATA_KEY, min_score=min_target, count=count)
+        return self._parse(results)
+
+    async def get_user(self, user: str, count: Optional[int] = None) -> List[SimpleReminder]:
+        results = await self._db.zrange_with_data(self.USER_KEY + user, self.DATA_KEY, count=count)
+        return self._parse(results)
+
+    async def count_user(self, user: str) -> int:
+        return await self._db.zcard(self.USER_KEY + user)
+
+
 class FunReminder(commands.Cog):
+    TIMER_KIND = "reminder"
+    # Only the nearest reminders are kept in memory and scheduled,
+    # the rest are paged in when it drops below half of this.
+    REMINDER_WINDOW = 100
+    # Maximum reminders shown on the list command
+    LIST_LIMIT = 10
+
     def __init__(self, bot: naoTimesBot) -> None:
         self.bot = bot
         self.logger = logging.getLogger("Fun.Reminder")
 
-        self._reminder_tasks: Dict[str, asyncio.Task] = {}
+        self._store = ReminderStore(bot.redisdb)
+        self._loaded: Dict[str, SimpleReminder] = {}
+        # Every reminder with target below or equal to this is loaded
+        self._horizon: float = float("-inf")
+        # All of the reminders in the store are loaded
+        self._exhausted = False
+        self._page_lock = asyncio.Lock()
 
     def cog_unload(self) -> None:
-        for task in self._reminder_tasks.values():
-            task.cancel()
+        self.bot.scheduler.unregister(self.TIMER_KIND)
+        for reminder in self._loaded.values():
+            self.bot.loop.create_task(self.bot.scheduler.cancel(self.TIMER_KIND, reminder.message))
 
     async def cog_load(self) -> None:
+        await self._migrate_reminders()
+        self.bot.scheduler.register(self.TIMER_KIND, self._on_reminder_due)
+        await self._page_reminders()
+
+    async def _migrate_reminders(self):
+        # The old format, a key per reminder
         all_reminder = await self.bot.redisdb.getalldict("ntreminderv2_*")
-        invalid_reminder: List[str] = []
-        valid_reminder: List[SimpleReminder] = []
         for keyname, reminder in all_reminder.items():
             try:
-                reminder_sim = SimpleReminder.from_dict(reminder)
+                await self._store.add(SimpleReminder.from_dict(reminder))
+                self.logger.info("Migrated reminder %s to the reminder store", keyname)
             except Exception as e:
                 self.logger.error("Failed to parse reminder %s: %s", keyname, e, exc_info=e)
-                invalid_reminder.append(keyname)
-                continue
-            valid_reminder.append(reminder_sim)
-
-        for keyname in invalid_reminder:
-            self.logger.warning("Reminder %s is invalid, removing", keyname)
+                self.logger.warning("Reminder %s is invalid, removing", keyname)
             await self.bot.redisdb.rm(keyname)
-
-        current = self.bot.now().int_timestamp
-        for reminder in valid_reminder:
-            self._schedule_reminder(reminder, current)
-
-    async def _remove_reminder(self, reminder: SimpleReminder):
-        await self.bot.redisdb.rm("ntreminderv2_" + reminder.message)
-
-    def _schedule_reminder(self, reminder: SimpleReminder, time: int):
-        _task_name = f"reminder-bot-{reminder.message}_{time}"
-        try:
-            task: asyncio.Task = self.bot.loop.create_task(self._delayed_reminder(reminder))
-            self._reminder_tasks[_task_name] = task
-            task.add_done_callback(self._remove_reminder)
-            self.logger.info("Scheduled reminder %s", _task_name)
-        except Exception as e:
-            self.logger.error("Failed to schedule reminder %s: %s", _task_name, e, exc_info=e)
+        # Reminder that is persisted directly on the scheduler
+        for timer in self.bot.scheduler.timers(self.TIMER_KIND):
+            if not timer.persist:
+                continue
+            try:
+                await self._store.add(SimpleReminder.from_dict(timer.payload))
+                self.logger.info("Migrated reminder %s to the reminder store", timer.id)
+            except Exception as e:
+                self.logger.error("Failed to parse reminder %s: %s", timer.id, e, exc_info=e)
+            await self.bot.scheduler.cancel(self.TIMER_KIND, timer.id)
+
+    async def _load_reminder(self, reminder: SimpleReminder):
+        self._loaded[reminder.message] = reminder
+        self._horizon = max(self._horizon, reminder.target)
+        await self.bot.scheduler.schedule(self.TIMER_KIND, reminder.message, reminder.target, persist=False)
+
+    async def _unload_reminder(self, reminder: SimpleReminder):
+        if self._loaded.pop(reminder.message, None) is not None:
+            await self.bot.scheduler.cancel(self.TIMER_KIND, reminder.message)
+
+    async def _page_reminders(self):
+        """Load the next nearest reminders until the window is full"""
+        async with self._page_lock:
+            if self._exhausted or len(self._loaded) >= self.REMINDER_WINDOW // 2:
+                return
+            needed = self.REMINDER_WINDOW - len(self._loaded)
+            # Reminder with the same target as the horizon might be only partially loaded
+            at_horizon = sum(1 for reminder in self._loaded.values() if reminder.target == self._horizon)
+            reminders = await self._store.get_due(self._horizon, needed + at_horizon)
+            for reminder in reminders:
+                if reminder.message not in self._loaded:
+                    await self._load_reminder(reminder)
+            self._exhausted = len(reminders) < needed + at_horizon
+            self.logger.info("Paged in reminders, %d reminders are loaded", len(self._loaded))
+
+    async def _trim_reminders(self):
+        """Unload the farthest reminders if the window is over the limit"""
+        if len(self._loaded) <= self.REMINDER_WINDOW:
+            return
+        by_target = sorted(self._loaded.values(), key=lambda reminder: reminder.target)
+        for reminder in by_target[self.REMINDER_WINDOW :]:
+            await self._unload_reminder(reminder)
+        self._horizon = by_target[self.REMINDER_WINDOW - 1].target
+        self._exhausted = False
 
     async def _create_reminder(self, reminder: SimpleReminder):
-        current = self.bot.now().int_timestamp
-        await self.bot.redisdb.set("ntreminderv2_" + reminder.message, reminder.to_dict())
-        self._schedule_reminder(reminder, current)
+        await self._store.add(reminder)
+        if self._exhausted or reminder.target <= self._horizon:
+            await self._load_reminder(reminder)
+            await self._trim_reminders()
+        self.logger.info("Scheduled reminder %s", reminder.message)
+
+    async def _cancel_reminder(self, reminder_id: str, user: str):
+        await self._store.remove(reminder_id, user)
+        reminder = self._loaded.get(reminder_id)
+        if reminder is not None:
+            await self._unload_reminder(reminder)
+        await self._page_reminders()
+
+    async def _on_reminder_due(self, timer: ScheduledTimer):
+        reminder = self._loaded.pop(timer.id, None)
+        if reminder is None:
+            return
+        await self.bot.wait_until_ready()
+        await self._ping_reminder(reminder)
+        await self._store.remove(reminder.message, reminder.user)
+        await self._page_reminders()
 
     async def _safely_send_message(
         self, message: str, target: disnake.abc.Messageable, reference: disnake.Message = None
@@ -114,40 +223,12 @@ class FunReminder(commands.Cog):
         channel = self.bot.get_channel(int(reminder.channel))
         if channel is None:
             self.logger.error("Channel %s not found, removing reminder!", reminder.channel)
-            await self._remove_reminder(reminder)
             return
 
         partial_msg = None
         if not reminder.from_slash:
             partial_msg = channel.get_partial_message(int(reminder.message))
-        await self._safely_send_message(f"<@{reminder.user}> {reminder.message}", channel, partial_msg)
-        await self._remove_reminder(reminder)
-
-    async def _delayed_reminder(self, reminder: SimpleReminder):
-        target_time = arrow.get(reminder.target, tzinfo="UTC")
-        current = self.bot.now()
-        difference = target_time - current
-
-        difference_seconds = difference.total_seconds()
-        if difference_seconds < 0:
-            difference_seconds = 1
-
-        self.logger.info(f"[{reminder.message}] Sleeping for %s seconds before reminding", difference_seconds)
-        try:
-            await asyncio.sleep(difference_seconds)
-        except (asyncio.TimeoutError, asyncio.CancelledError):
-            self.logger.warning("Reminder %s was cancelled because cogs got unloaded", reminder.message)
-            return
-
-        await self._ping_reminder(reminder)
-
-    def _on_reminder_finished(self, task: asyncio.Task):
-        task_name = task.get_name()
-        try:
-            self.logger.info("Reminder %s finished", task_name)
-            self._reminder_tasks.pop(task_name)
-        except KeyError:
-            self.logger.warning("Reminder %s was not found", task_name)
+        await self._safely_send_message(f"<@{reminder.user}> {reminder.reminder}", channel, partial_msg)
 
     @commands.slash_command(name="ingatkan")
     async def _reminder_cmd_slash(self, ctx: naoTimesAppContext, reminder: str, timeout: str = "5m"):
@@ -172,7 +253,7 @@ class FunReminder(commands.Cog):
         )
 
         await self._create_reminder(reminder_sim)
-        await ctx.send(f"Akan diingatkan dalam {timeout.to_string()}!")
+        await ctx.send(f"Akan diingatkan dalam {timeout_real.to_string()}!")
 
     @commands.command(name="ingatkan", aliases=["ingat", "remind", "remindme", "reminder"])
     async def _reminder_cmd(self, ctx: naoTimesContext, *, sacred_text: str = ""):
@@ -203,6 +284,35 @@ class FunReminder(commands.Cog):
         await self._create_reminder(reminder_sim)
         await ctx.send(f"Akan diingatkan dalam {timeout.to_string()}!", reference=ctx.message)
 
+    @commands.command(name="daftaringat", aliases=["listingat", "reminders", "listreminder"])
+    async def _reminder_list_cmd(self, ctx: naoTimesContext):
+        user_id = str(ctx.author.id)
+        total = await self._store.count_user(user_id)
+        if total < 1:
+            return await ctx.send("Kamu tidak memiliki pengingat yang aktif!")
+
+        reminders = await self._store.get_user(user_id, self.LIST_LIMIT)
+        message = [f"Kamu memiliki **{total}** pengingat aktif:"]
+        for reminder in reminders:
+            message.append(f"`{reminder.message}` <t:{int(reminder.target)}:R>: {reminder.reminder[:100]}")
+        if total > len(reminders):
+            message.append(f"...dan {total - len(reminders)} pengingat lainnya")
+        message.append(f"Gunakan `{self.bot.prefixes(ctx)}batalingat <id>` untuk membatalkan pengingat.")
+        await self._safely_send_message("\n".join(message), ctx.channel, ctx.message)
+
+    @commands.command(name="batalingat", aliases=["hapusingat", "unremind", "cancelreminder"])
+    async def _reminder_cancel_cmd(self, ctx: naoTimesContext, reminder_id: str = ""):
+        reminder_id = reminder_id.strip()
+        if not reminder_id:
+            return await ctx.send("Tolong berikan ID pengingat yang ingin dibatalkan!")
+
+        user_id = str(ctx.author.id)
+        if not await self._store.is_owner(reminder_id, user_id):
+            return await ctx.send("Tidak dapat menemukan pengingat tersebut!")
+
+        await self._cancel_reminder(reminder_id, user_id)
+        await ctx.send("Pengingat berhasil dibatalkan!", reference=ctx.message)
+
 
 def setup(bot: naoTimesBot):
     bot.add_cog(FunReminder(bot))
@@ -1,11 +1,17 @@
 import logging
-from typing import Any, List, Mapping, NamedTuple, Union
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Union
 
 import disnake
 from disnake.ext import commands
 
 from naotimes.bot import naoTimesBot
 from naotimes.context import naoTimesContext
+from naotimes.matcher import AhoCorasick
+
+MATCH_EXACT = "exact"
+MATCH_SUBSTRING = "substring"
+# Shorter substring trigger would fire on almost every message
+SUBSTRING_MIN_LENGTH = 3
 
 
 class Reaction(NamedTuple):
@@ -13,6 +19,7 @@ class Reaction(NamedTuple):
     srv_id: int
     action: str
     response: str
+    match: str = MATCH_EXACT
 
     def __str__(self) -> str:
         return f"<Reactions id={self.id} guild={self.srv_id} aksi={self.action} />"
@@ -21,18 +28,65 @@ class Reaction(NamedTuple):
         return f"<Reactions id={self.id} guild={self.srv_id} aksi={self.action} />"
 
     def to_dict(self):
-        return {"id": self.id, "srv_id": self.srv_id, "action": self.action, "response": self.response}
+        return {
+            "id": self.id,
+            "srv_id": self.srv_id,
+            "action": self.action,
+            "response": self.response,
+            "match": self.match,
+        }
+
+    @property
+    def is_substring(self) -> bool:
+        """Substring reaction is triggered when the action appears anywhere in the message."""
+        return self.match == MATCH_SUBSTRING
 
     def is_reaction(self, user_text: str):
+        if self.is_substring:
+            return self.action in user_text
         if user_text == self.action:
             return True
         return False
 
 
+class ReactionMatcher:
+    """A compiled matcher of a server custom reactions.
+
+    Whole message trigger is a single dict lookup, and every substring trigger
+    is checked in a single pass with an Aho-Corasick automaton.
+    """
+
+    __slots__ = ("_exact", "_substring", "_automaton")
+
+    def __init__(self, reactions: List[Reaction]):
+        self._exact: Dict[str, Reaction] = {}
+        self._substring: Dict[str, Reaction] = {}
+        for reaction in reactions:
+            # The first added reaction wins, like the old linear check.
+            if reaction.is_substring:
+                self._substring.setdefault(reaction.action, reaction)
+            else:
+                self._exact.setdefault(reaction.action, reaction)
+        self._automaton = AhoCorasick(self._substring.keys())
+
+    def match(self, user_text: str) -> Optional[Reaction]:
+        """Find the reaction for the message, whole message trigger first."""
+        reaction = self._exact.get(user_text)
+        if reaction is not None:
+            return reaction
+        if not self._automaton:
+            return None
+        found = self._automaton.search(user_text)
+        if found is None:
+            return None
+        return self._substring[found[1]]
+
+
 class ReactionServer:
     def __init__(self, server: int) -> None:
         self._guild = server
         self._reactions: List[Reaction] = []
+        self._matcher: Optional[ReactionMatcher] = None
 
     def __eq__(self, other: Union[int, "ReactionServer"]):
         if isinstance(other, ReactionServer):
@@ -51,65 +105,63 @@ class ReactionServer:
     def id(self):
         return self._guild
 
+    @property
+    def matcher(self) -> ReactionMatcher:
+        """The compiled matcher, only rebuilt after the reactions changed."""
+        if self._matcher is None:
+            self._matcher = ReactionMatcher(self._reactions)
+        return self._matcher
+
     def has_reaction(self, action: str):
-        for reaction in self._reactions:
-            if reaction.is_reaction(action):
-                return reaction
-        return None
+        return self.matcher.match(action)
 
     def add_reaction(self, reaction: Reaction):
         self._reactions.append(reaction)
+        self._matcher = None
 
     def remove_reaction(self, reaction: Reaction):
         try:
             self._reactions.remove(reaction)
         except ValueError:
             pass
+        self._matcher = None
 
     def bulk_add_reaction(self, reactions: Reaction):
         self._reactions.extend(reactions)
+        self._matcher = None
 
 
 class ReactionManager:
     def __init__(self):
-        self._manager: List[ReactionServer] = []
+        self._manager: Dict[int, ReactionServer] = {}
 
     def __len__(self):
         return len(self._manager)
 
     def __iter__(self):
-        for manager in self._manager:
+        for manager in self._manager.values():
             yield manager
 
     def add_child(self, child: Union[int, ReactionServer]):
         if isinstance(child, int):
             react_srv = ReactionServer(child)
-            self._manager.append(react_srv)
+            self._manager[child] = react_srv
             return react_srv
         elif isinstance(child, ReactionServer):
-            self._manager.append(child)
+            self._manager[child.id] = child
             return child
 
     def get_child(self, server: int) -> ReactionServer:
-        for child in self._manager:
-            if child == server:
-                return child
-        return self.add_child(server)
+        react_srv = self._manager.get(server)
+        if react_srv is None:
+            return self.add_child(server)
+        return react_srv
 
     def has_child(self, server: int):
-        for child in self._manager:
-            if child == server:
-                return True
-        return False
+        return server in self._manager
 
     def remove_child(self, server: int):
-        idx = -1
-        for i, child in enumerate(self._manager):
-            if child == server:
-                idx = i
-                break
-        if idx >= 0:
-            self._manager.pop(idx)
+        self._manager.pop(server, None)
 
     def add_to_child(self, server: int, reaction: Reaction):
         react_srv = self.get_child(server)
@@ -124,7 +176,10 @@ class ReactionManager:
         react_srv.bulk_add_reaction(reactions)
 
     def child_has_reaction(self, guild: int, action: str):
-        react_srv = self.get_child(guild)
+        # Don't create a new child for every guild that send a message
+        react_srv = self._manager.get(guild)
+        if react_srv is None:
+            return None
         return react_srv.has_reaction(action)
 
 
@@ -154,7 +209,9 @@ class FunCustomReactions(commands.Cog):
         server_id = int(data["srv_id"])
         action = data["action"]
         response = data["response"]
-        react_andy = Reaction(react_id, server_id, action, response)
+        # Old reaction does not have the match mode, all of them is exact match.
+        match = data.get("match", MATCH_EXACT)
+        react_andy = Reaction(react_id, server_id, action, response, match)
         return react_andy
 
     @commands.Cog.listener("on_message")
@@ -175,25 +232,38 @@ class FunCustomReactions(commands.Cog):
             self.logger.info(f"{message.guild.id}: sending reaction ID no {reaction.id}")
             await channel.send(content=reaction.response)
 
-    @commands.command(name="trk", aliases=["addcustomreaction", "acr", "tambahreaksikustom"])
-    @commands.guild_only()
-    async def _fun_reaction_add(self, ctx: naoTimesContext, aksi: str, *, reaksi: str):
+    async def _add_custom_reaction(self, ctx: naoTimesContext, aksi: str, reaksi: str, match: str):
         guild_id = ctx.guild.id
         timestamp = int(self.snowflake_to_timestamp(ctx.message.id))
 
-        preact = Reaction(str(timestamp), guild_id, aksi, reaksi)
+        preact = Reaction(str(timestamp), guild_id, aksi, reaksi, match)
         await self.bot.redisdb.set(f"ntreact_{guild_id}_{timestamp}", preact.to_dict())
         self._MANAGER.add_to_child(guild_id, preact)
 
         embed = disnake.Embed(title="Reaksi Kustom", color=disnake.Colour.random())
         embed.description = f"#{preact.id}"
-        embed.add_field(name="Aksi", value=preact.action, inline=False)
+        aksi_value = preact.action
+        if preact.is_substring:
+            aksi_value = f"{preact.action} (di mana saja dalam pesan)"
+        embed.add_field(name="Aksi", value=aksi_value, inline=False)
         embed.add_field(name="Reaksi", value=preact.response, inline=False)
         embed.add_field(
             name="*Info*", value=f"Untuk menghapus, gunakan `{self.bot.prefixes(ctx)}hrk #{preact.id}`"
         )
         return await ctx.send(embed=embed)
 
+    @commands.command(name="trk", aliases=["addcustomreaction", "acr", "tambahreaksikustom"])
+    @commands.guild_only()
+    async def _fun_reaction_add(self, ctx: naoTimesContext, aksi: str, *, reaksi: str):
+        await self._add_custom_reaction(ctx, aksi, reaksi, MATCH_EXACT)
+
+    @commands.command(name="trks", aliases=["addsubstringreaction", "asr", "tambahreaksikustomsebagian"])
+    @commands.guild_only()
+    async def _fun_reaction_add_substring(self, ctx: naoTimesContext, aksi: str, *, reaksi: str):
+        if len(aksi.strip()) < SUBSTRING_MIN_LENGTH:
+            return await ctx.send(f"Aksi untuk reaksi sebagian minimal {SUBSTRING_MIN_LENGTH} karakter!")
+        await self._add_custom_reaction(ctx, aksi, reaksi, MATCH_SUBSTRING)
+
     @commands.command(name="hrk", aliases=["hapusreaksikustom", "dcr", "deletecustomreaction"])
     @commands.guild_only()
     async def _fun_reaction_delete(self, ctx: naoTimesContext, *, preact_id: str):
@@ -275,7 +345,8 @@ class FunCustomReactions(commands.Cog):
         all_reactions = self._MANAGER.get_child(guild_id)
         reactions_text = []
         for n, react in enumerate(all_reactions, 1):
-            reactions_text.append(f"**{n}.** #{react.id} (`{react.action}`)")
+            match_text = " [sebagian]" if react.is_substring else ""
+            reactions_text.append(f"**{n}.** #{react.id} (`{react.action}`){match_text}")
         if len(reactions_text) < 1:
             return await ctx.send("Tidak ada reaksi kustom yang terdaftar")
         splitted_send = self.split_until_less_than(guild_name, reactions_text)
@@ -3,12 +3,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from typing import AnyStr, List, NamedTuple, Optional, Pattern, Union
+from typing import AnyStr, Dict, List, NamedTuple, Optional, Pattern, Union
 
 import disnake
 from disnake.ext import commands
 
 from naotimes.bot import naoTimesBot, naoTimesContext
+from naotimes.matcher import AhoCorasick
 
 WordCheck = Union[str, List[str]]
 WordPattern = Union[str, Pattern[AnyStr]]
@@ -27,6 +28,48 @@ DEFAULT_AUTOMOD_WORDS = [
     "n i gger",
     "nlgger",
 ]
+# Backreference and inline global flags cannot be safely merged into a single alternation.
+_UNMERGEABLE_REGEX = re.compile(r"\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)")
+
+
+class AutomodMatcher:
+    """A compiled matcher of the automod word list.
+
+    Every literal word is checked in a single pass with an Aho-Corasick automaton,
+    and the regexes are merged into a single alternation.
+    """
+
+    __slots__ = ("_literals", "_combined", "_patterns")
+
+    def __init__(self, words: List[WordPattern]):
+        literals: List[str] = []
+        mergeable: List[str] = []
+        self._patterns: List[Pattern] = []
+        for word in words:
+            if isinstance(word, re.Pattern):
+                if _UNMERGEABLE_REGEX.search(word.pattern) or word.flags & ~re.UNICODE:
+                    self._patterns.append(word)
+                else:
+                    mergeable.append(word.pattern)
+            else:
+                literals.append(word.lower())
+        self._literals = AhoCorasick(literals)
+        self._combined: Optional[Pattern] = None
+        if mergeable:
+            try:
+                self._combined = re.compile("|".join(f"(?:{pattern})" for pattern in mergeable))
+            except re.error:
+                # Something like a duplicate group name, check them one by one.
+                self._patterns.extend(re.compile(pattern) for pattern in mergeable)
+
+    def check(self, message: str) -> bool:
+        """Check if the lowercased message triggers the automod."""
+        if self._combined is not None and self._combined.match(message) is not None:
+            return True
+        for pattern in self._patterns:
+            if pattern.match(message) is not None:
+                return True
+        return self._literals.search(message) is not None
 
 
 class AutomodManagerChild:
@@ -34,6 +77,7 @@ class AutomodManagerChild:
         self._id = int(guild_id)
         self._enabled = True
         self._words: List[WordPattern] = []
+        self._matcher: Optional[AutomodMatcher] = None
 
     def __eq__(self, other: Union[int, AutomodManagerChild]):
         if isinstance(other, AutomodManagerChild):
@@ -87,11 +131,20 @@ class AutomodManagerChild:
     def words(self) -> List[WordPattern]:
         return self._words
 
+    @property
+    def matcher(self) -> AutomodMatcher:
+        """The compiled matcher, only rebuilt after the word list changed."""
+        if self._matcher is None:
+            self._matcher = AutomodMatcher(self._words)
+        return self._matcher
+
     def _dedup(self) -> None:
-        self._words = list(set(self._words))
+        self._words = list(dict.fromkeys(self._words))
+        self._matcher = None
 
     def bulk_add(self, words: List[str]) -> None:
-        self._words.extend(words)
+        for word in words:
+            self.add(word)
         self._dedup()
 
     def add(self, word: WordPattern) -> None:
@@ -102,6 +155,7 @@ class AutomodManagerChild:
         else:
             if word not in self._words:
                 self._words.append(word)
+        self._matcher = None
 
     def remove(self, word: WordPattern) -> None:
         if word.startswith("|regex|"):
@@ -117,12 +171,14 @@ class AutomodManagerChild:
         else:
             if word in self._words:
                 self._words.remove(word)
+        self._matcher = None
 
     def remove_at(self, idx: int):
         try:
             self._words.pop(idx)
         except IndexError:
             pass
+        self._matcher = None
 
     def bulk_remove(self, words: List[str]) -> None:
         for word in words:
@@ -153,24 +209,10 @@ class AutomodManagerChild:
             return valid_string
         return None
 
-    def _validate_re(self, pattern: Pattern, msg: str) -> bool:
-        if not isinstance(pattern, re.Pattern):
-            return False
-        return pattern.match(msg) is not None
-
     def check(self, message: str) -> bool:
         if not self._enabled:
             return False
-        msg_data = message.lower()
-        triggered = False
-        for word in self._words:
-            if self._validate_re(word, msg_data):
-                triggered = True
-                break
-            if word in msg_data:
-                triggered = True
-                break
-        return triggered
+        return self.matcher.check(message.lower())
 
     def serialize(self):
         all_words = []
@@ -197,33 +239,30 @@ class AutomodManagerChild:
 
 class AutomodManager:
     def __init__(self):
-        self._manager: List[AutomodManagerChild] = []
+        self._manager: Dict[int, AutomodManagerChild] = {}
 
     def __contains__(self, other: int):
         if isinstance(other, int):
-            for child in self._manager:
-                if child == other:
-                    return True
+            return other in self._manager
         return False
 
     def get_child(self, guild_id: int) -> AutomodManagerChild:
-        for child in self._manager:
-            if child == guild_id:
-                return child
+        child = self._manager.get(guild_id)
+        if child is not None:
+            return child
         return self.add_child(guild_id)
 
     def add_child(self, data: Union[int, dict]) -> AutomodManagerChild:
         if isinstance(data, int):
             child = AutomodManagerChild(data)
-            self._manager.append(child)
         elif isinstance(data, dict):
             child = AutomodManagerChild.from_dict(data)
-            self._manager.append(child)
+        self._manager[child._id] = child
         return child
 
     def remove_child(self, guild_id: int) -> AutomodManagerChild:
         child = self.get_child(guild_id)
-        self._manager.remove(child)
+        self._manager.pop(child._id, None)
         return child
 
     def get_from_child(self, guild_id: int, data: WordCheck) -> Optional[WordCheck]:
@@ -244,7 +283,7 @@ class AutomodManager:
 
     def serialize(self):
         all_data = {}
-        for child in self._manager:
+        for child in self._manager.values():
             all_data[str(child._id)] = child.serialize()
         return all_data
 
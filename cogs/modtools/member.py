@@ -6,10 +6,11 @@ from typing import Any, Dict, Generic, List, Literal, NamedTuple, Optional, Type
 
 import arrow
 import disnake
-from disnake.ext import commands, tasks
+from disnake.ext import commands
 
 from naotimes.bot import naoTimesBot, naoTimesContext
 from naotimes.modlog import ModLog, ModLogAction
+from naotimes.scheduler import ScheduledTimer
 from naotimes.timeparse import TimeString, TimeStringParseError
 
 ShadowBanList = Dict[str, List[str]]
@@ -227,6 +228,9 @@ class MemberManager(Generic[ManagerT]):
 
 
 class ModToolsMemberControl(commands.Cog):
+    MUTE_TIMER = "unmute"
+    TIMED_BAN_TIMER = "timedban"
+
     def __init__(self, bot: naoTimesBot) -> None:
         self.bot = bot
         self.logger = logging.getLogger("ModTools.MemberControl")
@@ -237,15 +241,13 @@ class ModToolsMemberControl(commands.Cog):
         self._timed_ban_manager = MemberManager[MuteManagerChild](MuteManagerChild)
         self._mute_roles: RoleMute = {}
 
-        self._mute_lock = False
-        self._timed_ban_lock = False
+        self.bot.scheduler.register(self.MUTE_TIMER, self._on_mute_timeout)
+        self.bot.scheduler.register(self.TIMED_BAN_TIMER, self._on_ban_timeout)
         self.bot.loop.create_task(self.initialize(), name="modtools-initialize-member")
-        self.watch_mute_timeout.start()
-        self.watch_ban_timeout.start()
 
     def cog_unload(self) -> None:
-        self.watch_mute_timeout.cancel()
-        self.watch_ban_timeout.cancel()
+        self.bot.scheduler.unregister(self.MUTE_TIMER)
+        self.bot.scheduler.unregister(self.TIMED_BAN_TIMER)
 
     async def _inject_mute_overwrite(self, role: disnake.Role, return_error: bool = False):
         guild: disnake.Guild = role.guild
@@ -312,6 +314,7 @@ class ModToolsMemberControl(commands.Cog):
             server_id = server_id[20:]
             for uuid in server_timed_banned:
                 self._timed_ban_manager.add_to_child(int(server_id), uuid)
+                await self._schedule_timeout(self.TIMED_BAN_TIMER, GuildMuted.from_dict(uuid))
             self.logger.info(
                 f"{server_id}: Collected {len(server_timed_banned)} currently timed banned users"
             )
@@ -321,6 +324,7 @@ class ModToolsMemberControl(commands.Cog):
             server_id = server_id[17:]
             for muted_user in server_muted_users:
                 self._mute_manager.add_to_child(int(server_id), muted_user)
+                await self._schedule_timeout(self.MUTE_TIMER, GuildMuted.from_dict(muted_user))
             self.logger.info(f"{server_id}: Collected {len(server_muted_users)} currently muted users")
         self.logger.info("Collecting mute roles...")
         mute_roles = await self.bot.redisdb.getalldict("ntmodtools_muterole_*")
@@ -529,6 +533,7 @@ class ModToolsMemberControl(commands.Cog):
         if manager is not None:
             self.logger.info(f"{user} got unbanned and is in timed ban list, removing it...")
             self._timed_ban_manager.remove_from_child(guild.id, user.id)
+            await self.bot.scheduler.cancel(self.TIMED_BAN_TIMER, self._timer_id(manager))
             await self.bot.redisdb.set(
                 f"ntmodtools_timedban_{guild.id}",
                 self._timed_ban_manager.get_child(guild.id).serialize(),
@@ -558,48 +563,39 @@ class ModToolsMemberControl(commands.Cog):
         except asyncio.CancelledError:
             self.logger.error(f"Task got cancelled, failed to unmute {member} at guild {member.guild}")
 
-    @tasks.loop(seconds=1)
-    async def watch_mute_timeout(self):
+    def _timer_id(self, data: GuildMuted):
+        return f"{data.guild}-{data.id}"
+
+    async def _schedule_timeout(self, kind: str, data: GuildMuted):
+        if data.timeout is None:
+            # Forever muted, sadge
+            return
+        if self.bot.scheduler.get(kind, self._timer_id(data)) is not None:
+            return
+        await self.bot.scheduler.schedule(kind, self._timer_id(data), data.timeout)
+
+    async def _on_mute_timeout(self, timer: ScheduledTimer):
         await self.bot.wait_until_ready()
-        if self._mute_lock:
+        guild_id, _, user_id = timer.id.partition("-")
+        muted: Optional[GuildMuted] = self._mute_manager.get_from_child(int(guild_id), int(user_id))
+        if muted is None:
             return
-        self._mute_lock = True
-        try:
-            current_ts = self.bot.now().timestamp()
-            to_be_removed: List[GuildMuted] = []
-            for muted in self._mute_manager:
-                if muted.timeout is None:
-                    # Forever muted, sadge
-                    continue
-                if current_ts > muted.timeout:
-                    self.logger.info(f"Trying to dispatch unmute event for {muted}")
-                    guild = self.bot.get_guild(muted.guild)
-                    if guild is None:
-                        # Guild is gone, remove from DB
-                        self.logger.warning(f"Guild {muted.guild} is gone, removing from list")
-                        to_be_removed.append(muted)
-                        continue
-                    member = guild.get_member(muted.id)
-                    if member is None:
-                        # Member is gone, wait later.
-                        self.logger.warning(f"Member {muted.id} is gone, removing from list")
-                        continue
-                    self.bot.loop.create_task(
-                        self._dispatch_mute_timeout(member), name=f"ntmute-timeoutv2-{muted.id}-{current_ts}"
-                    )
-                    to_be_removed.append(muted)
-            guild_update = []
-            for remove in to_be_removed:
-                self._mute_manager.remove_from_child(remove.guild, remove.id)
-                if remove.guild not in guild_update:
-                    guild_update.append(remove.guild)
-            for update in guild_update:
-                await self.bot.redisdb.set(
-                    f"ntmodtools_muted_{update}", self._mute_manager.get_child(update).serialize()
-                )
-        except Exception:
-            pass
-        self._mute_lock = False
+        self.logger.info(f"Trying to dispatch unmute event for {muted}")
+        guild = self.bot.get_guild(muted.guild)
+        if guild is not None:
+            member = guild.get_member(muted.id)
+            if member is None:
+                # Member is gone, the evasion check will remove it when they rejoin.
+                self.logger.warning(f"Member {muted.id} is gone, waiting for them to rejoin")
+                return
+            await self._dispatch_mute_timeout(member)
+        else:
+            # Guild is gone, remove from DB
+            self.logger.warning(f"Guild {muted.guild} is gone, removing from list")
+        self._mute_manager.remove_from_child(muted.guild, muted.id)
+        await self.bot.redisdb.set(
+            f"ntmodtools_muted_{muted.guild}", self._mute_manager.get_child(muted.guild).serialize()
+        )
 
     async def _dispatch_timedban_unban(self, guild: disnake.Guild, user: int):
         try:
@@ -615,40 +611,23 @@ class ModToolsMemberControl(commands.Cog):
         except disnake.HTTPException:
             self.logger.error(f"An HTTP exception occured while trying to unban {user} from {guild}!")
 
-    @tasks.loop(seconds=1)
-    async def watch_ban_timeout(self):
+    async def _on_ban_timeout(self, timer: ScheduledTimer):
         await self.bot.wait_until_ready()
-        if self._timed_ban_lock:
+        guild_id, _, user_id = timer.id.partition("-")
+        ban: Optional[GuildMuted] = self._timed_ban_manager.get_from_child(int(guild_id), int(user_id))
+        if ban is None:
             return
-        self._timed_ban_lock = True
-        try:
-            current_ts = self.bot.now().timestamp()
-            to_be_removed: List[GuildMuted] = []
-            for ban in self._timed_ban_manager:
-                if current_ts > ban.timeout:
-                    self.logger.info(f"Trying to dispatch timed unban event for {ban}")
-                    guild = self.bot.get_guild(ban.guild)
-                    if guild is None:
-                        # Guild is gone, remove from DB
-                        self.logger.warning(f"Guild {ban.guild} is gone, removing from list")
-                        to_be_removed.append(ban)
-                        continue
-                    self.bot.loop.create_task(
-                        self._dispatch_timedban_unban(guild, ban.id),
-                    )
-                    to_be_removed.append(ban)
-            guild_update = []
-            for remove in to_be_removed:
-                self._timed_ban_manager.remove_from_child(remove.guild, remove.id)
-                if remove.guild not in guild_update:
-                    guild_update.append(remove.guild)
-            for update in guild_update:
-                await self.bot.redisdb.set(
-                    f"ntmodtools_timedban_{update}", self._timed_ban_manager.get_child(update).serialize()
-                )
-        except Exception:
-            pass
-        self._timed_ban_lock = False
+        self.logger.info(f"Trying to dispatch timed unban event for {ban}")
+        guild = self.bot.get_guild(ban.guild)
+        if guild is not None:
+            await self._dispatch_timedban_unban(guild, ban.id)
+        else:
+            # Guild is gone, remove from DB
+            self.logger.warning(f"Guild {ban.guild} is gone, removing from list")
+        self._timed_ban_manager.remove_from_child(ban.guild, ban.id)
+        await self.bot.redisdb.set(
+            f"ntmodtools_timedban_{ban.guild}", self._timed_ban_manager.get_child(ban.guild).serialize()
+        )
 
     async def _internal_shadowban(self, guild_id: int, user_id: int, action: Literal["BAN", "UNBAN"] = "BAN"):
         action = action.upper()
@@ -834,6 +813,7 @@ class ModToolsMemberControl(commands.Cog):
         await self.bot.redisdb.set(
             f"ntmodtools_muted_{guild_id}", self._mute_manager.get_child(guild_id).serialize()
         )
+        await self._schedule_timeout(self.MUTE_TIMER, muted_data)
         await ctx.send("🔇 User berhasil dimute!")
         modlog_set = self.bot.get_modlog(ctx.guild.id)
         if modlog_set is not None:
@@ -878,6 +858,7 @@ class ModToolsMemberControl(commands.Cog):
         await self.bot.redisdb.set(
             f"ntmodtools_muted_{guild_id}", self._mute_manager.get_child(guild_id).serialize()
         )
+        await self.bot.scheduler.cancel(self.MUTE_TIMER, self._timer_id(muted_member))
         await ctx.send("🔊 User berhasil di-unmute!")
         modlog_set = self.bot.get_modlog(ctx.guild.id)
         if modlog_set is not None:
@@ -955,6 +936,7 @@ class ModToolsMemberControl(commands.Cog):
         await self.bot.redisdb.set(
             f"ntmodtools_timedban_{guild_id}", self._timed_ban_manager.get_child(guild_id).serialize()
         )
+        await self._schedule_timeout(self.TIMED_BAN_TIMER, ban_data)
         await ctx.send(f"🔨 User berhasil di ban untuk {str(timeout)}")
         modlog_setting = self.bot.get_modlog(ctx.guild.id)
         if modlog_setting is not None:
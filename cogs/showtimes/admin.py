@@ -60,6 +60,8 @@ class ShowtimesAdmin(commands.Cog):
         server_pre = self.bot.prefixes(guild)
         anilist_cmd = f"{server_pre}anime"
         project_data = ShowtimesProject.factory()
+        # Keep the raw Anilist data so asking the episode total does not refetch it.
+        anilist_media: Dict[str, dict] = {}
 
         def check_if_author(m: disnake.Message):
             return m.author.id == ctx.author.id
@@ -86,7 +88,12 @@ class ShowtimesAdmin(commands.Cog):
             if prompt_msg:
                 await prompt_msg.delete()
 
-            anilist_data = await self.base.fetch_anilist(ani_id, 1, real_episode)
+            media_data = anilist_media.get(str(ani_id))
+            if media_data is None:
+                media_data = await self.base.fetch_anilist_media(ani_id)
+                if isinstance(media_data, str):
+                    return False
+            anilist_data = self.base.parse_anilist(media_data, 1, real_episode)
             time_data = anilist_data["time_data"]
             all_episodes = []
             for episode, time_info in enumerate(time_data, 1):
@@ -140,11 +147,10 @@ class ShowtimesAdmin(commands.Cog):
                 return None, "Tidak diberikan ID anilist!"
 
             try:
-                anilist_data = await self.base.fetch_anilist(
-                    real_content,
-                    1,
-                    1,
-                )
+                anilist_data = await self.base.fetch_anilist_media(real_content)
+                if not isinstance(anilist_data, str):
+                    anilist_media[str(anilist_data["id"])] = anilist_data
+                    anilist_data = self.base.parse_anilist(anilist_data, 1, 1)
             except Exception:
                 self.logger.warning(f"{server_id}: failed to fetch air start, please try again later.")
                 return (
@@ -1024,8 +1030,8 @@ class ShowtimesAdmin(commands.Cog):
             await ctx.send(f"Berhasil menghapus **{matched_anime.title}** dari daftar utang!")
 
             self.logger.info(f"{server_id}: Updating main database...")
-            for update in update_cache:
-                ures, umsg = await self.bot.ntdb.update_server(update)
+            update_results = await self.bot.ntdb.update_servers(update_cache)
+            for update, (ures, umsg) in zip(update_cache, update_results):
                 if not ures:
                     if update.id not in self.bot.showtimes_resync:
                         self.bot.showtimes_resync.append(update.id)
@@ -1061,8 +1067,8 @@ class ShowtimesAdmin(commands.Cog):
             await self.queue.add_job(update)
 
         self.logger.info(f"{server_id}: Updating main database...")
-        for update in update_cache:
-            ures, umsg = await self.bot.ntdb.update_server(update)
+        update_results = await self.bot.ntdb.update_servers(update_cache)
+        for update, (ures, umsg) in zip(update_cache, update_results):
             if not ures:
                 if update.id not in self.bot.showtimes_resync:
                     self.bot.showtimes_resync.append(update.id)
@@ -29,10 +29,11 @@ SOFTWARE.
 
 import asyncio
 import logging
-import re
+import random
 import time
 from datetime import timedelta
-from typing import List, Optional, Union
+from hashlib import sha1
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import aiohttp
@@ -40,17 +41,24 @@ import disnake
 import feedparser
 import schema as sc
 from disnake.ext import commands, tasks
-from markdownify import markdownify as mdparse
 
 from naotimes.bot import naoTimesBot, naoTimesContext
 from naotimes.helpgenerator import HelpField
-from naotimes.showtimes import FansubRSS, FansubRSSEmbed, FansubRSSFeed
+from naotimes.http import pooled_session
+from naotimes.showtimes import (
+    FansubRSS,
+    FansubRSSEmbed,
+    FansubRSSFeed,
+    FansubRSSParsedFeed,
+    FansubRSSParser,
+    normalize_rss_data,
+)
 from naotimes.timeparse import TimeString
 from naotimes.utils import generate_custom_code, hex_to_color, quote, sync_wrap, time_struct_dt
 
 asyncfeed = sync_wrap(feedparser.parse)
-ImageExtract = re.compile(r"!\[[^\]]*\]\((?P<filename>.*?)(?=\"|\))(?P<optionalpart>\".*\")?\)", re.I)
 NoneStr = sc.Or(str, None)
+FANSUBRSS_USER_AGENT = "naoTimes-RSSBot/1.0 (+https://github.com/naoTimesdev/naoTimes)"
 
 # Schemas
 fansubRSSSchemas = sc.Schema(
@@ -92,18 +100,6 @@ fansubRSSSchemas = sc.Schema(
 fetchedUrlSchemas = sc.Schema({"fetchedURL": [str]})
 
 
-def cleanup_encoding_error(text: str) -> str:
-    """
-    Fix encoding errors in text.
-    """
-    replace_data = {
-        "â€™": "’",
-    }
-    for key, value in replace_data.items():
-        text = text.replace(key, value)
-    return text.strip()
-
-
 def rgbint_to_rgbhex(int_num: int) -> str:
     r = int_num // 256 // 256
     int_num -= 256 * 256 * r
@@ -112,119 +108,73 @@ def rgbint_to_rgbhex(int_num: int) -> str:
     return ("#" + hex(r)[2:] + hex(g)[2:] + hex(b)[2:]).upper()
 
 
-def first_match_in_list(targets: list, key: str):
-    for data in targets:
-        try:
-            valid = data[key]
-            return valid
-        except Exception:
-            pass
-    return None
-
-
-def normalize_rss_data(entries: dict, base_url: str = "") -> dict:
-    """Remove unnecessary tags that basically useless for the bot."""
-    KEYS_TO_REMOVE = [
-        "title_detail",
-        "links",
-        "authors",
-        "author_detail",
-        "content",
-        "updated",
-        "guidislink",
-        "summary_detail",
-        "comments",
-        "href",
-        "wfw_commentrss",
-        "slash_comments",
-    ]
-
-    if base_url.endswith("/"):
-        base_url = base_url[:-1]
-
-    for KEY in KEYS_TO_REMOVE:
-        try:
-            del entries[KEY]
-        except KeyError:
-            pass
-
-    tagar = entries.get("tags", [])
-    proper_tag = []
-    for tag in tagar:
-        proper_tag.append(tag["term"])
-    entries["tags"] = proper_tag
-
-    if "media_thumbnail" in entries:
-        try:
-            matching_image = first_match_in_list(entries["media_thumbnail"], "url")
-            if matching_image is None:
-                entries["media_thumbnail"] = ""
-            else:
-                entries["media_thumbnail"] = matching_image
-        except IndexError:
-            entries["media_thumbnail"] = ""
-        except KeyError:
-            entries["media_thumbnail"] = ""
-    else:
-        entries["media_thumbnail"] = ""
-
-    if "summary" in entries:
-        parsed_summary = cleanup_encoding_error(mdparse(entries["summary"]))
-        extracted_images = list(ImageExtract.finditer(parsed_summary))
-        first_image_link = None
-        for extracted in extracted_images:
-            if extracted:
-                filename_match = extracted.group("filename")
-                all_match = extracted.group()
-                parsed_summary = parsed_summary.replace(all_match, "")
-                parse_url = urlparse(filename_match)
-                if parse_url.netloc == "":
-                    real_url = parse_url.path
-                    if real_url.startswith("/"):
-                        real_url = real_url[1:]
-                    query_params = parse_url.query
-                    first_image_link = f"{base_url}/{real_url}"
-                    if query_params != "":
-                        first_image_link += f"?{query_params}"
-                else:
-                    skema_url = parse_url.scheme
-                    if skema_url == "":
-                        skema_url = "http"
-                    first_image_link = f"{skema_url}://{parse_url.netloc}{parse_url.path}"
-                    if parse_url.query != "":
-                        first_image_link += f"?{parse_url.query}"
-        entries["summary"] = cleanup_encoding_error(parsed_summary)
-        if first_image_link is not None and not entries["media_thumbnail"]:
-            entries["media_thumbnail"] = first_image_link
-
-    if "description" in entries:
-        parsed_description = cleanup_encoding_error(mdparse(entries["description"]))
-        entries["description"] = parsed_description
-
-    if "media_content" in entries:
-        media_url = entries["media_content"]
-        if media_url:
-            matching_image = first_match_in_list(media_url, "url")
-            if matching_image is not None:
-                entries["media_content"] = matching_image
-        else:
-            del entries["media_content"]
-
-    return entries
-
-
-async def async_feedparse(url: str, **kwargs) -> Optional[feedparser.FeedParserDict]:
-    aio_timeout = aiohttp.ClientTimeout(total=30)
-    headers = {"User-Agent": "naoTimes-RSSBot/1.0 (+https://github.com/naoTimesdev/naoTimes)"}
-    async with aiohttp.ClientSession(timeout=aio_timeout, headers=headers) as session:
+class FeedFetchResult(NamedTuple):
+    feed: Optional[feedparser.FeedParserDict]
+    status: int
+    etag: Optional[str]
+    modified: Optional[str]
+    body_hash: Optional[str]
+    size: int
+    body: Optional[bytes] = None
+    content_type: str = ""
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def unchanged(self) -> bool:
+        """The server returned the body, but it's the same as the last fetch"""
+        return self.status != 304 and self.body is None
+
+
+async def async_feedfetch(
+    url: str,
+    etag: Optional[str] = None,
+    modified: Optional[str] = None,
+    last_hash: Optional[str] = None,
+    parse: bool = True,
+) -> Optional[FeedFetchResult]:
+    """Fetch the RSS feed with conditional request.
+
+    The ``If-None-Match`` and ``If-Modified-Since`` header is sent if provided,
+    and if the body hash is the same as ``last_hash`` the feed will not be parsed.
+    If ``parse`` is False, only the raw body is returned.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+    async with pooled_session("fansubrss", timeout=30, user_agent=FANSUBRSS_USER_AGENT) as session:
         try:
-            async with session.get(url) as r:
-                r_data = await r.text()
+            async with session.get(url, headers=headers) as r:
+                if r.status == 304:
+                    return FeedFetchResult(None, 304, etag, modified, last_hash, 0)
+                if r.status >= 400:
+                    return None
+                r_data = await r.read()
+                content_type = r.headers.get("Content-Type", "")
+                new_etag = r.headers.get("ETag")
+                new_modified = r.headers.get("Last-Modified")
         except asyncio.TimeoutError:
             return None
         except aiohttp.ClientError:
             return None
-    return await asyncfeed(r_data, **kwargs)
+    body_hash = sha1(r_data).hexdigest()
+    if last_hash is not None and body_hash == last_hash:
+        return FeedFetchResult(None, 200, new_etag, new_modified, body_hash, len(r_data))
+    feed = None
+    if parse:
+        feed = await asyncfeed(r_data, response_headers={"content-type": content_type})
+    return FeedFetchResult(feed, 200, new_etag, new_modified, body_hash, len(r_data), r_data, content_type)
+
+
+async def async_feedparse(url: str) -> Optional[feedparser.FeedParserDict]:
+    result = await async_feedfetch(url)
+    if result is None:
+        return None
+    return result.feed
 
 
 async def check_if_valid(url: str) -> bool:
@@ -238,8 +188,78 @@ async def check_if_valid(url: str) -> bool:
     return True
 
 
+def seen_entry_id(link: str) -> str:
+    """Hash the entry link, used as the member of the seen set"""
+    return sha1(link.encode("utf-8")).hexdigest()[:20]
+
+
+def feed_url_key(url: str) -> str:
+    """Normalize and hash the feed URL, used to merge the same feed from multiple servers"""
+    parsed = urlparse(url.strip())
+    normalized = parsed._replace(scheme=parsed.scheme.lower(), netloc=parsed.netloc.lower()).geturl()
+    return sha1(normalized.encode("utf-8")).hexdigest()
+
+
+class FansubRSSPollJob:
+    """A feed URL that will be fetched once and then fanned out to all of the subscribed servers.
+
+    The poll interval will grow if the feed does not change, and reset once it changed.
+    Entries that failed to be dispatched to a subscriber are kept and retried on the next poll.
+    """
+
+    __slots__ = (
+        "key",
+        "url",
+        "host",
+        "base_interval",
+        "interval",
+        "next_run",
+        "running",
+        "subscribers",
+        "retry_entries",
+    )
+    MAX_BACKOFF = 4.0
+
+    def __init__(self, key: str, url: str, base_interval: float, now: float):
+        self.key = key
+        self.url = url
+        self.host = urlparse(url).netloc.lower()
+        self.base_interval = base_interval
+        self.interval = base_interval
+        # Spread the first poll across the whole interval
+        self.next_run = now + random.uniform(0, base_interval)
+        self.running = False
+        self.subscribers: List[Tuple[FansubRSS, FansubRSSFeed]] = []
+        self.retry_entries: Dict[str, List[dict]] = {}
+
+    def set_base_interval(self, base_interval: float, now: float):
+        if base_interval == self.base_interval:
+            return
+        self.base_interval = base_interval
+        self.interval = base_interval
+        self.next_run = min(self.next_run, now + base_interval)
+
+    def reschedule(self, now: float, changed: Optional[bool]):
+        if changed:
+            self.interval = self.base_interval
+        else:
+            # Failed fetch backoff faster than an unchanged feed
+            factor = 1.5 if changed is False else 2.0
+            self.interval = min(self.interval * factor, self.base_interval * self.MAX_BACKOFF)
+        self.next_run = now + self.interval * random.uniform(0.85, 1.15)
+
+
 class ShowtimesFansubRSS(commands.Cog):
     DEFAULT_MSG = r":newspaper: | Rilisan Baru: **{title}**\n{link}"
+    PREMIUM_INTERVAL = 2 * 60
+    BASIC_INTERVAL = 5 * 60
+    SCHEDULER_REFRESH = 60
+    MAX_CONCURRENT_FETCH = 8
+    MAX_CONCURRENT_HOST = 2
+    SEEN_RETENTION = 180 * 24 * 60 * 60
+    SEEN_MAX_SIZE = 1000
+    PARSER_WORKERS = 2
+    PARSER_MAX_QUEUE = 8
 
     def __init__(self, bot: naoTimesBot):
         self.bot = bot
@@ -248,23 +268,53 @@ class ShowtimesFansubRSS(commands.Cog):
         self._MAXIMUM_FEEDS = 5
         self._locke: List[str] = []
         self._running_tasks: List[asyncio.Task] = []
+        self._poll_jobs: Dict[str, FansubRSSPollJob] = {}
+        self._last_refresh = 0.0
+        self._fetch_sema = asyncio.Semaphore(self.MAX_CONCURRENT_FETCH)
+        self._host_sema: Dict[str, asyncio.Semaphore] = {}
+        self._seen_migrated = asyncio.Event()
+        self.parser = FansubRSSParser(self.PARSER_WORKERS, self.PARSER_MAX_QUEUE)
         self.bot.loop.create_task(self._loop_check_internal_cogs(), name="fansubrss-init-propagate")
 
-        self._loop_check_basic_rss.start()
-        self._loop_check_premium_rss.start()
+        self._loop_rss_scheduler.start()
 
     def cog_unload(self):
-        self._loop_check_basic_rss.cancel()
-        self._loop_check_premium_rss.cancel()
+        self._loop_rss_scheduler.cancel()
         for task in self._running_tasks:
             task.cancel()
+        self.parser.close()
 
     async def _loop_check_internal_cogs(self):
-        all_feeds = await self.get_all_servers()
-        self.logger.info("Resaving all internal feeds...")
-        for feed in all_feeds:
-            await self.bot.redisdb.set(f"ntfsrss_{feed.id}", feed.serialize())
-        self.logger.info("All feeds has been resaved to use new format!")
+        try:
+            all_feeds = await self.get_all_servers()
+            self.logger.info("Resaving all internal feeds...")
+            for feed in all_feeds:
+                await self.bot.redisdb.set(f"ntfsrss_{feed.id}", feed.serialize())
+            self.logger.info("All feeds has been resaved to use new format!")
+            await self._migrate_seen_entries()
+        finally:
+            self._seen_migrated.set()
+
+    async def _migrate_seen_entries(self):
+        """Migrate the old ``fetchedURL`` list into the seen sorted set"""
+        migrated_keys: List[str] = []
+        async for key, metadata in self.bot.redisdb.iterscan("ntfsrssd_*"):
+            if not isinstance(metadata, dict):
+                continue
+            fetched_url: List[str] = metadata.get("fetchedURL", [])
+            _, server_id, feed_id = key.split("_", 2)
+            # The list is ordered from the oldest, give the newest one the highest score.
+            now = time.time()
+            total = len(fetched_url)
+            mapping = {}
+            for n, link in enumerate(fetched_url[-self.SEEN_MAX_SIZE :]):
+                mapping[seen_entry_id(link)] = now - (min(total, self.SEEN_MAX_SIZE) - n)
+            await self.bot.redisdb.zadd(self._seen_key(server_id, feed_id), mapping)
+            migrated_keys.append(key)
+        for key in migrated_keys:
+            await self.bot.redisdb.rm(key)
+        if migrated_keys:
+            self.logger.info(f"Migrated {len(migrated_keys)} fetched URL list into seen set")
 
     async def get_server(self, server_id: int):
         rss_feeds = await self.bot.redisdb.get(f"ntfsrss_{server_id}")
@@ -295,208 +345,271 @@ class ShowtimesFansubRSS(commands.Cog):
             all_parsed_feeds.append(parsed_fsrss)
         return all_parsed_feeds
 
-    async def read_rss_feeds(self, server_id: Union[str, int], hash_ids: Union[str, int]) -> List[str]:
-        rss_metadata = await self.bot.redisdb.get(f"ntfsrssd_{server_id}_{hash_ids}")
-        if rss_metadata is None:
+    @staticmethod
+    def _seen_key(server_id: Union[str, int], hash_ids: Union[str, int]) -> str:
+        return f"ntfsrsss_{server_id}_{hash_ids}"
+
+    async def filter_unseen(
+        self, server_id: Union[str, int], hash_ids: Union[str, int], entries: List[dict]
+    ) -> List[dict]:
+        """Filter the entries that has not been sent before"""
+        if not entries:
             return []
-        return rss_metadata["fetchedURL"]
+        entry_ids = [seen_entry_id(entry["link"]) for entry in entries]
+        scores = await self.bot.redisdb.zscores(self._seen_key(server_id, hash_ids), entry_ids)
+        return [entry for entry, score in zip(entries, scores) if score is None]
+
+    async def mark_seen(self, server_id: Union[str, int], hash_ids: Union[str, int], links: List[str]):
+        """Mark the links as seen, then trim the seen set to the retention window and maximum size.
+
+        Links that is still in the feed should be marked again so it will not expire.
+        """
+        if not links:
+            return
+        now = time.time()
+        seen_key = self._seen_key(server_id, hash_ids)
+        await self.bot.redisdb.zadd(seen_key, {seen_entry_id(link): now for link in links})
+        await self.bot.redisdb.ztrim(seen_key, now - self.SEEN_RETENTION, self.SEEN_MAX_SIZE)
+
+    def _record_fetch(self, metadata: FansubRSSFeed, fetch_state: dict, result: FeedFetchResult):
+        stats: Dict[str, int] = fetch_state.setdefault(
+            "stats", {"requests": 0, "notModified": 0, "unchanged": 0, "bytesReceived": 0, "bytesSaved": 0}
+        )
+        stats["requests"] += 1
+        if result.not_modified:
+            stats["notModified"] += 1
+            stats["bytesSaved"] += fetch_state.get("size", 0)
+        else:
+            stats["bytesReceived"] += result.size
+            fetch_state["size"] = result.size
+            if result.unchanged:
+                stats["unchanged"] += 1
+        fetch_state["etag"] = result.etag
+        fetch_state["modified"] = result.modified
+        fetch_state["hash"] = result.body_hash
+        ratio_304 = stats["notModified"] / stats["requests"] * 100
+        self.logger.info(
+            f"{metadata!r}: got {result.status} ({result.size} bytes), "
+            f"{stats['bytesSaved']} bytes saved, 304 ratio {ratio_304:.2f}%"
+        )
+
+    def _record_parse(self, metadata: FansubRSSFeed, fetch_state: dict, parsed: FansubRSSParsedFeed):
+        stats: Dict[str, float] = fetch_state.setdefault("parseStats", {"count": 0, "total": 0.0, "max": 0.0})
+        stats["count"] += 1
+        stats["total"] += parsed.parse_time
+        stats["max"] = max(stats["max"], parsed.parse_time)
+        self.logger.info(
+            f"{metadata!r}: parsed {len(parsed.entries)} entries in {parsed.parse_time * 1000:.2f}ms "
+            f"(waited {parsed.wait_time * 1000:.2f}ms, {self.parser.pending} pending)"
+        )
 
-    async def _recursive_check_feeds(self, metadata: FansubRSSFeed, fetched_url: List[str]):
+    async def _recursive_check_feeds(self, metadata: FansubRSSFeed, fetch_state: Optional[dict] = None):
+        etag, modified, last_hash = None, None, None
+        if fetch_state is not None:
+            etag, modified = fetch_state.get("etag"), fetch_state.get("modified")
+            last_hash = fetch_state.get("hash")
         try:
-            feed = await asyncio.wait_for(
-                async_feedparse(metadata.feed_url, etag=metadata.last_etag, modified=metadata.last_modified),
+            result = await asyncio.wait_for(
+                async_feedfetch(metadata.feed_url, etag, modified, last_hash, parse=False),
                 timeout=15.0,
             )
         except asyncio.TimeoutError:
             self.logger.error(f"connection timeout trying to fetch {metadata.feed_url} rss.")
             return None, metadata
-        if not feed:
+        if result is None:
             return None, metadata
+        if fetch_state is not None:
+            self._record_fetch(metadata, fetch_state, result)
+        if result.not_modified or result.unchanged:
+            # Nothing changed since the last fetch, no need to parse anything.
+            return [], metadata
+        parsed = await self.parser.parse(result.body, result.content_type)
+        if parsed is None:
+            return None, metadata
+        if fetch_state is not None:
+            self._record_parse(metadata, fetch_state, parsed)
+
+        metadata.last_etag = result.etag or ""
+        metadata.last_modified = result.modified or ""
+        return parsed.entries, metadata
+
+    async def _dispatch_feed_entries(self, server: FansubRSS, feed: FansubRSSFeed, entries: List[dict]) -> bool:
+        """Send the new entries of a feed to the server channel.
+
+        Returns False if the server is locked and the entries need to be processed again later.
+        """
+        if self.is_locked(server.id):
+            self.logger.info(f"{server!r}: server is locked, skipping {feed!r}")
+            return False
+        if len(entries) < 1:
+            return True
+        guild_info = self.bot.get_guild(server.id)
+        if guild_info is None:
+            self.logger.warning(f"{server!r}: server not found on bot cache?")
+            return True
+
+        new_news = await self.filter_unseen(server.id, feed.id, entries)
+        if len(new_news) < 1:
+            self.logger.info(f"{server!r}: No new news for {feed!r}")
+            # Refresh the seen entries that is still in the feed so it doesn't expire.
+            await self.mark_seen(server.id, feed.id, [entry["link"] for entry in entries])
+            return True
+
+        self.logger.info(f"{server!r}: Updating Feed: {feed!r}")
+        channel = guild_info.get_channel(feed.channel)
+        if channel is None:
+            self.logger.warning(f"{server!r}: Channel {feed!r} not found")
+            return True
+        self.logger.info(f"{server!r}-{feed!r}: Sending result to: #{channel.name}")
+        await self.mark_seen(server.id, feed.id, [entry["link"] for entry in entries])
+        is_forbidden = False
+        for entry in new_news[::-1]:
+            if is_forbidden:
+                self.logger.warning(
+                    f"{server!r}-{feed!r}: Cannot send anything to channel since bot has no perms!"
+                )
+                break
+            txt_msg, emb_msg = feed.generate(entry)
+            kwargs_to_send = {}
+            if txt_msg is not None:
+                kwargs_to_send["content"] = txt_msg
+            if emb_msg is not None:
+                kwargs_to_send["embed"] = emb_msg
+
+            if len(list(kwargs_to_send.keys())) < 1:
+                self.logger.warning(
+                    f"{server!r}: For some reason, RSS feed `{feed!r}` doesn't have message "
+                    "or embed formatting."
+                )
+                continue
 
-        base_url = feed["feed"]["link"]
-        parsed_base_url = urlparse(base_url)
-
-        skema_uri = parsed_base_url.scheme
-        if skema_uri == "":
-            skema_uri = "http"
-        base_url_for_real = f"{skema_uri}://{parsed_base_url.netloc}"
-
-        entries = feed.entries
-
-        filtered_entry = []
-        for n, entry in enumerate(entries):
-            if entry["link"] in fetched_url:
+            try:
+                await channel.send(**kwargs_to_send)
+            except disnake.Forbidden:
+                self.logger.warning(f"{server!r}: Forbidden to send message to #{channel.name}")
+                is_forbidden = True
+                continue
+            except disnake.HTTPException:
+                self.logger.warning(f"{server!r}: Failed to send message to #{channel.name}")
                 continue
-            filtered_entry.append(normalize_rss_data(entries[n], base_url_for_real))
+        return True
 
-        etag = ""
-        modified_tag = ""
-        try:
-            etag = feed.etag
-        except AttributeError:
-            pass
-        try:
-            modified_tag = feed.modified
-        except AttributeError:
-            pass
-        metadata.last_etag = etag
-        metadata.last_modified = modified_tag
-        return filtered_entry, metadata
-
-    async def _actual_internal_feed_rss_checker(
-        self, guild_info: disnake.Guild, server: FansubRSS, feed: FansubRSSFeed
-    ):
+    async def _poll_feed_job(self, job: FansubRSSPollJob):
+        changed: Optional[bool] = None
+        subscribers = job.subscribers
         try:
-            self.logger.info(f"Fetching feed: {feed.feed_url}")
-            fetched_news = await self.read_rss_feeds(server.id, feed.id)
-            try:
-                new_news, _ = await self._recursive_check_feeds(feed, fetched_news)
-            except Exception as e:
-                self.logger.error(f"Error fetching feed of {feed!r}", exc_info=e)
+            if len(subscribers) < 1:
                 return
-            if new_news is None:
+            host_sema = self._host_sema.get(job.host)
+            if host_sema is None:
+                host_sema = asyncio.Semaphore(self.MAX_CONCURRENT_HOST)
+                self._host_sema[job.host] = host_sema
+            async with self._fetch_sema, host_sema:
+                fetch_key = f"ntfsrssf_{job.key}"
+                fetch_state = await self.bot.redisdb.get(fetch_key) or {}
+                self.logger.info(f"Fetching feed: {job.url} ({len(subscribers)} subscriber)")
+                try:
+                    entries, _ = await self._recursive_check_feeds(subscribers[0][1], fetch_state)
+                except Exception as e:
+                    self.logger.error(f"Error fetching feed of {job.url}", exc_info=e)
+                    return
+            if entries is None:
                 self.logger.error(
-                    f"Failed to fetch RSS Feed ({feed}), possiblity include timeout and parsing error."
+                    f"Failed to fetch RSS Feed ({job.url}), possiblity include timeout and parsing error."
                 )
                 return
 
-            if len(new_news) < 1:
-                self.logger.info(f"{server!r}: No new news for {feed!r}")
-                return
-
-            self.logger.info(f"{server!r}: Updating Feed: {feed!r}")
-            channel = guild_info.get_channel(feed.channel)
-            if channel is None:
-                self.logger.warning(f"{server!r}: Channel {feed!r} not found")
-                return
-            self.logger.info(f"{server!r}-{feed!r}: Sending result to: #{channel.name}")
-            for entry in new_news[::-1]:
-                fetched_news.append(entry["link"])
-            await self.bot.redisdb.set(f"ntfsrssd_{server.id}_{feed.id}", {"fetchedURL": fetched_news})
-            is_forbidden = False
-            for entry in new_news[::-1]:
-                if is_forbidden:
-                    self.logger.warning(
-                        f"{server!r}-{feed!r}: Cannot send anything to channel since bot has no perms!"
-                    )
-                    break
-                txt_msg, emb_msg = feed.generate(entry)
-                kwargs_to_send = {}
-                if txt_msg is not None:
-                    kwargs_to_send["content"] = txt_msg
-                if emb_msg is not None:
-                    kwargs_to_send["embed"] = emb_msg
-
-                if len(list(kwargs_to_send.keys())) < 1:
-                    self.logger.warning(
-                        f"{server!r}: For some reason, RSS feed `{feed!r}` doesn't have message "
-                        "or embed formatting."
-                    )
-                    continue
-
+            changed = len(entries) > 0
+            entry_links = {entry["link"] for entry in entries}
+            retry_entries = job.retry_entries
+            job.retry_entries = {}
+            for server, feed in subscribers:
+                subscriber_key = f"{server.id}_{feed.id}"
+                subscriber_entries = entries
+                pending_entries = retry_entries.get(subscriber_key)
+                if pending_entries:
+                    # The feed might be unchanged, so also send what failed on the last poll.
+                    subscriber_entries = entries + [
+                        entry for entry in pending_entries if entry["link"] not in entry_links
+                    ]
                 try:
-                    await channel.send(**kwargs_to_send)
-                except disnake.Forbidden:
-                    self.logger.warning(f"{server!r}: Forbidden to send message to #{channel.name}")
-                    is_forbidden = True
-                    continue
-                except disnake.HTTPException:
-                    self.logger.warning(f"{server!r}: Failed to send message to #{channel.name}")
-                    continue
+                    is_handled = await self._dispatch_feed_entries(server, feed, subscriber_entries)
+                except Exception as e:
+                    self.logger.error(f"Failed to dispatch {feed!r} to {server!r}", exc_info=e)
+                    is_handled = False
+                if not is_handled and subscriber_entries:
+                    # Only retry the failing server, the other subscribers keep the feed validators.
+                    job.retry_entries[subscriber_key] = subscriber_entries
+            await self.bot.redisdb.set(fetch_key, fetch_state)
         except asyncio.CancelledError:
-            self.logger.warning(f"Got hangup for task cancellation for feed {feed!r} for server {server!r}")
+            self.logger.warning(f"Got hangup for task cancellation for feed {job.url}")
+        finally:
+            job.running = False
+            job.reschedule(time.monotonic(), changed)
 
     def _deregister_rss_schedule(self, task: asyncio.Task):
         try:
-            self.logger.info(f"RSS task {task.get_name()} has finished running")
+            self.logger.debug(f"RSS task {task.get_name()} has finished running")
             self._running_tasks.remove(task)
         except (ValueError, KeyError, IndexError, AttributeError):
             self.logger.error(f"Failed to deregister task {task.get_name()}, probably missing!")
 
-    async def _main_internal_rss_checker(self, server: FansubRSS, ctime: int, has_premium: bool):
-        try:
-            fetch_feeds: List[FansubRSSFeed] = []
-            if len(server.feeds) < 1:
-                self.logger.warning(f"{server!r}: no registered feeds")
-                return
-            if has_premium:
-                fetch_feeds.extend(server.feeds)
-            else:
-                fetch_feeds.append(server.feeds[0])
-
-            guild_info = self.bot.get_guild(server.id)
-            if guild_info is None:
-                self.logger.warning(f"{server!r}: server not found on bot cache?")
-                return
-
-            premium_ = "premium" if has_premium else "basic"
-
-            for feed in fetch_feeds:
-                try:
-                    _task_name = f"fansubrss-{server.id}-{premium_}-feed_{feed.id}-{ctime}"
-                    task: asyncio.Task = self.bot.loop.create_task(
-                        self._actual_internal_feed_rss_checker(guild_info, server, feed), name=_task_name
-                    )
-                    self._running_tasks.append(task)
-                    self.logger.info(f"Scheduled RSSFeed checker for {feed!r} ({server!r})")
-                    task.add_done_callback(self._deregister_rss_schedule)
-                except Exception as e:
-                    self.logger.error(
-                        f"Failed to schedule RSS checker for feed {feed!r} at {server!r}", exc_info=e
-                    )
-        except asyncio.CancelledError:
-            self.logger.warning(f"Got hangup for task cancellation for server {server!r}")
-
-    def _schedule_dispatch_rss(self, server: FansubRSS, current_time: int, is_premium: bool = False):
-        premium_ = "premium" if is_premium else "basic"
-        _task_name = f"fansubrss-{server.id}-{premium_}-{current_time}"
-        try:
-            task: asyncio.Task = self.bot.loop.create_task(
-                self._main_internal_rss_checker(server, current_time, is_premium), name=_task_name
-            )
-            self._running_tasks.append(task)
-            task.add_done_callback(self._deregister_rss_schedule)
-            self.logger.info(f"Scheduled RSS checker for {server!r}")
-        except Exception as e:
-            self.logger.error(f"Failed to schedule RSS checker for {server!r}", exc_info=e)
-
-    @tasks.loop(minutes=2.0, name="showtimes-fansubss-premium")
-    async def _loop_check_premium_rss(self):
-        """A tasks process that will check premium server"""
+    async def _refresh_poll_jobs(self, now: float):
+        """Rebuild the feed subscribers, the same feed URL in multiple server is merged into one job"""
         all_servers = await self.get_all_servers()
-        premium_server = list(filter(lambda x: x.has_premium and not self.is_locked(x.id), all_servers))
-        current_time = self.bot.now().int_timestamp
-        if len(premium_server) > 0:
+        refreshed_jobs: Dict[str, FansubRSSPollJob] = {}
+        base_intervals: Dict[str, float] = {}
+        for server in all_servers:
+            if len(server.feeds) < 1:
+                continue
+            has_premium = server.has_premium
+            interval = self.PREMIUM_INTERVAL if has_premium else self.BASIC_INTERVAL
+            active_feeds = server.feeds if has_premium else server.feeds[:1]
+            for feed in active_feeds:
+                key = feed_url_key(feed.feed_url)
+                job = refreshed_jobs.get(key)
+                if job is None:
+                    job = self._poll_jobs.get(key)
+                    if job is None:
+                        job = FansubRSSPollJob(key, feed.feed_url, interval, now)
+                    # Replace the list so running job keep their own subscribers
+                    job.subscribers = []
+                    refreshed_jobs[key] = job
+                job.subscribers.append((server, feed))
+                base_intervals[key] = min(base_intervals.get(key, interval), interval)
+        for key, job in refreshed_jobs.items():
+            job.set_base_interval(base_intervals[key], now)
+        self._poll_jobs = refreshed_jobs
+
+    @tasks.loop(seconds=10.0, name="showtimes-fansubrss-scheduler")
+    async def _loop_rss_scheduler(self):
+        """A scheduler that dispatch every feed that is due, bounded by the global and per-host limit"""
+        now = time.monotonic()
+        if now - self._last_refresh >= self.SCHEDULER_REFRESH:
             try:
-                self.logger.info("[Premium] Scheduling background RSS checks...")
-                for server in premium_server:
-                    self._schedule_dispatch_rss(server, current_time, True)
-                self.logger.info("[Premium] Sleeping...")
-            except asyncio.CancelledError:
-                self.logger.warning("[Premium] Got cancel signal, stopping...")
-
-    @tasks.loop(minutes=5.0, name="showtimes-fansubss-normal")
-    async def _loop_check_basic_rss(self):
-        """A tasks that will check non-premium server"""
-        all_servers = await self.get_all_servers()
-        non_premium_server = list(
-            filter(lambda x: not x.has_premium and not self.is_locked(x.id), all_servers)
-        )
-        current_time = self.bot.now().int_timestamp
-        if len(non_premium_server) > 0:
+                await self._refresh_poll_jobs(now)
+                self._last_refresh = now
+            except Exception as e:
+                self.logger.error("Failed to refresh the FansubRSS jobs", exc_info=e)
+        for job in self._poll_jobs.values():
+            if job.running or job.next_run > now:
+                continue
+            job.running = True
             try:
-                self.logger.info("[Basic] Running background RSS checks...")
-                for server in non_premium_server:
-                    self._schedule_dispatch_rss(server, current_time, False)
-                self.logger.info("[Basic] Sleeping...")
-            except asyncio.CancelledError:
-                self.logger.warning("[Basic] Got cancel signal, stopping...")
-
-    @_loop_check_basic_rss.before_loop
-    @_loop_check_premium_rss.before_loop
+                task: asyncio.Task = self.bot.loop.create_task(
+                    self._poll_feed_job(job), name=f"fansubrss-feed_{job.key[:12]}-{int(now)}"
+                )
+                self._running_tasks.append(task)
+                task.add_done_callback(self._deregister_rss_schedule)
+            except Exception as e:
+                job.running = False
+                self.logger.error(f"Failed to schedule RSS checker for {job.url}", exc_info=e)
+
+    @_loop_rss_scheduler.before_loop
     async def _loop_check_rss_before(self):
         self.logger.info("[FansubRSS] Waiting till bot is ready...")
         await self.bot.wait_until_ready()
+        await self._seen_migrated.wait()
         self.logger.info("[FansubRSS] Bot is now ready!")
 
     @commands.group(name="fansubrss", aliases=["rss", "fsrss"])
@@ -512,6 +625,7 @@ class ShowtimesFansubRSS(commands.Cog):
             helpcmd.add_field(HelpField("fansubrss format", "Format bagaimana RSS akan dikirim"))
             helpcmd.add_field(HelpField("fansubrss terakhir", "Mengambil RSS terakhir"))
             helpcmd.add_field(HelpField("fansubrss premium", "Melihat status FansubRSS premium"))
+            helpcmd.add_field(HelpField("fansubrss statistik", "Melihat statistik pengambilan RSS"))
             helpcmd.add_aliases(["rss", "fsrss"])
             await ctx.send(embed=helpcmd.get())
 
@@ -575,7 +689,7 @@ class ShowtimesFansubRSS(commands.Cog):
         parsed_json.add_feed(FansubRSSFeed.from_dict(GENERATED_FEED))
 
         await self.bot.redisdb.set(f"ntfsrss_{guild_id}", parsed_json.serialize())
-        await self.bot.redisdb.set(f"ntfsrssd_{guild_id}_{registered_hash}", {"fetchedURL": skip_fetch_url})
+        await self.mark_seen(guild_id, registered_hash, skip_fetch_url)
         self.logger.info(f"{guild_id}: FansubRSS is now activated!")
         await ctx.send(
             f"FansubRSS berhasil diaktifkan, silakan atur formatting dengan `{prefix}fansubrss format`"
@@ -624,7 +738,7 @@ class ShowtimesFansubRSS(commands.Cog):
         await self.bot.redisdb.rm(f"ntfsrss_{guild_id}")
         self.logger.info(f"{guild_id}: detaching feeds fetched data...")
         for feed in rss_metadata.feeds:
-            await self.bot.redisdb.rm(f"ntfsrssd_{guild_id}_{feed.id}")
+            await self.bot.redisdb.rm(self._seen_key(guild_id, feed.id))
         self.logger.info(f"{guild_id}: FansubRSS is now deactivated!")
         await ctx.send(
             "Berhasil menonaktifkan, silakan aktifkan kembali via "
@@ -999,11 +1113,7 @@ class ShowtimesFansubRSS(commands.Cog):
                         entries_data = feed_data.entries
                         collect_url = [url["link"] for url in entries_data]
                         self.logger.info(f"{guild_id}: dumping all current entries...")
-                        saved_rss_data = await self.read_rss_feeds(ctx.message.guild.id, rss_metadata["id"])
-                        saved_rss_data.extend(collect_url)
-                        await self.bot.redisdb.set(
-                            f"ntfsrssd_{guild_id}_{selected_rss.id}", {"fetchedURL": saved_rss_data}
-                        )
+                        await self.mark_seen(guild_id, selected_rss.id, collect_url)
                         selected_rss.feed_url = feed_new_url
                         await ctx.send_timed(f"RSS Feed berhasil diubah ke: <{feed_new_url}>", 2)
                     else:
@@ -1074,7 +1184,7 @@ class ShowtimesFansubRSS(commands.Cog):
             return await ctx.send("*Dibatalkan*")
 
         self.logger.info(f"{guild_id}: fetching RSS data...")
-        entries, _ = await self._recursive_check_feeds(selected_rss, [])
+        entries, _ = await self._recursive_check_feeds(selected_rss)
         if entries is None:
             return await ctx.send("Gagal mengambil data dari RSS, mohon coba lagi nanti!")
 
@@ -1114,6 +1224,41 @@ class ShowtimesFansubRSS(commands.Cog):
                 "Silakan donasi di link berikut: <https://naoti.me/donasi>"
             )
 
+    @_showfsrss.command(name="statistik", aliases=["stats"])
+    async def _showfsrss_statistik(self, ctx: naoTimesContext):
+        guild_id = ctx.guild.id
+        rss_metadata = await self.get_server(guild_id)
+        if not rss_metadata:
+            return await ctx.send("FansubRSS tidak diaktifkan di peladen ini.")
+        if len(rss_metadata.feeds) < 1:
+            return await ctx.send("Tidak ada RSS yang terdaftar")
+
+        text_data = ["**Statistik FansubRSS**"]
+        for feed in rss_metadata.feeds:
+            fetch_state = await self.bot.redisdb.get(f"ntfsrssf_{feed_url_key(feed.feed_url)}")
+            stats = (fetch_state or {}).get("stats")
+            text_data.append("")
+            text_data.append(f"<{feed.feed_url}>")
+            if not stats or stats.get("requests", 0) < 1:
+                text_data.append("Belum ada data")
+                continue
+            ratio_304 = stats["notModified"] / stats["requests"] * 100
+            text_data.append(
+                f"Request: {stats['requests']} | 304: {stats['notModified']} ({ratio_304:.2f}%) "
+                f"| Tidak berubah: {stats['unchanged']}"
+            )
+            text_data.append(
+                f"Diterima: {stats['bytesReceived'] / 1024:.2f} KiB | Dihemat: {stats['bytesSaved'] / 1024:.2f} KiB"
+            )
+            parse_stats = fetch_state.get("parseStats")
+            if parse_stats and parse_stats.get("count", 0) > 0:
+                average_parse = parse_stats["total"] / parse_stats["count"] * 1000
+                text_data.append(
+                    f"Parsing: {parse_stats['count']} kali | Rata-rata: {average_parse:.2f}ms "
+                    f"| Maksimal: {parse_stats['max'] * 1000:.2f}ms"
+                )
+        await ctx.send("\n".join(text_data))
+
 
 def setup(bot: naoTimesBot):
     bot.add_cog(ShowtimesFansubRSS(bot))
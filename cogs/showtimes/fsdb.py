@@ -241,9 +241,9 @@ class ShowtimesFansubDB(commands.Cog):
         await ctx.send(embed=embed)
         await message.delete()
 
-        for data in update_queue:
+        update_results = await self.ntdb.update_servers(update_queue)
+        for data, (res, msg) in zip(update_queue, update_results):
             self.logger.info(f"{data.id}: updating main database...")
-            res, msg = await self.ntdb.update_server(data)
             if not res:
                 self.logger.error(f"{data.id}: failed to update main database: {msg}")
                 if data.id not in self.bot.showtimes_resync:
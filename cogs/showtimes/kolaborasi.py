@@ -319,9 +319,9 @@ class ShowtimesKolaborasi(commands.Cog):
         await base_message.delete()
         await ctx.send(embed=embed)
 
-        for srv in update_queue:
+        update_results = await self.ntdb.update_servers(update_queue)
+        for srv, (success, msg) in zip(update_queue, update_results):
             self.logger.info(f"{srv.id}: updating database...")
-            success, msg = await self.ntdb.update_server(srv)
             if not success:
                 self.logger.warning(f"{srv.id}: failed to update, reason: {msg}")
                 if srv.id not in self.bot.showtimes_resync:
@@ -477,8 +477,8 @@ class ShowtimesKolaborasi(commands.Cog):
         await ctx.send(embed=embed)
 
         self.logger.info(f"{server_id}: updating main database...")
-        for update in update_queue:
-            success, msg = await self.ntdb.update_server(update)
+        update_results = await self.ntdb.update_servers(update_queue)
+        for update, (success, msg) in zip(update_queue, update_results):
             if not success:
                 self.logger.warning(f"{server_id}: failed to update, reason: {msg}")
                 if update.id not in self.bot.showtimes_resync:
@@ -29,7 +29,7 @@ class ShowtimesUIBridge(commands.Cog):
         if remote_data is None:
             self.logger.error(f"{sid}:{data}: unknown server, ignoring!")
             return {"message": "Unknown server", "success": 0}
-        await self.bot.redisdb.set(f"showtimes_{remote_data.id}", remote_data.serialize())
+        await self.bot.showqueue.add_job(remote_data)
 
     # pull admin
     @ntsocket("pull admin")
@@ -76,6 +76,7 @@ class ShowtimesUIBridge(commands.Cog):
     @ntsocket("get servers")
     async def on_showtimes_server_request(self, sid: str):
         self.logger.info(f"{sid}: requested all server info")
+        await self.bot.showqueue.flush()
         showtimes_server = await self.bot.redisdb.getall("showtimes_*")
         all_server = []
         for server in showtimes_server:
@@ -279,7 +280,7 @@ class ShowtimesUIBridge(commands.Cog):
     @ntsocket("delete server")
     async def on_delete_server_request(self, sid: str, data: str):
         self.logger.info(f"{sid}: requested server deletion for {data}")
-        await self.bot.redisdb.rm(f"showtimes_{data}")
+        await self.bot.showqueue.remove(data)
         return "ok"
 
     # delete admin (showtimes)
@@ -628,12 +629,12 @@ class ShowtimesUIBridge(commands.Cog):
 
         self.logger.info(f"{sid}: collab accepted, updating all showtimes...")
         for update in full_update:
-            await self.bot.redisdb.set(f"showtimes_{update.id}", update.serialize())
+            await self.bot.showqueue.add_job(update)
 
         self.logger.info(f"{sid}: updating showtimes main database...")
-        for peladen in full_update:
+        update_results = await self.bot.ntdb.update_servers(full_update)
+        for peladen, (success, msg) in zip(full_update, update_results):
             self.logger.info(f"{sid}:{peladen.id}: Updating database...")
-            success, msg = await self.bot.ntdb.update_server(peladen)
             if not success:
                 if peladen.id not in self.bot.showtimes_resync:
                     self.bot.showtimes_resync.append(peladen.id)
@@ -699,12 +700,12 @@ class ShowtimesUIBridge(commands.Cog):
 
         self.logger.info(f"{sid}: storing new data to database...")
         for peladen in update_queue:
-            await self.bot.redisdb.set(f"showtimes_{peladen.id}", peladen.serialize())
+            await self.bot.showqueue.add_job(peladen)
 
         self.logger.info(f"{sid}: updating showtimes main database...")
-        for peladen in update_queue:
+        update_results = await self.bot.ntdb.update_servers(update_queue)
+        for peladen, (success, msg) in zip(update_queue, update_results):
             self.logger.info(f"{sid}:{peladen.id}: Updating database...")
-            success, msg = await self.bot.ntdb.update_server(peladen)
             if not success:
                 if peladen.id not in self.bot.showtimes_resync:
                     self.bot.showtimes_resync.append(peladen.id)
@@ -69,6 +69,7 @@ class ShowtimesOwner(commands.Cog):
                     ),
                     HelpField("ntadmin forcepull", "Update paksa database lokal dengan database remote!"),
                     HelpField("ntadmin showui", "Melihat password untuk akses naoTimesUI"),
+                    HelpField("ntadmin stats", "Melihat statistik cache dan antrian Showtimes"),
                 ]
             )
             helpcmd.add_aliases(["naotimesadmin", "showtimesadmin", "shadmin"])
@@ -108,6 +109,7 @@ class ShowtimesOwner(commands.Cog):
     @_showowner_main.command(name="fetchdb")
     async def _showowner_fetchdb(self, ctx: naoTimesContext):
         self.logger.info("Requested fetching database")
+        await self.bot.showqueue.flush()
         all_ntdb = await self.bot.redisdb.getall("showtimes_*")
         all_admins = await self.bot.redisdb.getall("showadmin_*")
         final_dataset = {
@@ -132,17 +134,16 @@ class ShowtimesOwner(commands.Cog):
             await self.bot.redisdb.set(f"showadmin_{admins['id']}", admins)
         for server in js_data["servers"]:
             self.logger.info(f"saving server {server['id']} data to redis")
-            await self.bot.redisdb.set("showtimes_" + server["id"], server)
+            await self.bot.showqueue.add_job(Showtimes.from_dict(server))
         await ctx.send("Newest database has been pulled and saved to local save")
 
     @_showowner_main.command(name="forcepush")
     async def _showowner_forcepush(self, ctx: naoTimesContext, server_id: int = None):
         self.logger.info("Force pushing local data to main database")
+        await self.bot.showqueue.flush()
         if server_id is None:
             all_ntdb = await self.bot.redisdb.getall("showtimes_*")
-            for data in all_ntdb:
-                show_data = Showtimes.from_dict(data)
-                await self.bot.ntdb.update_server(show_data)
+            await self.bot.ntdb.update_servers([Showtimes.from_dict(data) for data in all_ntdb])
         else:
             ntdb_single = await self.bot.redisdb.get(f"showtimes_{server_id}")
             if ntdb_single is None:
@@ -151,6 +152,28 @@ class ShowtimesOwner(commands.Cog):
             await self.bot.ntdb.update_server(show_data)
         await ctx.send("All done!")
 
+    @_showowner_main.command(name="stats")
+    async def _showowner_stats(self, ctx: naoTimesContext):
+        cache_stats = self.bot.showqueue.cache_stats
+        total_fetch = cache_stats["hits"] + cache_stats["misses"]
+        hit_ratio = cache_stats["hits"] / total_fetch * 100 if total_fetch > 0 else 0.0
+        text_data = ["**Showtimes Cache**"]
+        text_data.append(f"Ukuran: {cache_stats['size']}/{cache_stats['max_size']}")
+        text_data.append(f"Hit: {cache_stats['hits']} ({hit_ratio:.2f}%)")
+        text_data.append(f"Miss: {cache_stats['misses']}")
+        text_data.append(f"Eviction: {cache_stats['evictions']} | Expired: {cache_stats['expired']}")
+        queue_stats = self.bot.showqueue.queue_stats
+        text_data.append("")
+        text_data.append("**Showtimes Queue**")
+        text_data.append(f"Antrian: {queue_stats['depth']}")
+        text_data.append(f"Flush: {queue_stats['flushes']} (gagal {queue_stats['failed']})")
+        text_data.append(f"Tersimpan: {queue_stats['written']} | Digabung: {queue_stats['coalesced']}")
+        text_data.append(
+            f"Latensi: {queue_stats['last_latency'] * 1000:.2f}ms terakhir, "
+            f"{queue_stats['average_latency'] * 1000:.2f}ms rata-rata, {queue_stats['max_latency'] * 1000:.2f}ms maks"
+        )
+        await ctx.send("\n".join(text_data))
+
 
 def setup(bot: naoTimesBot):
     bot.add_cog(ShowtimesOwner(bot))
@@ -235,9 +235,9 @@ class ShowtimesStaff(commands.Cog):
             )
             if matched_anime.fsdb.id is not None:
                 await self.bot.fsdb.update_project(matched_anime.fsdb.id, "status", fsdb_update_to)
-        for all_srv in save_queue:
+        update_results = await self.ntdb.update_servers(save_queue)
+        for all_srv, (res, msg) in zip(save_queue, update_results):
             self.logger.info(f"{all_srv.id}: updating server...")
-            res, msg = await self.ntdb.update_server(all_srv)
             if not res:
                 if all_srv.id not in self.bot.showtimes_resync:
                     self.bot.showtimes_resync.append(all_srv.id)
@@ -456,9 +456,9 @@ class ShowtimesStaff(commands.Cog):
                 f"Berhasil mengubah status garapan {matched_anime.title} - #{active_episode.episode}"
             )
 
-        for peladen in update_queue:
+        update_results = await self.ntdb.update_servers(update_queue)
+        for peladen, (success, msg) in zip(update_queue, update_results):
             self.logger.info(f"{peladen.id}: Updating database...")
-            success, msg = await self.ntdb.update_server(peladen)
             if not success:
                 if peladen.id not in self.bot.showtimes_resync:
                     self.bot.showtimes_resync.append(peladen.id)
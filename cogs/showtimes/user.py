@@ -61,7 +61,7 @@ class ShowtimesUser(commands.Cog):
         """
         server_id = str(ctx.guild.id)
         self.logger.info(f"Requested at: {server_id}")
-        srv_data = await self.queue.fetch_database(server_id)
+        srv_data = await self.queue.fetch_database(server_id, readonly=True)
 
         if srv_data is None:
             return
@@ -90,7 +90,7 @@ class ShowtimesUser(commands.Cog):
         # @app.option("judul", str, autocomplete=True, description="Judul anime yang ingin dilihat")
         server_id = str(ctx.guild.id)
         self.logger.info(f"Requested at: {server_id}")
-        srv_data = await self.queue.fetch_database(server_id)
+        srv_data = await self.queue.fetch_database(server_id, readonly=True)
 
         if srv_data is None:
             return await ctx.send("Peladen tidak terdaftar di Showtimes")
@@ -109,7 +109,7 @@ class ShowtimesUser(commands.Cog):
     async def _showuser_tagih_slash_judul_auto(self, inter: disnake.CommandInteraction, judul: str):
         server_id = str(inter.guild.id)
         self.logger.info(f"Requested at: {server_id}")
-        srv_data = await self.queue.fetch_database(server_id)
+        srv_data = await self.queue.fetch_database(server_id, readonly=True)
         if srv_data is None:
             self.logger.info("Autocompleting without showtimes being resgistered...")
             return ["Peladen tidak terdaftar di Showtimes"]
@@ -125,13 +125,13 @@ class ShowtimesUser(commands.Cog):
             parsed_objects = {project.title: str(project.id) for project in match_unfinished_project}
         else:
             self.logger.info(f"{server_id}: Trying to autocomplete with: {judul}")
-            all_matches = srv_data.find_projects(judul)
-            all_matches.sort(key=lambda x: x.title)
+            # The matches are already ranked from the best match.
+            all_matches = srv_data.find_projects(judul, fuzzy=True)
             parsed_objects = {project.title: str(project.id) for project in all_matches}
         if not parsed_objects:
             return []
 
-        key_sort = sorted(parsed_objects)[:20]
+        key_sort = list(parsed_objects)[:20]
         final_objects: Dict[str, str] = {}
         for key in key_sort:
             final_objects[key] = parsed_objects[key]
@@ -143,7 +143,7 @@ class ShowtimesUser(commands.Cog):
         """Melihatkan siapa yang ngebuat sebuah proyek delay"""
         server_id = str(ctx.guild.id)
         self.logger.info(f"Requested at: {server_id}")
-        srv_data = await self.queue.fetch_database(server_id)
+        srv_data = await self.queue.fetch_database(server_id, readonly=True)
 
         if srv_data is None:
             return
@@ -210,7 +210,7 @@ class ShowtimesUser(commands.Cog):
         """Melihat jadwal untuk garapan yang sedang berlangsung"""
         server_id = str(ctx.guild.id)
         self.logger.info(f"Requested at: {server_id}")
-        srv_data = await self.queue.fetch_database(server_id)
+        srv_data = await self.queue.fetch_database(server_id, readonly=True)
 
         if srv_data is None:
             return
@@ -223,7 +223,7 @@ class ShowtimesUser(commands.Cog):
             return 7 * final_episode.episode * 24 * 60 * 60
 
         simple_queue = asyncio.Queue[Dict[str, Any]]()
-        fetch_jobs = []
+        fetch_ids: List[str] = []
         current_date = self.bot.now().timestamp()
         for anime in srv_data.projects:
             current = anime.get_current()
@@ -239,12 +239,12 @@ class ShowtimesUser(commands.Cog):
             if current_date >= needed_time:
                 self.logger.warning(f"{anime.title}: anime already done, skipping...")
                 continue
-            fetch_jobs.append(self.base.fetch_anilist(anime.id, jadwal_only=True))
+            fetch_ids.append(anime.id)
 
-        self.logger.info(f"{server_id}: running {len(fetch_jobs)} jobs...")
+        self.logger.info(f"{server_id}: fetching {len(fetch_ids)} anime...")
         is_error = False
-        for anime_job in asyncio.as_completed(fetch_jobs):
-            anilist_data = await anime_job
+        all_anilist_data = await self.base.fetch_anilist_batch(fetch_ids, jadwal_only=True)
+        for anilist_data in all_anilist_data.values():
             if isinstance(anilist_data, str):
                 is_error = True
                 continue
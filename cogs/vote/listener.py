@@ -25,13 +25,15 @@ SOFTWARE.
 import asyncio
 import logging
 from enum import Enum
-from typing import List, NamedTuple, Union
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Union
 
 import arrow
 import disnake
-from disnake.ext import commands, tasks
+from aiolimiter import AsyncLimiter
+from disnake.ext import commands
 
 from naotimes.bot import naoTimesBot
+from naotimes.scheduler import ScheduledTimer
 from naotimes.socket import ntevent
 
 reactions_num = ["1⃣", "2⃣", "3⃣", "4⃣", "5⃣", "6⃣", "7⃣", "8⃣", "9⃣", "🔟"]
@@ -58,14 +60,22 @@ class VoteType(Enum):
 
 
 class VoteManager:
+    __slots__ = ("id", "name", "emote", "limit", "_voter")
+
     def __init__(
-        self, id: Union[str, int], name: Union[str, int], emote: str, limit: int = 0, voter: List[int] = []
+        self,
+        id: Union[str, int],
+        name: Union[str, int],
+        emote: str,
+        limit: int = 0,
+        voter: Optional[Iterable[int]] = None,
     ):
         self.id = id
         self.name = name
         self.emote = emote
         self.limit = limit
-        self._voter = voter
+        self._voter: Set[int] = set()
+        self.voter = voter or []
 
     def __eq__(self, other: Union[str, int, "VoteManager"]) -> bool:
         if isinstance(other, str) and isinstance(self.id, str):
@@ -79,52 +89,57 @@ class VoteManager:
     def __len__(self):
         return len(self._voter)
 
+    def __contains__(self, user: int):
+        return user in self._voter
+
     def __repr__(self):
         __context = [
             f"id={self.id!r}",
             f"name={self.name!r}",
             f"emote={self.emote!r}",
             f"limit={self.limit!r}",
-            f"voter={self._voter!r}",
+            f"tally={len(self._voter)!r}",
         ]
         return f"<VoteManager {' '.join(__context)}>"
 
     @property
     def voter(self) -> List[int]:
-        return self._voter
+        return list(self._voter)
 
     @voter.setter
-    def voter(self, new_voter: List[int]) -> List[int]:
-        real_int_voter = []
-        for voter in new_voter:
-            if isinstance(voter, int):
-                real_int_voter.append(voter)
-        self._voter = real_int_voter
+    def voter(self, new_voter: Iterable[int]):
+        self._voter = {voter for voter in new_voter if isinstance(voter, int)}
 
     @property
     def tally(self) -> int:
         return len(self._voter)
 
-    def add_vote(self, user: int):
-        if user not in self._voter:
-            self._voter.append(user)
-
-    def remove_vote(self, user: int):
+    def add_vote(self, user: int) -> bool:
         if user in self._voter:
-            self._voter.remove(user)
+            return False
+        self._voter.add(user)
+        return True
+
+    def remove_vote(self, user: int) -> bool:
+        if user not in self._voter:
+            return False
+        self._voter.discard(user)
+        return True
 
     @classmethod
     def from_dict(cls, data: dict):
-        return cls(data["id"], data["name"], data["emote"], data["limit"], data["voter"])
+        return cls(data["id"], data["name"], data["emote"], data["limit"], data.get("voter") or [])
 
-    def serialize(self):
-        return {
+    def serialize(self, include_voter: bool = True):
+        serialized = {
             "id": self.id,
             "name": self.name,
             "emote": self.emote,
             "limit": self.limit,
-            "voter": self._voter,
         }
+        if include_voter:
+            serialized["voter"] = self.voter
+        return serialized
 
 
 class VoteResult(NamedTuple):
@@ -257,39 +272,38 @@ class VoteData:
 
     def has_voted(self, user: int) -> bool:
         for choice in self._choices:
-            if user in choice.voter:
+            if user in choice:
                 return True
         return False
 
-    def add_vote(self, vote_info: UserVote):
-        if self._meta.is_author(vote_info.uuid):
-            return
-        if self.has_voted(vote_info.uuid):
-            return
+    def _get_user_choice(self, vote_info: UserVote) -> Optional[VoteManager]:
         if self.type == VoteType.YESNO or self.type == VoteType.USER:
             if vote_info.choice == "y":
-                self._choices[0].add_vote(vote_info.uuid)
+                return self._choices[0]
             elif vote_info.choice == "n":
-                self._choices[1].add_vote(vote_info.uuid)
-        else:
-            exist_choice = self.get_vote(vote_info.choice)
-            if exist_choice is not None:
-                exist_choice.add_vote(vote_info.uuid)
-                self.update_vote(exist_choice)
+                return self._choices[1]
+            return None
+        return self.get_vote(vote_info.choice)
 
-    def remove_vote(self, vote_info: UserVote):
+    def add_vote(self, vote_info: UserVote) -> Optional[VoteManager]:
+        """Add the user vote, returns the choice that got changed if there's any."""
         if self._meta.is_author(vote_info.uuid):
-            return
-        if self.type == VoteType.YESNO or self.type == VoteType.USER:
-            if vote_info.choice == "y":
-                self._choices[0].remove_vote(vote_info.uuid)
-            elif vote_info.choice == "n":
-                self._choices[1].remove_vote(vote_info.uuid)
-        else:
-            exist_choice = self.get_vote(vote_info.choice)
-            if exist_choice is not None:
-                exist_choice.remove_vote(vote_info.uuid)
-                self.update_vote(exist_choice)
+            return None
+        if self.has_voted(vote_info.uuid):
+            return None
+        exist_choice = self._get_user_choice(vote_info)
+        if exist_choice is not None and exist_choice.add_vote(vote_info.uuid):
+            return exist_choice
+        return None
+
+    def remove_vote(self, vote_info: UserVote) -> Optional[VoteManager]:
+        """Remove the user vote, returns the choice that got changed if there's any."""
+        if self._meta.is_author(vote_info.uuid):
+            return None
+        exist_choice = self._get_user_choice(vote_info)
+        if exist_choice is not None and exist_choice.remove_vote(vote_info.uuid):
+            return exist_choice
+        return None
 
     def get_winner(self):
         if self._mode == VoteType.GIVEAWAY:
@@ -325,11 +339,11 @@ class VoteData:
         mode_meta = VoteType(data["type"])
         return cls(metadata, choices, data["timeout"], mode_meta)
 
-    def serialize(self):
+    def serialize(self, include_voter: bool = True):
         metadata = self._meta.serialize()
         all_choices = []
         for choice in self._choices:
-            all_choices.append(choice.serialize())
+            all_choices.append(choice.serialize(include_voter))
         return {
             "metadata": metadata,
             "choices": all_choices,
@@ -342,61 +356,113 @@ class VoteListener(commands.Cog):
     """The main loop for listening to vote data!"""
 
     PRE_KEY = "ntvotev2_"
+    VOTER_KEY = "ntvotevs_"
+    # How long to wait for more reactions before applying them together
+    BATCH_WINDOW = 0.5
+    TIMER_KIND = "vote"
+    # Startup reconciliation, the amount of vote reconciled at the same time
+    # and the rate of the Discord request shared by all of them.
+    RECONCILE_WORKERS = 4
+    RECONCILE_RATE = 10
+    REACTION_PAGE_SIZE = 100
 
     def __init__(self, bot: naoTimesBot):
         self.bot = bot
         self.logger = logging.getLogger("VoteSystem.ListenerV2")
         self._client = bot.redisdb
-        self._is_ready = False
 
         self._is_unloding = False
 
-        self._lock = asyncio.Lock()
-        self._vote_queue = asyncio.Queue[UserVote](loop=self.bot.loop)
+        self._active_votes: Dict[int, VoteData] = {}
+        self._vote_queue = asyncio.Queue[UserVote]()
         self._vote_task = asyncio.Task(self._handle_new_vote())
-        self._cached_vote_message: List[int] = []
-        self._handle_existing_vote.start()
+        self._reconciling: Dict[int, List[UserVote]] = {}
+        self._reconcile_sema = asyncio.Semaphore(self.RECONCILE_WORKERS)
+        self._reconcile_limiter = AsyncLimiter(self.RECONCILE_RATE, 1)
         self._temp_task = self.bot.loop.create_task(
             self._on_cog_loaded(), name="preload-vote-data-on-cog-load"
         )
+        self.bot.scheduler.register(self.TIMER_KIND, self._on_vote_timeout)
 
     def cog_unload(self):
         self._is_unloding = True
         self._vote_task.cancel()
-        self._handle_existing_vote.cancel()
         self._temp_task.cancel()
-
-    async def _get_vote_data(self, message: int):
-        """Get the vote information from redis"""
-        vote_data = await self._client.get(f"{self.PRE_KEY}{message}")
-        if vote_data is None:
-            return None
-        return VoteData.from_dict(vote_data)
+        self.bot.scheduler.unregister(self.TIMER_KIND)
+
+    def _voter_key(self, vote_data: VoteData, choice: VoteManager) -> str:
+        return f"{self.VOTER_KEY}{vote_data.id}_{choice.id}"
+
+    async def _load_vote_data(self, raw_data: dict) -> VoteData:
+        """Load the vote data, the voter is stored separately as a set per choice."""
+        vote_data = VoteData.from_dict(raw_data)
+        if raw_data.get("voterStore") != "set":
+            # Old format or a newly created vote, move the voter list to the set.
+            await self._save_vote_data(vote_data)
+            return vote_data
+        voter_keys = [self._voter_key(vote_data, choice) for choice in vote_data.choices]
+        all_voters = await self._client.smembers_many(voter_keys)
+        for choice, voters in zip(vote_data.choices, all_voters):
+            choice.voter = [int(voter) for voter in voters]
+        return vote_data
 
     async def _get_all_votes(self):
-        vote_data = await self._client.getall(f"{self.PRE_KEY}*")
         real_vote: List[VoteData] = []
-        for vote in vote_data:
-            real_vote.append(VoteData.from_dict(vote))
+        async for _, vote in self._client.iterscan(f"{self.PRE_KEY}*"):
+            real_vote.append(await self._load_vote_data(vote))
         return real_vote
 
     @ntevent()
     async def on_vote_creation(self, vote: VoteData):
-        self._cached_vote_message.append(vote.id)
+        await self._save_vote_data(vote)
+        await self._activate_vote(vote)
+
+    async def _activate_vote(self, vote_data: VoteData):
+        self._active_votes[vote_data.id] = vote_data
+        # VoteData.is_timeout() only return True after the timeout has passed
+        deadline = vote_data.timeout + 1
+        timer = self.bot.scheduler.get(self.TIMER_KIND, vote_data.id)
+        if timer is None or timer.due != deadline:
+            await self.bot.scheduler.schedule(self.TIMER_KIND, vote_data.id, deadline)
 
     async def _save_vote_data(self, vote_data: VoteData):
-        """Save the vote data to redis"""
+        """Save the vote data to redis, replacing all of the voter set"""
         mid = vote_data.metadata.message
-        await self._client.set(f"{self.PRE_KEY}{mid}", vote_data.serialize())
+        voters = {self._voter_key(vote_data, choice): choice.voter for choice in vote_data.choices}
+        await self._client.supdate(voters, replace=True)
+        await self._client.set(
+            f"{self.PRE_KEY}{mid}", {**vote_data.serialize(include_voter=False), "voterStore": "set"}
+        )
 
     async def _delete_vote_data(self, vote_data: VoteData):
         """Delete the vote data from redis"""
         mid = vote_data.metadata.message
-        await self._client.rm(f"{self.PRE_KEY}{mid}")
-        try:
-            self._cached_vote_message.remove(vote_data.id)
-        except (ValueError, KeyError, AttributeError, IndexError):
-            pass
+        voter_keys = [self._voter_key(vote_data, choice) for choice in vote_data.choices]
+        await self._client.rmmany([f"{self.PRE_KEY}{mid}", *voter_keys])
+        self._active_votes.pop(vote_data.id, None)
+        await self.bot.scheduler.cancel(self.TIMER_KIND, vote_data.id)
+
+    async def _finish_vote(self, vote_data: VoteData):
+        if self._active_votes.get(vote_data.id) is not vote_data:
+            # Already finished by the other task
+            return
+        self.logger.info(f"Vote {vote_data.id} is over!")
+        await self._delete_vote_data(vote_data)
+        self.bot.ntevent.dispatch("vote finished", vote_data)
+
+    async def _collect_voters(self, reaction: disnake.Reaction, ignored_users: Set[int]) -> Set[int]:
+        """Stream the users of a reaction page by page, instead of collecting all of the members first."""
+        voters: Set[int] = set()
+        fetched = 0
+        async for user in reaction.users():
+            fetched += 1
+            if fetched % self.REACTION_PAGE_SIZE == 0:
+                # The next page will be requested after this one, share the rate with the other workers.
+                await self._reconcile_limiter.acquire()
+            if user.bot or user.id in ignored_users:
+                continue
+            voters.add(user.id)
+        return voters
 
     async def _tally_up_missing(self, vote_meta: VoteData):
         """Tally up the votes that are missing"""
@@ -407,177 +473,136 @@ class VoteListener(commands.Cog):
         if channel_data is None:
             return None
         self.logger.info(f"Fetching message: {message_id} at #{channel_data}")
+        await self._reconcile_limiter.acquire()
         try:
             message = await channel_data.fetch_message(message_id)
         except disnake.NotFound:
             return None
 
-        the_reactions = message.reactions
+        the_reactions: Dict[str, disnake.Reaction] = {}
+        for react in message.reactions:
+            if not react.is_custom_emoji():
+                the_reactions[str(react.emoji)] = react
 
-        IGNORED_AUTHOR = [
+        IGNORED_AUTHOR = {
             metadata.author,
             self.bot.user.id,
-        ]
+        }
 
-        new_votes = []
-        self.logger.info("Trying to accumulate reaction while bot is gone!")
-        if vote_meta.type == VoteType.YESNO or vote_meta.type == VoteType.USER:
-            self.logger.info("Detected y/n type or user type")
-            choice_yes = vote_meta.choices[0]
-            choice_no = vote_meta.choices[1]
-            yes_emote = choice_yes.emote
-            no_emote = choice_no.emote
-
-            yes_react = None
-            no_react = None
-            for react in the_reactions:
-                if react.emoji == yes_emote:
-                    yes_react = react
-                elif react.emoji == no_emote:
-                    no_react = react
-
-            if yes_react is not None:
-                voter_yes = await yes_react.users().flatten()
-                complete_voter = []
-                for voter in voter_yes:
-                    if voter.id not in IGNORED_AUTHOR and not voter.bot:
-                        complete_voter.append(voter.id)
-                choice_yes.voter = complete_voter
-            if no_react is not None:
-                voter_no = await no_react.users().flatten()
-                complete_voter = []
-                for voter in voter_no:
-                    if voter.id not in IGNORED_AUTHOR and not voter.bot:
-                        complete_voter.append(voter.id)
-                choice_no.voter = complete_voter
-            new_votes.append(choice_yes)
-            new_votes.append(choice_no)
-        elif vote_meta.type == VoteType.GIVEAWAY:
-            choice_popper = vote_meta.choices[0]
-            popper_emote = choice_popper.emote
-            self.logger.info("Detected giveaway type, collecting popper 🎉 emote!")
-            popper_react = None
-            for react in the_reactions:
-                if react.emoji == popper_emote:
-                    popper_react = react
-
-            if popper_react is not None:
-                voter_give = await popper_react.users().flatten()
-                complete_voter = []
-                for voter in voter_give:
-                    if voter.id not in IGNORED_AUTHOR and not voter.bot:
-                        complete_voter.append(voter.id)
-                choice_popper.voter = complete_voter
-            new_votes.append(choice_popper)
-        else:
-            self.logger.info("Detected multi type, ignoring")
-            reparsed_reaction: List[disnake.Reaction] = []
-            ALL_VALID_REACTION = [vote.emote for vote in vote_meta.choices]
-            for react in the_reactions:
-                if react.emoji in ALL_VALID_REACTION:
-                    reparsed_reaction.append(react)
-            all_reaction = [react.emoji for react in reparsed_reaction]
-            concat_this_data = []
-            for choice in vote_meta.choices:
-                if choice.emote not in all_reaction:
-                    concat_this_data.append(VoteManager(choice.id, choice.name, choice.emote, voter=[]))
-
-            reparsed_count = vote_meta.choices[:]
-            for react in reparsed_reaction:
-                voter_user = await react.users().flatten()
-                complete_voter = []
-                for voter in voter_user:
-                    if voter.id not in IGNORED_AUTHOR and not voter.bot:
-                        complete_voter.append(voter.id)
-                react_pos = res2num[str(react.emoji)]
-                react_data = reparsed_count[react_pos]
-                reparsed_count[react_pos] = VoteManager(
-                    react_data.id, react_data.name, react_data.emote, voter=complete_voter
-                )
-            reparsed_count.extend(concat_this_data)
-            reparsed_count.sort(key=lambda x: x.id)
-            new_votes.extend(reparsed_count)
-
-        vote_meta.choices = new_votes
+        self.logger.info(f"{message_id}: Trying to accumulate {vote_meta.type} reaction while bot is gone!")
+        for choice in vote_meta.choices:
+            react = the_reactions.get(choice.emote)
+            if react is None:
+                choice.voter = []
+                continue
+            await self._reconcile_limiter.acquire()
+            choice.voter = await self._collect_voters(react, IGNORED_AUTHOR)
         return vote_meta
 
+    async def _reconcile_vote(self, vote: VoteData):
+        async with self._reconcile_sema:
+            try:
+                new_vote = await self._tally_up_missing(vote)
+            except Exception:
+                self.logger.exception(f"Failed to tally up vote {vote.id}, ignoring...")
+                new_vote = None
+            if new_vote is None:
+                self.logger.warning(f"Vote {vote.id} cannot be tallied up, using the saved data...")
+                # Still activate it so it will be finished and cleaned up when it's over.
+                new_vote = vote
+            else:
+                await self._save_vote_data(new_vote)
+
+        await self._activate_vote(new_vote)
+        # Apply the reaction that came in while the vote is being reconciled.
+        for user_vote in self._reconciling.pop(vote.id, []):
+            self._vote_queue.put_nowait(user_vote)
+        if new_vote.is_done():
+            self.logger.info(f"Vote {vote.id} is done, collecting missing reaction and dispatching event...")
+            await self._finish_vote(new_vote)
+        else:
+            self.logger.info(f"Vote {vote.id} is ready!")
+
     async def _on_cog_loaded(self):
         await self.bot.wait_until_ready()
         self.logger.info("Prechecking existing vote...")
         currently_running_votes = await self._get_all_votes()
         for vote in currently_running_votes:
-            try:
-                new_vote = await self._tally_up_missing(vote)
-            except Exception:
-                self.logger.exception("Failed to tally up vote, ignoring...")
+            self._reconciling.setdefault(vote.id, [])
+        await asyncio.gather(*[self._reconcile_vote(vote) for vote in currently_running_votes])
+        self.logger.info("Precheck done, listener is now ready!")
+
+    async def _apply_vote_batch(self, batch: List[UserVote]):
+        """Apply a batch of reaction to the active votes, and persist the changes
+        as a single transaction of ``SADD``/``SREM`` per choice."""
+        changes: Dict[str, Dict[int, bool]] = {}
+        touched_votes: Dict[int, VoteData] = {}
+        for user_vote in batch:
+            vote_data = self._active_votes.get(user_vote.id)
+            if vote_data is None:
                 continue
-            if new_vote is None:
-                self.logger.warning(f"Vote {vote.id} message went missing!? ignoring...")
+            if user_vote.removed:
+                changed_choice = vote_data.remove_vote(user_vote)
+            else:
+                changed_choice = vote_data.add_vote(user_vote)
+            if changed_choice is None:
                 continue
-            if new_vote.is_done():
-                self.logger.info(
-                    f"Vote {vote.id} is done, collecting missing reaction and dispatching event..."
-                )
-                await self._delete_vote_data(new_vote)
-                self.bot.ntevent.dispatch("vote finished", new_vote)
+            voter_key = self._voter_key(vote_data, changed_choice)
+            changes.setdefault(voter_key, {})[user_vote.uuid] = not user_vote.removed
+            touched_votes[vote_data.id] = vote_data
+
+        if not changes:
+            return
+        added = {key: [user for user, is_add in users.items() if is_add] for key, users in changes.items()}
+        removed = {key: [user for user, is_add in users.items() if not is_add] for key, users in changes.items()}
+        self.logger.debug(f"Applying {len(batch)} reaction to {len(touched_votes)} vote(s)")
+        await self._client.supdate(added, removed)
+        for vote_data in touched_votes.values():
+            if vote_data.is_done():
+                await self._finish_vote(vote_data)
             else:
-                await self._save_vote_data(new_vote)
-                self._cached_vote_message.append(new_vote.id)
-        self.logger.info("Precheck done, listener is now ready!")
-        self._is_ready = True
+                # Dispatch event to update embed :peepoSmile:
+                self.bot.ntevent.dispatch("vote updated", vote_data)
 
     async def _handle_new_vote(self):
         while True:
             try:
-                new_vote = await self._vote_queue.get()
-                self.logger.debug(f"Got new vote: {new_vote}")
-                vote_data = await self._get_vote_data(new_vote.id)
-                if vote_data is not None:
-                    self.logger.debug(f"Found vote data, updating with {new_vote.uuid}...")
-                    if new_vote.removed:
-                        vote_data.remove_vote(new_vote)
-                    else:
-                        vote_data.add_vote(new_vote)
-                    if vote_data.is_done():
-                        self.logger.debug(f"Vote {new_vote.id} is done, dispatching event...")
-                        await self._delete_vote_data(vote_data)
-                        self.bot.ntevent.dispatch("vote finished", vote_data)
-                    else:
-                        self.logger.debug(f"Vote {new_vote.id} is not done, saving...")
-                        await self._save_vote_data(vote_data)
-                        # Dispatch event to update embed :peepoSmile:
-                        self.bot.ntevent.dispatch("vote updated", vote_data)
-                self._vote_queue.task_done()
+                batch = [await self._vote_queue.get()]
+                # Wait a bit so a burst of reaction is applied and saved together.
+                await asyncio.sleep(self.BATCH_WINDOW)
+                while True:
+                    try:
+                        batch.append(self._vote_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                try:
+                    await self._apply_vote_batch(batch)
+                except Exception as e:
+                    self.logger.error(f"Failed to apply {len(batch)} reaction", exc_info=e)
+                for _ in batch:
+                    self._vote_queue.task_done()
             except asyncio.CancelledError:
                 break
 
-    @tasks.loop(seconds=5)
-    async def _handle_existing_vote(self):
-        if not self._is_ready:
-            self.logger.warning("Sleeping for another 5 seconds because it's not ready yet...")
+    async def _on_vote_timeout(self, timer: ScheduledTimer):
+        vote_data = self._active_votes.get(int(timer.id))
+        if vote_data is None:
+            # Not loaded yet, the reconciliation will finish it.
             return
-        if self._is_unloding:
+        await self._finish_vote(vote_data)
+
+    async def _queue_vote(self, user_vote: UserVote):
+        pending_votes = self._reconciling.get(user_vote.id)
+        if pending_votes is not None:
+            pending_votes.append(user_vote)
             return
-        try:
-            async with self._lock:
-                all_votes = await self._get_all_votes()
-                for vote in all_votes:
-                    if vote.is_done():
-                        self.logger.warning(f"Vote {vote.metadata.message} is over!")
-                        await self._delete_vote_data(vote)
-                        self.bot.ntevent.dispatch("vote finished", vote)
-        except asyncio.CancelledError:
-            self.logger.warning("Got cancel signal, stopping process...")
-
-    @_handle_existing_vote.before_loop
-    async def _before_every_task(self):
-        await self.bot.wait_until_ready()
+        await self._vote_queue.put(user_vote)
 
     @commands.Cog.listener("on_reaction_add")
     async def _listen_new_vote(self, reaction: disnake.Reaction, member: disnake.Member):
         if member.bot:
             return
-        if reaction.message.id not in self._cached_vote_message:
+        if reaction.message.id not in self._active_votes and reaction.message.id not in self._reconciling:
             return
         if reaction.is_custom_emoji():
             return
@@ -585,22 +610,22 @@ class VoteListener(commands.Cog):
         if emostr in reactions_num:
             npos = res2num[emostr]
             user_vote = UserVote(reaction.message.id, member.id, f"mul_{npos}")
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
         elif emostr == "✅":
             user_vote = UserVote(reaction.message.id, member.id, "y")
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
         elif emostr == "❌":
             user_vote = UserVote(reaction.message.id, member.id, "n")
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
         elif emostr == "🎉":
             user_vote = UserVote(reaction.message.id, member.id, "giveaway")
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
 
     @commands.Cog.listener("on_reaction_remove")
     async def _listen_remove_vote(self, reaction: disnake.Reaction, member: disnake.Member):
         if member.bot:
             return
-        if reaction.message.id not in self._cached_vote_message:
+        if reaction.message.id not in self._active_votes and reaction.message.id not in self._reconciling:
             return
         if reaction.is_custom_emoji():
             return
@@ -608,16 +633,16 @@ class VoteListener(commands.Cog):
         if emostr in reactions_num:
             npos = res2num[emostr]
             user_vote = UserVote(reaction.message.id, member.id, f"mul_{npos}", True)
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
         elif emostr == "✅":
             user_vote = UserVote(reaction.message.id, member.id, "y", True)
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
         elif emostr == "❌":
             user_vote = UserVote(reaction.message.id, member.id, "n", True)
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
         elif emostr == "🎉":
             user_vote = UserVote(reaction.message.id, member.id, "giveaway", True)
-            await self._vote_queue.put(user_vote)
+            await self._queue_vote(user_vote)
 
 
 def setup(bot: naoTimesBot):
@@ -20,10 +20,12 @@ from .converters import *
 from .helpgenerator import *
 from .kalkuajaib import *
 from .log import *
+from .matcher import *
 from .modlog import *
 from .paginator import *
 from .placeholder import *
 from .redis import *
+from .scheduler import *
 from .sentry import *
 from .socket import *
 from .t import *
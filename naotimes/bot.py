@@ -66,6 +66,7 @@ from .http import (
     AutentikasiKBBI,
     CrowbarClient,
     GraphQLClient,
+    HTTPClientPool,
     JishoAPI,
     MerriamWebsterClient,
     VNDBSockIOManager,
@@ -73,10 +74,11 @@ from .http import (
 )
 from .http.server import Route as RouteDef
 from .http.server import naoTimesHTTPServer
-from .modlog import ModLog, ModLogFeature, ModLogSetting
+from .modlog import ModLog, ModLogDispatcher, ModLogFeature, ModLogSetting
 from .music import GeniusAPI, naoTimesPlayer
 from .placeholder import PlaceHolderCommand
 from .redis import RedisBridge
+from .scheduler import TimerScheduler
 from .sentry import SentryConfig, setup_sentry
 from .showtimes import FansubDBBridge, ShowtimesCogsBases, ShowtimesQueue, naoTimesDB
 from .socket import EventManager, SocketEvent, SocketServer
@@ -97,11 +99,6 @@ class StartupError(Exception):
         self.exception = base
 
 
-class ModLogQueue(T.NamedTuple):
-    log: ModLog
-    setting: ModLogSetting
-
-
 @dataclass
 class BotMaintenance:
     start: arrow.Arrow
@@ -160,6 +157,7 @@ class naoTimesBot(commands.Bot):
         self.vndb_socket: VNDBSockIOManager = None
         self.kbbi: KBBI = None
         self.redisdb: RedisBridge = None
+        self.scheduler: TimerScheduler = None
         self.jisho: JishoAPI = None
         self.tesaurus: TesaurusAsync = None
         self.merriam: MerriamWebsterClient = None
@@ -168,6 +166,7 @@ class naoTimesBot(commands.Bot):
         self.crowbar: CrowbarClient = None
         self.wolfram: WolframAPI = None
         self.aiosession: aiohttp.ClientSession = None
+        self.http_pool: HTTPClientPool = None
         self.ntevent: EventManager = None
         self.ntplayer: naoTimesPlayer = None
         self.genius: GeniusAPI = None
@@ -178,6 +177,7 @@ class naoTimesBot(commands.Bot):
         self.showtimes_resync: T.List[str] = []
         self._copy_of_commands: T.Dict[str, commands.Command] = {}
         self._modlog_server: T.Dict[str, ModLogSetting] = {}
+        self._modlog_dispatcher = ModLogDispatcher(self, on_error=lambda e: self.echo_error(e, True))
         self._use_sentry: bool = False
 
         self._start_time: arrow.Arrow = None
@@ -579,6 +579,9 @@ class naoTimesBot(commands.Bot):
             self.logger.error("Failed to connect to RedisDB, aborting...")
             raise StartupError(ce)
         self.redisdb = redis_conn
+        self.logger.info("Starting timer scheduler...")
+        self.scheduler = TimerScheduler(self.redisdb)
+        await self.scheduler.start()
 
         self.logger.info("Fetching all server prefixes data...")
         srv_prefixes = await self.redisdb.getalldict("ntprefix_*")
@@ -714,7 +717,7 @@ class naoTimesBot(commands.Bot):
         self.logger.info("Binding ShowtimesQueue...")
         self.showqueue = ShowtimesQueue(self.redisdb)
         self.logger.info("Binding AnilistBucket...")
-        self.anibucket = AnilistBucket(self.aiosession)
+        self.anibucket = AnilistBucket(self.aiosession, redis=self.redisdb)
         self.logger.info("Binding Showtimes Base Cogs stuff")
         self.showcogs = ShowtimesCogsBases(self.anibucket)
         self.logger.info("Binding ihateani.me API")
@@ -731,13 +734,13 @@ class naoTimesBot(commands.Bot):
         # self._resolver = aiohttp.AsyncResolver()
         # self._connector = aiohttp.TCPConnector(resolver=self._resolver, family=AF_INET)
         # self.http.connector = self._connector
-        self.aiosession = aiohttp.ClientSession(
-            headers={
-                "User-Agent": f"naoTimes/v{version_info.shorthand} (https://github.com/naoTimesdev/naoTimes)"
-            },
+        self.http_pool = HTTPClientPool(
+            user_agent=f"naoTimes/v{version_info.shorthand} (https://github.com/naoTimesdev/naoTimes)",
             loop=self.loop,
-            # connector=self._connector,
         )
+        self.http_pool.set_as_default()
+        self._connector = self.http_pool.connector
+        self.aiosession = self.http_pool.session("naotimes")
 
         await self.initialize()
         await super().login(*args, **kwargs)
@@ -756,11 +759,20 @@ class naoTimesBot(commands.Bot):
             with suppress(Exception):
                 self.remove_cog(cog)
 
+        self.logger.info("Flushing the modlog dispatcher...")
+        await self._modlog_dispatcher.close()
+
         await super().close()
 
+        if self.scheduler:
+            self.logger.info("Stopping timer scheduler...")
+            await self.scheduler.close()
         if self.showqueue:
             self.logger.info("Closing the ShowtimesQueue...")
             await self.showqueue.shutdown()
+        if self.ntdb:
+            self.logger.info("Flushing naoTimesDB sync engine...")
+            await self.ntdb.close()
         if self.fsdb:
             self.logger.info("Closing FansubDB connection...")
             await self.fsdb.close()
@@ -808,11 +820,12 @@ class naoTimesBot(commands.Bot):
         self.logger.info("Closing HTTP server...")
         await self.__http_server.close()
 
-        if self.aiosession:
+        if self.http_pool:
+            self.logger.info("Closing HTTP client pool...")
+            await self.http_pool.close()
+        elif self.aiosession:
             self.logger.info("Closing aiohttp Session...")
             await self.aiosession.close()
-        if self._connector:
-            await self._connector.close()
         if self._resolver:
             await self._resolver.close()
 
@@ -1194,48 +1207,7 @@ class naoTimesBot(commands.Bot):
             else:
                 return None, res
 
-    async def _dispatch_modlog_internal(self, modlog: ModLogQueue, channel_id: int):
-        """|coro|
-
-        Internal dispatcher for modlog
-        """
-        try:
-            the_channel = self.get_channel(channel_id)
-            if the_channel is not None:
-                try:
-                    await self.send_modlog(modlog.log, the_channel)
-                except Exception as e:
-                    error_msg = "An error occured while trying to send modlog for "
-                    error_msg += f"guild {modlog.setting.guild}\n"
-                    error_msg += f"Modlog event: {modlog.log.action.name}"
-                    self.logger.error(error_msg)
-                    self.echo_error(e, True)
-        except asyncio.CancelledError:
-            self.logger.warning(f"Task {modlog} got cancelled")
-
     # Modlog stuff
-    async def send_modlog(self, modlog: ModLog, channel: disnake.TextChannel = None):
-        if channel is None:
-            return
-        if modlog.embed is not None:
-            embed = modlog.embed
-            if modlog.timestamp is None:
-                modlog.timestamp = None
-            if embed.colour == disnake.Embed.Empty:
-                embed.colour = disnake.Color.random()
-            if embed.timestamp == disnake.Embed.Empty:
-                datedata: arrow.Arrow = arrow.get(modlog.timestamp)
-                embed.timestamp = datedata.datetime
-            modlog.embed = embed
-
-        real_message = modlog.message
-        if not real_message:
-            real_message = None
-        if real_message is None and modlog.embed is None:
-            self.logger.warning(f"Got empty modlog data? {modlog} ({channel})")
-            return
-        await channel.send(content=real_message, embed=modlog.embed)
-
     def should_modlog(
         self,
         context: ContextModlog,
@@ -1290,16 +1262,9 @@ class naoTimesBot(commands.Bot):
         if modlog.timestamp is None:
             modlog.timestamp = ctime
 
-        queue = ModLogQueue(modlog, setting)
-        self.loop.create_task(
-            self._dispatch_modlog_internal(queue, setting.channel),
-            name=f"modlog-dispatcher-internal-event-{modlog.action.name}_{ctime}",
-        )
+        self._modlog_dispatcher.put(modlog, setting.channel, setting.guild)
         if setting.is_public_features(modlog.action):
-            self.loop.create_task(
-                self._dispatch_modlog_internal(queue, setting.public_channel),
-                name=f"modlog-dispatcher-public-event-{modlog.action.name}_{ctime}",
-            )
+            self._modlog_dispatcher.put(modlog, setting.public_channel, setting.guild)
 
     def has_modlog(self, guild_id: int) -> bool:
         """Check if guild have modlog enabled or not
@@ -307,7 +307,7 @@ class ShowtimesConverter(commands.Converter[List[ShowtimesProject]]):
         guild = ctx.guild
         if guild is None:
             return None
-        fetch_sh = await _bot.showqueue.fetch_database(guild.id)
+        fetch_sh = await _bot.showqueue.fetch_database(guild.id, readonly=True)
         if fetch_sh is None:
             return None
 
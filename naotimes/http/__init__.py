@@ -13,6 +13,7 @@ from .gql import *
 from .jisho import *
 from .kateglo import *
 from .kbbiasync import *
+from .pool import *
 from .server import *
 from .vndbsocket import *
 from .webster import *
@@ -26,28 +26,77 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from hashlib import sha1
 from math import ceil
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import aiohttp
+import orjson
 from aiolimiter import AsyncLimiter
 
-from ..utils import complex_walk
+from ..utils import AttributeDict, complex_walk
 from .gql import GraphQLClient, GraphQLResult
 
+if TYPE_CHECKING:
+    from ..redis import RedisBridge
+
 __all__ = ("AnilistBucket",)
 
+BATCH_MEDIA_QUERY = """
+query ($ids: [Int], $perPage: Int) {
+    Page(page: 1, perPage: $perPage) {
+        media(id_in: $ids, type: %s) {
+            %s
+        }
+    }
+}
+"""
+_QUERY_ROOT = re.compile(r"{\s*(?:\w+\s*:\s*)?(\w+)")
+_WHITESPACES = re.compile(r"\s+")
+
 
 class AnilistBucket:
     """
     A connection bucket to handle Anilist rate limiting.
     This class will make sure it's safe to request Anilist and avoid rate limiting...
+
+    Every successful response is also cached in memory and in Redis (if provided).
+    Fresh entry is returned directly, stale entry is returned while being refreshed
+    on the background, and concurrent identical requests share a single request.
+    Entry with a ``nextAiringEpisode`` that already aired is treated as expired.
+
+    Every returned response is a copy, modifying it will not modify the cache.
     """
 
     BASE_API = "https://graphql.anilist.co"
+    # Anilist hard limit of the perPage argument
+    MAX_PER_PAGE = 50
+
+    # Fresh TTL per query root field, in seconds
+    CACHE_TTL = {
+        "Media": 30 * 60,
+        "Page": 15 * 60,
+    }
+    CACHE_DEFAULT_TTL = 15 * 60
+    # How long a stale entry can still be served while being refreshed
+    CACHE_STALE_TTL = 6 * 60 * 60
 
-    def __init__(self, session: aiohttp.ClientSession, rate_limit: int = 90):
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        rate_limit: int = 90,
+        redis: Optional[RedisBridge] = None,
+        cache_size: int = 512,
+    ):
         self._sesi = session
+        self.logger = logging.getLogger("http.AnilistBucket")
 
         self._limiter = AsyncLimiter(rate_limit, 60)
         self._next_reset = -1
@@ -55,11 +104,189 @@ class AnilistBucket:
 
         self._requester = GraphQLClient(self.BASE_API, session)
 
-    async def handle(self, query: str, variables: dict = {}) -> GraphQLResult:
+        self._redis = redis
+        self._cache: OrderedDict[str, Tuple[float, Optional[int], dict]] = OrderedDict()
+        self._cache_size = cache_size
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        self._cache_stats = {"hits": 0, "stale": 0, "misses": 0, "coalesced": 0}
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        return {**self._cache_stats, "size": len(self._cache), "inflight": len(self._inflight)}
+
+    @staticmethod
+    def _cache_key(query: str, variables: dict) -> Tuple[str, str]:
+        normalized = _WHITESPACES.sub(" ", query).strip()
+        dumped_vars = orjson.dumps(variables, option=orjson.OPT_SORT_KEYS)
+        digest = sha1(normalized.encode("utf-8") + b"\x00" + dumped_vars).hexdigest()
+        matched = _QUERY_ROOT.search(normalized)
+        root = matched.group(1) if matched is not None else ""
+        return "ntanilist_" + digest, root
+
+    def _get_ttl(self, root: str) -> int:
+        return self.CACHE_TTL.get(root, self.CACHE_DEFAULT_TTL)
+
+    @staticmethod
+    def _next_airing(data: Union[dict, list]) -> Optional[int]:
+        """Find the earliest ``nextAiringEpisode.airingAt`` in the response"""
+        earliest = None
+        stack = [data]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, list):
+                stack.extend(current)
+                continue
+            if not isinstance(current, dict):
+                continue
+            for field, value in current.items():
+                if field == "nextAiringEpisode" and isinstance(value, dict):
+                    airing_at = value.get("airingAt")
+                    if isinstance(airing_at, int) and (earliest is None or airing_at < earliest):
+                        earliest = airing_at
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        return earliest
+
+    def _store_local(self, key: str, stored_at: float, data: dict) -> Tuple[float, Optional[int], dict]:
+        cached = (stored_at, self._next_airing(data), data)
+        self._cache[key] = cached
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return cached
+
+    async def _get_cached(self, key: str) -> Optional[Tuple[float, Optional[int], dict]]:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+        if self._redis is None:
+            return None
+        remote = await self._redis.get(key)
+        if not isinstance(remote, dict) or "t" not in remote or "d" not in remote:
+            return None
+        return self._store_local(key, remote["t"], remote["d"])
+
+    async def _request(self, query: str, variables: dict) -> GraphQLResult:
         async with self._limiter:
             requested = await self._requester.query(query, variables)
             return requested
 
+    async def _refresh(self, key: str, root: str, query: str, variables: dict) -> GraphQLResult:
+        requested = await self._request(query, variables)
+        if not requested.errors and requested.data is not None:
+            stored_at = time.time()
+            # Keep our own copy, the caller might modify the returned result.
+            data = orjson.loads(orjson.dumps(requested.data))
+            self._store_local(key, stored_at, data)
+            if self._redis is not None:
+                expires = self._get_ttl(root) + self.CACHE_STALE_TTL
+                await self._redis.setex(key, {"t": stored_at, "d": data}, expires)
+        return requested
+
+    def _fetch_coalesced(self, key: str, root: str, query: str, variables: dict) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is not None:
+            self._cache_stats["coalesced"] += 1
+            return task
+        task = asyncio.create_task(self._refresh(key, root, query, variables))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    def _background_done(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Failed to refresh stale Anilist response", exc_info=task.exception())
+
+    async def handle(self, query: str, variables: dict = {}, cache: bool = True) -> GraphQLResult:
+        """Send a query to Anilist, with rate limiting and caching.
+
+        :param query: The GraphQL query
+        :type query: str
+        :param variables: The query variables, defaults to {}
+        :type variables: dict, optional
+        :param cache: Use the response cache, defaults to True
+        :type cache: bool, optional
+        :return: The request result
+        :rtype: GraphQLResult
+        """
+        if not cache:
+            return await self._request(query, variables)
+
+        key, root = self._cache_key(query, variables)
+        cached = await self._get_cached(key)
+        if cached is not None:
+            stored_at, airing_at, data = cached
+            current_time = time.time()
+            age = current_time - stored_at
+            ttl = self._get_ttl(root)
+            # The next episode already aired, the airing data is wrong so don't serve it.
+            aired = airing_at is not None and airing_at <= current_time
+            if not aired and age < ttl + self.CACHE_STALE_TTL:
+                if age < ttl:
+                    self._cache_stats["hits"] += 1
+                else:
+                    self._cache_stats["stale"] += 1
+                    self.logger.debug(f"Serving stale {root} response, refreshing in the background")
+                    task = self._fetch_coalesced(key, root, query, variables)
+                    if task not in self._background:
+                        self._background.add(task)
+                        task.add_done_callback(self._background_done)
+                # AttributeDict rebuild every nested dict and list, so this is a copy.
+                return GraphQLResult(query, None, AttributeDict(data), [], 200)
+
+        self._cache_stats["misses"] += 1
+        # Shield the shared request so cancelling one waiter does not cancel the others.
+        return await asyncio.shield(self._fetch_coalesced(key, root, query, variables))
+
+    async def _handle_media_chunk(self, query: str, chunk: List[int], results: Dict[int, Optional[dict]]) -> None:
+        requested = await self.handle(query, {"ids": chunk, "perPage": len(chunk)})
+        if requested.errors:
+            self.logger.error(f"Failed to fetch batched media {chunk}: {requested.errors}")
+        media_list = complex_walk(requested.data, "Page.media")
+        for media in media_list or []:
+            if media is None:
+                continue
+            media_id = media.get("id")
+            if media_id in results:
+                results[media_id] = media
+
+    async def batch_media(
+        self,
+        ids: Iterable[Union[int, str]],
+        fields: str,
+        media_type: str = "ANIME",
+        chunk_size: int = MAX_PER_PAGE,
+    ) -> Dict[int, Optional[dict]]:
+        """Fetch multiple media with a single ``Page(media(id_in: ...))`` query per chunk
+        instead of requesting every media one by one.
+
+        Each chunk only count as a single request to the rate limiter.
+
+        :param ids: The media IDs to fetch
+        :type ids: Iterable[Union[int, str]]
+        :param fields: The media fields to request, must include ``id``
+        :type fields: str
+        :param media_type: The media type, defaults to "ANIME"
+        :type media_type: str, optional
+        :param chunk_size: Maximum IDs per request, capped to 50 by Anilist, defaults to 50
+        :type chunk_size: int, optional
+        :return: A mapping of the media ID and the media data, or None if it's missing or failed
+        :rtype: Dict[int, Optional[dict]]
+        """
+        unique_ids = list(dict.fromkeys(int(media_id) for media_id in ids))
+        results: Dict[int, Optional[dict]] = {media_id: None for media_id in unique_ids}
+        if not unique_ids:
+            return results
+        chunk_size = max(1, min(chunk_size, self.MAX_PER_PAGE))
+        query = BATCH_MEDIA_QUERY % (media_type, fields)
+        chunks = [unique_ids[i : i + chunk_size] for i in range(0, len(unique_ids), chunk_size)]
+        self.logger.info(f"Fetching {len(unique_ids)} media in {len(chunks)} request(s)")
+        await asyncio.gather(*[self._handle_media_chunk(query, chunk, results) for chunk in chunks])
+        return results
+
     async def paginate(self, query: str, variables: dict = {}):
         def internal_function(data: Optional[dict]):
             if data is None:
@@ -85,4 +312,6 @@ class AnilistBucket:
                 break
 
     async def close(self):
+        for task in list(self._background):
+            task.cancel()
         await self._requester.close()
@@ -38,11 +38,20 @@ from kbbi import BatasSehari, GagalAutentikasi, Galat, TerjadiKesalahan, TidakDi
 
 from ..utils import sync_wrap
 from ..version import __version__
+from .pool import HTTPClientPool
 
 __all__ = ("AutentikasiKBBI", "KBBI", "GagalKoneksi")
 __NT_UA__ = f"naoTimes/{__version__} (https://github.com/noaione/naoTimes)"
 
 
+def _buat_sesi(cookies=None) -> aiohttp.ClientSession:
+    """Membuat sesi baru, menggunakan koneksi bersama jika tersedia."""
+    pool = HTTPClientPool.get_default()
+    if pool is not None:
+        return pool.create_session("kbbi", user_agent=__NT_UA__, cookies=cookies)
+    return aiohttp.ClientSession(cookies=cookies, headers={"User-Agent": __NT_UA__})
+
+
 class GagalKoneksi(kbbi.Galat):
     """Galat ketika laman tidak ditemukan dalam KBBI."""
 
@@ -55,7 +64,7 @@ class AutentikasiKBBI:
     lokasi = "Account/Login"
 
     def __init__(self, posel=None, sandi=None):
-        self.sesi = aiohttp.ClientSession(headers={"User-Agent": __NT_UA__})
+        self.sesi = _buat_sesi()
         self.posel = posel
         self.sandi = sandi
 
@@ -155,11 +164,9 @@ class KBBI:
 
     def _init_sesi(self, asp_cookies):
         if asp_cookies:
-            self.sesi = aiohttp.ClientSession(
-                cookies={".AspNet.ApplicationCookie": asp_cookies}, headers={"User-Agent": __NT_UA__}
-            )
+            self.sesi = _buat_sesi({".AspNet.ApplicationCookie": asp_cookies})
         else:
-            self.sesi = aiohttp.ClientSession(headers={"User-Agent": __NT_UA__})
+            self.sesi = _buat_sesi()
 
     def set_autentikasi(self, username=None, password=None, cookie=None, expiry=None):
         if username is not None:
@@ -0,0 +1,270 @@
+"""
+A shared and pooled HTTP client factory
+
+---
+
+MIT License
+
+Copyright (c) 2019-2021 naoTimesdev
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import AsyncIterator, Dict, Optional
+
+import aiohttp
+
+from ..version import version_info
+
+__all__ = ("HTTPClientPool", "pooled_session")
+
+DEFAULT_USER_AGENT = f"naoTimes/v{version_info.shorthand} (https://github.com/naoTimesdev/naoTimes)"
+
+
+class _IntegrationStats:
+    __slots__ = ("requests", "errors", "total_latency", "max_latency")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency: float, is_error: bool = False):
+        self.requests += 1
+        if is_error:
+            self.errors += 1
+        self.total_latency += latency
+        if latency > self.max_latency:
+            self.max_latency = latency
+
+    def serialize(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "average_latency": self.total_latency / self.requests if self.requests > 0 else 0.0,
+            "max_latency": self.max_latency,
+        }
+
+
+class HTTPClientPool:
+    """A factory for :class:`aiohttp.ClientSession` that share a single connector.
+
+    Every integration got their own session with their own timeout and User-Agent,
+    but all of them share the same connection pool, DNS cache and keep-alive connections.
+    Request counts and latencies are recorded per integration.
+    """
+
+    _default: Optional[HTTPClientPool] = None
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 16,
+        dns_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+        user_agent: str = DEFAULT_USER_AGENT,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ):
+        self.logger = logging.getLogger("http.HTTPClientPool")
+        self._loop = loop or asyncio.get_event_loop()
+        self._connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=dns_ttl,
+            keepalive_timeout=keepalive_timeout,
+            enable_cleanup_closed=True,
+        )
+        self._user_agent = user_agent
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._session_options: Dict[str, tuple] = {}
+        self._stats: Dict[str, _IntegrationStats] = {}
+        self._is_closed = False
+
+    @classmethod
+    def get_default(cls) -> Optional[HTTPClientPool]:
+        """Get the pool that is currently used by the bot, if there's any."""
+        pool = cls._default
+        if pool is None or pool.closed:
+            return None
+        return pool
+
+    def set_as_default(self):
+        HTTPClientPool._default = self
+
+    @property
+    def connector(self) -> aiohttp.TCPConnector:
+        return self._connector
+
+    @property
+    def closed(self) -> bool:
+        return self._is_closed
+
+    @property
+    def stats(self) -> Dict[str, dict]:
+        return {name: stats.serialize() for name, stats in self._stats.items()}
+
+    def _create_trace(self, name: str) -> aiohttp.TraceConfig:
+        stats = self._stats.setdefault(name, _IntegrationStats())
+        loop = self._loop
+
+        async def on_request_start(_, context: SimpleNamespace, __):
+            context.start = loop.time()
+
+        async def on_request_end(_, context: SimpleNamespace, params: aiohttp.TraceRequestEndParams):
+            stats.record(loop.time() - context.start, params.response.status >= 500)
+
+        async def on_request_exception(_, context: SimpleNamespace, __):
+            stats.record(loop.time() - context.start, True)
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def create_session(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        user_agent: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> aiohttp.ClientSession:
+        """Create a new session that use the shared connector.
+
+        The session is not cached, use this for session that need their own cookies.
+        The caller is responsible to close the session, closing it will not close the connector.
+
+        :param name: The integration name, used for the stats
+        :type name: str
+        :param timeout: Total timeout of a request in seconds, defaults to None
+        :type timeout: Optional[float], optional
+        :param user_agent: The User-Agent to use, defaults to the naoTimes User-Agent
+        :type user_agent: Optional[str], optional
+        :param headers: Extra default headers, defaults to None
+        :type headers: Optional[Dict[str, str]], optional
+        :return: The created session
+        :rtype: aiohttp.ClientSession
+        """
+        if self._is_closed:
+            raise RuntimeError("The HTTP client pool is already closed")
+        session_headers = {"User-Agent": user_agent or self._user_agent, "Accept-Encoding": "gzip, deflate"}
+        if headers:
+            session_headers.update(headers)
+        client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        if client_timeout is not None:
+            kwargs["timeout"] = client_timeout
+        return aiohttp.ClientSession(
+            connector=self._connector,
+            connector_owner=False,
+            headers=session_headers,
+            auto_decompress=True,
+            trace_configs=[self._create_trace(name)],
+            **kwargs,
+        )
+
+    def session(
+        self,
+        name: str,
+        timeout: Optional[float] = None,
+        user_agent: Optional[str] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> aiohttp.ClientSession:
+        """Get the shared session for an integration, will be created on the first call.
+
+        The session is owned by the pool and must not be closed by the caller.
+        Every call with the same name must use the same options.
+
+        :param name: The integration name
+        :type name: str
+        :param timeout: Total timeout of a request in seconds, defaults to None
+        :type timeout: Optional[float], optional
+        :param user_agent: The User-Agent to use, defaults to the naoTimes User-Agent
+        :type user_agent: Optional[str], optional
+        :param headers: Extra default headers, defaults to None
+        :type headers: Optional[Dict[str, str]], optional
+        :raises ValueError: If the session already exist with different options
+        :return: The shared session
+        :rtype: aiohttp.ClientSession
+        """
+        options = (timeout, user_agent, tuple(sorted((headers or {}).items())))
+        known_options = self._session_options.setdefault(name, options)
+        if known_options != options:
+            raise ValueError(
+                f"Session {name} already exist with different options (timeout, user_agent, headers): "
+                f"{known_options!r} != {options!r}"
+            )
+        session = self._sessions.get(name)
+        if session is None or session.closed:
+            session = self.create_session(name, timeout, user_agent, headers)
+            self._sessions[name] = session
+        return session
+
+    async def close(self):
+        if self._is_closed:
+            return
+        self._is_closed = True
+        for name, session in self._sessions.items():
+            self.logger.debug(f"Closing {name} session...")
+            await session.close()
+        self._sessions.clear()
+        self._session_options.clear()
+        await self._connector.close()
+        if HTTPClientPool._default is self:
+            HTTPClientPool._default = None
+
+
+@asynccontextmanager
+async def pooled_session(
+    name: str,
+    timeout: Optional[float] = None,
+    user_agent: Optional[str] = None,
+    headers: Optional[Dict[str, str]] = None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Use the shared session from the default pool, or a temporary session
+    if the pool is not initialized (e.g. when used outside the bot).
+
+    :param name: The integration name
+    :type name: str
+    :param timeout: Total timeout of a request in seconds, defaults to None
+    :type timeout: Optional[float], optional
+    :param user_agent: The User-Agent to use, defaults to the naoTimes User-Agent
+    :type user_agent: Optional[str], optional
+    :param headers: Extra default headers, defaults to None
+    :type headers: Optional[Dict[str, str]], optional
+    """
+    pool = HTTPClientPool.get_default()
+    if pool is not None:
+        yield pool.session(name, timeout, user_agent, headers)
+        return
+
+    session_headers = {"User-Agent": user_agent or DEFAULT_USER_AGENT}
+    if headers:
+        session_headers.update(headers)
+    client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else aiohttp.ClientTimeout()
+    async with aiohttp.ClientSession(headers=session_headers, timeout=client_timeout) as session:
+        yield session
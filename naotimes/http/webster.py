@@ -31,9 +31,8 @@ SOFTWARE.
 import re
 import typing as T
 
-import aiohttp
-
 from ..utils import complex_walk, get_indexed, list_or_none, str_or_none
+from .pool import pooled_session
 
 __all__ = (
     "MerriamWebsterClient",
@@ -461,7 +460,7 @@ class MerriamWebsterClient:
     async def define(self, word: str):
         if not self.can_define:
             return []
-        async with aiohttp.ClientSession() as sesi:
+        async with pooled_session("merriam-webster", timeout=30) as sesi:
             async with sesi.get(self.ROUTE_WORDS + word, params={"key": self._api_key}) as resp:
                 if resp.status >= 400:
                     return []
@@ -475,7 +474,7 @@ class MerriamWebsterClient:
     async def thesaurize(self, word: str):
         if not self.can_thesaurize:
             return []
-        async with aiohttp.ClientSession() as sesi:
+        async with pooled_session("merriam-webster", timeout=30) as sesi:
             async with sesi.get(self.ROUTE_THESAURUS + word, params={"key": self._api_key_the}) as resp:
                 if resp.status >= 400:
                     return []
@@ -0,0 +1,139 @@
+"""
+A multi-pattern string matcher for naoTimes.
+Find every literal pattern in a single pass of the text with the Aho-Corasick automaton.
+
+---
+
+MIT License
+
+Copyright (c) 2019-2021 naoTimesdev
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = ("AhoCorasick",)
+
+
+class AhoCorasick:
+    """An Aho-Corasick automaton of literal patterns.
+
+    The automaton is immutable, create a new one if the patterns changed.
+    Searching cost is linear to the text length, no matter how many patterns there is.
+
+    Example usage:
+    ```py
+    automaton = AhoCorasick(["he", "she", "hers"])
+    print("ushers" in automaton)  # --> True
+    print(list(automaton.iter("ushers")))  # --> [(3, 'she'), (3, 'he'), (5, 'hers')]
+    ```
+    """
+
+    __slots__ = ("_goto", "_fail", "_output", "_patterns")
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[Tuple[str, ...]] = [()]
+        self._patterns: List[str] = []
+
+        for pattern in dict.fromkeys(patterns):
+            if not pattern:
+                continue
+            self._patterns.append(pattern)
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (pattern,)
+
+        self._fail: List[int] = [0] * len(self._goto)
+        self._build_failure()
+
+    def _build_failure(self):
+        goto, fail, output = self._goto, self._fail, self._output
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fallback = goto[fallback].get(char, 0)
+                fail[next_state] = fallback
+                # Merge the output of the suffix, so we don't need to walk the failure link when searching.
+                output[next_state] += output[fallback]
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __bool__(self):
+        return len(self._patterns) > 0
+
+    def __contains__(self, text: str):
+        return self.search(text) is not None
+
+    def __repr__(self):
+        return f"<AhoCorasick patterns={len(self._patterns)} states={len(self._goto)}>"
+
+    @property
+    def patterns(self) -> List[str]:
+        return self._patterns
+
+    def iter(self, text: str) -> Iterator[Tuple[int, str]]:
+        """Find all of the pattern occurences in the text
+
+        :param text: The text to search
+        :type text: str
+        :return: An iterator of the end index (inclusive) and the matched pattern
+        :rtype: Iterator[Tuple[int, str]]
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                yield index, pattern
+
+    def search(self, text: str) -> Optional[Tuple[int, str]]:
+        """Find the first pattern occurence in the text
+
+        :param text: The text to search
+        :type text: str
+        :return: The end index (inclusive) and the matched pattern, or None if there's no match
+        :rtype: Optional[Tuple[int, str]]
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                return index, output[state][0]
+        return None
@@ -22,14 +22,18 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
+import logging
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Union
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import arrow
 import disnake
+from aiolimiter import AsyncLimiter
 
-__all__ = ("ModLog", "ModLogAction", "ModLogFeature", "ModLogSetting")
+__all__ = ("ModLog", "ModLogAction", "ModLogDispatcher", "ModLogFeature", "ModLogSetting")
 
 
 class ModLogAction(Enum):
@@ -246,3 +250,175 @@ class ModLogSetting:
         check_two = all(feature in PublicModLogActions for feature in features)
 
         return check_one or check_two
+
+
+class _ModLogEntry(NamedTuple):
+    content: Optional[str]
+    embed: Optional[disnake.Embed]
+    guild: Optional[int]
+    action: ModLogAction
+
+
+class _ModLogChannelQueue:
+    __slots__ = ("id", "queue", "dropped", "limiter", "task")
+
+    def __init__(self, channel_id: int, max_rate: int, time_period: float):
+        self.id = channel_id
+        self.queue: Deque[_ModLogEntry] = deque()
+        self.dropped = 0
+        self.limiter = AsyncLimiter(max_rate, time_period)
+        self.task: Optional[asyncio.Task] = None
+
+
+class ModLogDispatcher:
+    """Send the modlog to the destination channel in batches.
+
+    Every channel have their own queue, the modlog that is queued within ``BATCH_WINDOW``
+    is combined into a single message of up to 10 embeds, and each channel is rate limited
+    to the Discord message bucket. When the queue is full, the oldest modlog is dropped
+    and a summary of the dropped count is sent along with the next batch.
+
+    Failed send is logged with the guild and the modlog action, and passed to ``on_error``.
+
+    Example usage:
+    ```py
+    dispatcher = ModLogDispatcher(bot, on_error=bot.echo_error)
+    dispatcher.put(modlog, setting.channel, setting.guild)
+    # On shutdown, send all of the remaining modlog
+    await dispatcher.close()
+    ```
+    """
+
+    # How long to wait for more modlog before sending them together
+    BATCH_WINDOW = 1.0
+    # Discord limits, the embeds per message and the total characters of the embeds
+    MAX_EMBEDS = 10
+    MAX_EMBED_CHARS = 6000
+    # Maximum pending modlog per channel before dropping the oldest one
+    MAX_PENDING = 200
+    # Discord message bucket per channel, 5 messages per 5 seconds
+    RATE_LIMIT = 5
+    RATE_PERIOD = 5.0
+    # Maximum time to wait for the remaining modlog when closing
+    CLOSE_TIMEOUT = 10.0
+
+    def __init__(self, client: disnake.Client, on_error: Optional[Callable[[Exception], Any]] = None):
+        self.logger = logging.getLogger("naoTimes.ModLogDispatcher")
+        self._client = client
+        self._on_error = on_error
+        self._channels: Dict[int, _ModLogChannelQueue] = {}
+        self._is_closing = False
+
+        self.sent = 0
+        self.dropped = 0
+
+    def __repr__(self):
+        return f"<ModLogDispatcher channels={len(self._channels)} sent={self.sent} dropped={self.dropped}>"
+
+    @property
+    def pending(self) -> int:
+        return sum(len(channel.queue) for channel in self._channels.values())
+
+    @staticmethod
+    def _prepare(modlog: ModLog) -> Tuple[Optional[str], Optional[disnake.Embed]]:
+        embed = modlog.embed
+        if embed is not None:
+            if embed.colour == disnake.Embed.Empty:
+                embed.colour = disnake.Color.random()
+            if embed.timestamp == disnake.Embed.Empty:
+                embed.timestamp = arrow.get(modlog.timestamp).datetime
+        return modlog.message or None, embed
+
+    def put(self, modlog: ModLog, channel_id: Optional[int], guild_id: Optional[int] = None) -> bool:
+        """Queue a modlog to be sent to a channel
+
+        :param modlog: The modlog to send
+        :type modlog: ModLog
+        :param channel_id: The destination channel
+        :type channel_id: Optional[int]
+        :param guild_id: The guild of the modlog, used for the error message, defaults to None
+        :type guild_id: Optional[int], optional
+        :return: Is the modlog queued or not?
+        :rtype: bool
+        """
+        if channel_id is None:
+            return False
+        content, embed = self._prepare(modlog)
+        if content is None and embed is None:
+            self.logger.warning(f"Got empty modlog data? {modlog} ({channel_id})")
+            return False
+
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = _ModLogChannelQueue(channel_id, self.RATE_LIMIT, self.RATE_PERIOD)
+            self._channels[channel_id] = channel
+        if len(channel.queue) >= self.MAX_PENDING:
+            channel.queue.popleft()
+            channel.dropped += 1
+            self.dropped += 1
+        channel.queue.append(_ModLogEntry(content, embed, guild_id, modlog.action))
+        if channel.task is None or channel.task.done():
+            channel.task = asyncio.create_task(self._channel_worker(channel), name=f"modlog-dispatcher-{channel_id}")
+        return True
+
+    def _take_batch(self, channel: _ModLogChannelQueue) -> Tuple[Optional[str], List[_ModLogEntry]]:
+        """Take the next message from the queue, modlog with a text message is sent alone."""
+        entry = channel.queue.popleft()
+        if entry.content is not None:
+            return entry.content, [entry]
+        entries = [entry]
+        total_chars = len(entry.embed)
+        while channel.queue and len(entries) < self.MAX_EMBEDS:
+            next_entry = channel.queue[0]
+            if next_entry.content is not None or total_chars + len(next_entry.embed) > self.MAX_EMBED_CHARS:
+                break
+            channel.queue.popleft()
+            entries.append(next_entry)
+            total_chars += len(next_entry.embed)
+        return None, entries
+
+    async def _send(self, target: disnake.abc.Messageable, content: Optional[str], entries: List[_ModLogEntry]):
+        embeds = [entry.embed for entry in entries if entry.embed is not None]
+        try:
+            await target.send(content=content, embeds=embeds)
+            self.sent += len(entries)
+        except Exception as e:
+            # disnake already retried the rate limited request, so just report it.
+            lost_logs = ", ".join(f"{entry.action.name} (guild {entry.guild})" for entry in entries)
+            self.logger.error(f"Failed to send {len(entries)} modlog to {target}: {lost_logs}")
+            if self._on_error is not None:
+                self._on_error(e)
+
+    async def _channel_worker(self, channel: _ModLogChannelQueue):
+        if not self._is_closing:
+            # Wait a bit so a burst of modlog is sent together.
+            await asyncio.sleep(self.BATCH_WINDOW)
+        target = self._client.get_channel(channel.id)
+        if target is None:
+            self.logger.warning(f"Channel {channel.id} is gone, dropping {len(channel.queue)} modlog")
+            channel.queue.clear()
+            self._channels.pop(channel.id, None)
+            return
+        while channel.queue:
+            content, entries = self._take_batch(channel)
+            if channel.dropped > 0:
+                summary = f"⚠️ {channel.dropped} log dilewati karena terlalu banyak event dalam waktu singkat."
+                self.logger.warning(f"Channel {channel.id}: dropped {channel.dropped} modlog because of overload")
+                channel.dropped = 0
+                content = summary if content is None else f"{summary}\n{content}"
+            async with channel.limiter:
+                await self._send(target, content, entries)
+
+    async def close(self):
+        """Stop accepting the batch window and send all of the remaining modlog"""
+        self._is_closing = True
+        tasks = [channel.task for channel in self._channels.values() if channel.task is not None]
+        if not tasks:
+            return
+        self.logger.info(f"Flushing {self.pending} remaining modlog...")
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=self.CLOSE_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Timeout while flushing the modlog, {self.pending} modlog is not sent")
+            for task in tasks:
+                task.cancel()
@@ -29,12 +29,12 @@ import time
 from typing import List, Literal, Match, Optional, Tuple, Type, Union
 from urllib.parse import urlparse
 
-import aiohttp
 import wavelink
 from wavelink.ext.spotify import SpotifyClient, SpotifySearchType, SpotifyTrack
 from wavelink.pool import Node
 from wavelink.utils import MISSING
 
+from naotimes.http.pool import pooled_session
 from naotimes.utils import complex_walk
 
 from ..errors import SpotifyUnavailable, UnsupportedURLFormat
@@ -151,7 +151,7 @@ class SpotifyDirectTrack(SpotifyTrack, SpotifyPartialTrackFilled):
 
     async def _spotify_get_track_api(self, track_id: str, base_url: str) -> Optional[SpotifyTrackPayload]:
         fetch_url = self._clean_url(base_url, track_id)
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("spotify", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -162,7 +162,7 @@ class SpotifyDirectTrack(SpotifyTrack, SpotifyPartialTrackFilled):
         self, playlist_id: str, base_url: str
     ) -> Optional[List[SpotifyTrackPayload]]:
         fetch_url = self._clean_url(base_url, f"playlist/{playlist_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("spotify", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -173,7 +173,7 @@ class SpotifyDirectTrack(SpotifyTrack, SpotifyPartialTrackFilled):
         self, album_id: str, base_url: str
     ) -> Optional[List[SpotifyTrackPayload]]:
         fetch_url = self._clean_url(base_url, f"album/{album_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("spotify", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -184,7 +184,7 @@ class SpotifyDirectTrack(SpotifyTrack, SpotifyPartialTrackFilled):
         self, episode_id: str, base_url: str
     ) -> Optional[SpotifyEpisodePayload]:
         fetch_url = self._clean_url(base_url, f"episode/{episode_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("spotify", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -195,7 +195,7 @@ class SpotifyDirectTrack(SpotifyTrack, SpotifyPartialTrackFilled):
         self, show_id: str, base_url: str
     ) -> Optional[List[SpotifyEpisodePayload]]:
         fetch_url = self._clean_url(base_url, f"show/{show_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("spotify", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -206,7 +206,7 @@ class SpotifyDirectTrack(SpotifyTrack, SpotifyPartialTrackFilled):
         self, artist_id: str, base_url: str
     ) -> Optional[List[SpotifyTrackPayload]]:
         fetch_url = self._clean_url(base_url, f"artist/{artist_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("spotify", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
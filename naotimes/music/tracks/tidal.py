@@ -27,9 +27,9 @@ import re
 from typing import TYPE_CHECKING, List, Literal, Match, Optional, Tuple, Type, Union
 from urllib.parse import urlparse
 
-import aiohttp
 import wavelink
 
+from naotimes.http.pool import pooled_session
 from naotimes.utils import complex_walk
 
 from ..errors import TidalUnavailable, UnsupportedURLFormat
@@ -125,7 +125,7 @@ class TidalDirectLink(TidalPartialTrackFilled):
 
     async def _tidal_get_track_api(self, track_id: str, base_url: str) -> Optional[TidalTrackPayload]:
         fetch_url = self._clean_url(base_url, f"tidal/{track_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("tidal", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -136,7 +136,7 @@ class TidalDirectLink(TidalPartialTrackFilled):
         self, playlist_id: str, base_url: str
     ) -> Optional[List[TidalTrackPayload]]:
         fetch_url = self._clean_url(base_url, f"tidal/playlist/{playlist_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("tidal", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
@@ -145,7 +145,7 @@ class TidalDirectLink(TidalPartialTrackFilled):
 
     async def _tidal_get_album_api(self, album_id: str, base_url: str) -> Optional[List[TidalTrackPayload]]:
         fetch_url = self._clean_url(base_url, f"tidal/album/{album_id}")
-        async with aiohttp.ClientSession() as session:
+        async with pooled_session("tidal", timeout=30) as session:
             async with session.get(fetch_url) as resp:
                 if resp.status != 200:
                     return None
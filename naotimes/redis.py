@@ -31,7 +31,7 @@ SOFTWARE.
 import asyncio
 import logging
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import aioredis
 import orjson
@@ -52,7 +52,8 @@ class RedisBridge:
 
     This `class` is wrapping some of the main function of the aioredis module,
     with extras like automatic data conversion, a `getall` and `getalldict` function
-    that wraps fetching all values of many `keys` on a provided pattern
+    that wraps fetching all values of many `keys` on a provided pattern.
+    Use `iterscan` if you want to stream the values instead of collecting all of it.
 
     All function in this class is asynchronous!
 
@@ -263,32 +264,113 @@ class RedisBridge:
         all_keys = [key.decode("utf-8") for key in all_keys]
         return all_keys
 
-    async def getall(self, pattern: str) -> List[Any]:
+    async def scan_keys(self, pattern: str, batch_size: int = 500, dedupe: bool = True) -> AsyncIterator[List[str]]:
+        """Walk the keyspace with cursor-based `SCAN` and yield the matching keys in batches
+
+        Unlike `keys()` this does not block the Redis server while walking the keyspace.
+        `SCAN` might return the same key more than once, by default the keys are deduplicated
+        before yielded. To do that, every yielded key is kept in memory until the scan is finished,
+        so disable `dedupe` on a big keyspace if the caller does not care about duplicate keys.
+
+        :param pattern: The pattern of the keys to find, using the glob-style patterns
+                        Refer more here: https://redis.io/commands/SCAN
+        :type pattern: str
+        :param batch_size: The `COUNT` hint and the maximum size of every yielded batch
+        :type batch_size: int
+        :param dedupe: Deduplicate the keys across the whole scan, or only inside a single batch
+        :type dedupe: bool
+        :return: An async iterator of list of keys
+        :rtype: AsyncIterator[List[str]]
+        """
+        if self._is_stopping:
+            return
+        uniq_id = str(uuid.uuid4())
+        self.lock("scan_" + uniq_id)
+        try:
+            seen_keys = set()
+            pending: List[str] = []
+            cursor = 0
+            while True:
+                try:
+                    cursor, batch = await self._conn.scan(cursor=cursor, match=pattern, count=batch_size)
+                except aioredis.RedisError as e:
+                    self.logger.debug(f"Failed to scan {pattern}", exc_info=e)
+                    break
+                if not dedupe:
+                    seen_keys = set(pending)
+                for key in batch:
+                    if isinstance(key, bytes):
+                        key = key.decode("utf-8")
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    pending.append(key)
+                while len(pending) >= batch_size:
+                    yield pending[:batch_size]
+                    pending = pending[batch_size:]
+                if int(cursor) == 0:
+                    break
+            if pending:
+                yield pending
+        finally:
+            self.unlock("scan_" + uniq_id)
+
+    async def iterscan(self, pattern: str, batch_size: int = 500) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream all key and values that match the key pattern
+
+        The keys are fetched with `SCAN` and the values are fetched with `MGET`
+        in a batch of `batch_size`, every value is converted back to the original data.
+
+        Keys that got deleted between the `SCAN` and `MGET` call will be skipped.
+
+        Example usage:
+        ```py
+        async for key, value in client.iterscan("ntprefix_*"):
+            print(key, value)
+        ```
+
+        :param pattern: The pattern of the keys to find, using the glob-style patterns
+                        Refer more here: https://redis.io/commands/SCAN
+        :type pattern: str
+        :param batch_size: How many keys to fetch per `SCAN` and `MGET` round trip
+        :type batch_size: int
+        :return: An async iterator of key and value pair
+        :rtype: AsyncIterator[Tuple[str, Any]]
+        """
+        async for keys in self.scan_keys(pattern, batch_size):
+            if self._is_stopping:
+                break
+            try:
+                values = await self._conn.mget(keys)
+            except aioredis.RedisError as e:
+                self.logger.debug(f"Failed to fetch {len(keys)} keys of {pattern}", exc_info=e)
+                continue
+            for key, value in zip(keys, values):
+                if value is None:
+                    continue
+                yield key, self.to_original(value)
+
+    async def getall(self, pattern: str, batch_size: int = 500) -> List[Any]:
         """Get all values that match the key pattern
 
         Example return format: `["value_of_it", "another_value"]`
 
         :param pattern: The pattern of the keys to find, using the glob-style patterns
-                        Refer more here: https://redis.io/commands/KEYS
+                        Refer more here: https://redis.io/commands/SCAN
         :type pattern: str
+        :param batch_size: How many keys to fetch per round trip
+        :type batch_size: int
         :return: All values of the matches keys
         :rtype: List[Any]
         """
         if self._is_stopping:
             return []
-        uniq_id = str(uuid.uuid4())
-        all_keys = await self.keys(pattern)
-        if not isinstance(all_keys, list):
-            return []
-        self.lock("getall_" + uniq_id)
         all_values = []
-        for key in all_keys:
-            r_val = await self.get(key)
+        async for _, r_val in self.iterscan(pattern, batch_size):
             all_values.append(r_val)
-        self.unlock("getall_" + uniq_id)
         return all_values
 
-    async def getalldict(self, pattern: str) -> Dict[str, Any]:
+    async def getalldict(self, pattern: str, batch_size: int = 500) -> Dict[str, Any]:
         """Get all values (with the key of it) that match the key pattern
 
         This is the same as `getall()` but with dict format.
@@ -296,25 +378,18 @@ class RedisBridge:
         Example: `{"the_key_name": "value_of_it", "the_key_name2", "another_value"}`
 
         :param pattern: The pattern of the keys to find, using the glob-style patterns
-                        Refer more here: https://redis.io/commands/KEYS
+                        Refer more here: https://redis.io/commands/SCAN
         :type pattern: str
+        :param batch_size: How many keys to fetch per round trip
+        :type batch_size: int
         :return: A key-value dict, key is the key name, value is the data
         :rtype: Dict[str, Any]
         """
         if self._is_stopping:
             return {}
-        uniq_id = str(uuid.uuid4())
-        all_keys = await self.keys(pattern)
-        if not isinstance(all_keys, list):
-            return {}
-        self.lock("getalldict_" + uniq_id)
         key_val = {}
-        for key in all_keys:
-            r_val = await self.get(key)
-            if isinstance(key, bytes):
-                key = key.decode("utf-8")
+        async for key, r_val in self.iterscan(pattern, batch_size):
             key_val[key] = r_val
-        self.unlock("getalldict_" + uniq_id)
         return key_val
 
     async def set(self, key: str, data: Any) -> bool:
@@ -339,6 +414,28 @@ class RedisBridge:
         self.unlock("set_" + uniq_id)
         return res
 
+    async def setmany(self, data: Dict[str, Any]) -> bool:
+        """Set multiple keys with the provided data in a single round trip
+
+        :param data: A key-value dict, key is the key name, value is the data
+        :type data: Dict[str, Any]
+        :return: is the execution success or no?
+        :rtype: bool
+        """
+        if self._is_stopping:
+            return False
+        if not data:
+            return True
+        uniq_id = str(uuid.uuid4())
+        self.lock("setmany_" + uniq_id)
+        try:
+            res = await self._conn.mset({key: self.stringify(value) for key, value in data.items()})
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to set {len(data)} keys", exc_info=e)
+            res = False
+        self.unlock("setmany_" + uniq_id)
+        return res
+
     async def setex(self, key: str, data: Any, expires: int) -> bool:
         """Set a new key with provided data BUT with additional expiration time
 
@@ -404,15 +501,398 @@ class RedisBridge:
             return True
         return False
 
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        """Add or update members of a sorted set
+
+        :param key: The sorted set key
+        :type key: str
+        :param mapping: A member-score dict
+        :type mapping: Dict[str, float]
+        :return: The amount of new members added
+        :rtype: int
+        """
+        if self._is_stopping or not mapping:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("zadd_" + uniq_id)
+        try:
+            res = await self._conn.zadd(key, mapping)
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to zadd {len(mapping)} members to {key}", exc_info=e)
+            res = 0
+        self.unlock("zadd_" + uniq_id)
+        return res
+
+    async def zscores(self, key: str, members: List[str]) -> List[Optional[float]]:
+        """Get the score of multiple members of a sorted set in a single round trip
+
+        :param key: The sorted set key
+        :type key: str
+        :param members: The members to check
+        :type members: List[str]
+        :return: The score of each member, or None if it's not a member
+        :rtype: List[Optional[float]]
+        """
+        if self._is_stopping or not members:
+            return [None] * len(members)
+        uniq_id = str(uuid.uuid4())
+        self.lock("zscores_" + uniq_id)
+        try:
+            async with self._conn.pipeline(transaction=False) as pipe:
+                for member in members:
+                    pipe.zscore(key, member)
+                res = await pipe.execute()
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to get {len(members)} scores of {key}", exc_info=e)
+            res = [None] * len(members)
+        self.unlock("zscores_" + uniq_id)
+        return res
+
+    async def ztrim(self, key: str, min_score: float, max_size: int) -> int:
+        """Trim a sorted set, remove members below `min_score` and keep only
+        the `max_size` members with the highest score.
+
+        :param key: The sorted set key
+        :type key: str
+        :param min_score: The minimum score to keep
+        :type min_score: float
+        :param max_size: Maximum members to keep
+        :type max_size: int
+        :return: The amount of removed members
+        :rtype: int
+        """
+        if self._is_stopping:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("ztrim_" + uniq_id)
+        try:
+            async with self._conn.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(key, "-inf", f"({min_score}")
+                pipe.zremrangebyrank(key, 0, -(max_size + 1))
+                res = sum(await pipe.execute())
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to trim {key}", exc_info=e)
+            res = 0
+        self.unlock("ztrim_" + uniq_id)
+        return res
+
+    async def zrem(self, key: str, members: List[str]) -> int:
+        """Remove members of a sorted set
+
+        :param key: The sorted set key
+        :type key: str
+        :param members: The members to remove
+        :type members: List[str]
+        :return: The amount of members removed
+        :rtype: int
+        """
+        if self._is_stopping or not members:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("zrem_" + uniq_id)
+        try:
+            res = await self._conn.zrem(key, *members)
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to remove {len(members)} members of {key}", exc_info=e)
+            res = 0
+        self.unlock("zrem_" + uniq_id)
+        return res
+
+    async def zcard(self, key: str) -> int:
+        """Get the amount of members of a sorted set
+
+        :param key: The sorted set key
+        :type key: str
+        :return: The amount of members
+        :rtype: int
+        """
+        if self._is_stopping:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("zcard_" + uniq_id)
+        try:
+            res = await self._conn.zcard(key)
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to get the size of {key}", exc_info=e)
+            res = 0
+        self.unlock("zcard_" + uniq_id)
+        return res
+
+    async def zadd_with_data(self, key: str, data_key: str, mapping: Dict[str, Tuple[float, Any]]) -> bool:
+        """Add or update members of a sorted set, and store the data of each member
+        in a hash in a single transaction.
+
+        :param key: The sorted set key
+        :type key: str
+        :param data_key: The hash key where the data is stored
+        :type data_key: str
+        :param mapping: A member-(score, data) dict, data with None value will not be stored
+        :type mapping: Dict[str, Tuple[float, Any]]
+        :return: is the execution success or no?
+        :rtype: bool
+        """
+        if self._is_stopping or not mapping:
+            return False
+        uniq_id = str(uuid.uuid4())
+        self.lock("zaddwd_" + uniq_id)
+        try:
+            async with self._conn.pipeline(transaction=True) as pipe:
+                pipe.zadd(key, {member: score for member, (score, _) in mapping.items()})
+                for member, (_, data) in mapping.items():
+                    if data is None:
+                        pipe.hdel(data_key, member)
+                    else:
+                        pipe.hset(data_key, member, self.stringify(data))
+                await pipe.execute()
+            res = True
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to zadd {len(mapping)} members to {key}", exc_info=e)
+            res = False
+        self.unlock("zaddwd_" + uniq_id)
+        return res
+
+    async def zrem_with_data(self, key: str, data_key: str, members: List[str]) -> int:
+        """Remove members of a sorted set and their data in a single transaction.
+
+        :param key: The sorted set key
+        :type key: str
+        :param data_key: The hash key where the data is stored
+        :type data_key: str
+        :param members: The members to remove
+        :type members: List[str]
+        :return: The amount of members removed
+        :rtype: int
+        """
+        if self._is_stopping or not members:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("zremwd_" + uniq_id)
+        try:
+            async with self._conn.pipeline(transaction=True) as pipe:
+                pipe.zrem(key, *members)
+                pipe.hdel(data_key, *members)
+                res, _ = await pipe.execute()
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to remove {len(members)} members of {key}", exc_info=e)
+            res = 0
+        self.unlock("zremwd_" + uniq_id)
+        return res
+
+    async def zrange_with_data(
+        self,
+        key: str,
+        data_key: str,
+        min_score: Union[float, str] = "-inf",
+        max_score: Union[float, str] = "+inf",
+        offset: int = 0,
+        count: Optional[int] = None,
+    ) -> List[Tuple[str, float, Any]]:
+        """Get the members of a sorted set by score, ordered from the lowest score,
+        along with the data of each member.
+
+        :param key: The sorted set key
+        :type key: str
+        :param data_key: The hash key where the data is stored
+        :type data_key: str
+        :param min_score: The minimum score, defaults to "-inf"
+        :type min_score: Union[float, str], optional
+        :param max_score: The maximum score, defaults to "+inf"
+        :type max_score: Union[float, str], optional
+        :param offset: The amount of members to skip, defaults to 0
+        :type offset: int, optional
+        :param count: Maximum members to return, defaults to None (all of them)
+        :type count: Optional[int], optional
+        :return: A list of member, score, and the data (None if there's no data)
+        :rtype: List[Tuple[str, float, Any]]
+        """
+        if self._is_stopping:
+            return []
+        uniq_id = str(uuid.uuid4())
+        self.lock("zrangewd_" + uniq_id)
+        try:
+            if count is None:
+                # A negative count means all of the remaining members
+                count = -1 if offset else None
+                offset = offset or None
+            members = await self._conn.zrangebyscore(
+                key, min_score, max_score, start=offset, num=count, withscores=True
+            )
+            all_data = []
+            if members:
+                all_data = await self._conn.hmget(data_key, [member for member, _ in members])
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to get the members of {key}", exc_info=e)
+            members, all_data = [], []
+        self.unlock("zrangewd_" + uniq_id)
+        return [
+            (member.decode("utf-8"), score, self.to_original(data)) for (member, score), data in zip(members, all_data)
+        ]
+
+    async def rpush(self, key: str, values: List[Any]) -> int:
+        """Append values to the end of a list
+
+        :param key: The list key
+        :type key: str
+        :param values: The values to append
+        :type values: List[Any]
+        :return: The length of the list after the push, 0 if failed
+        :rtype: int
+        """
+        if self._is_stopping or not values:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("rpush_" + uniq_id)
+        try:
+            res = await self._conn.rpush(key, *[self.stringify(value) for value in values])
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to push {len(values)} values to {key}", exc_info=e)
+            res = 0
+        self.unlock("rpush_" + uniq_id)
+        return res
+
+    async def lrange(self, key: str, start: int = 0, end: int = -1) -> List[Any]:
+        """Get the values of a list, converted back to the original data
+
+        :param key: The list key
+        :type key: str
+        :param start: The start index, defaults to 0
+        :type start: int, optional
+        :param end: The end index (inclusive), defaults to -1 (the last value)
+        :type end: int, optional
+        :return: The values of the list
+        :rtype: List[Any]
+        """
+        if self._is_stopping:
+            return []
+        uniq_id = str(uuid.uuid4())
+        self.lock("lrange_" + uniq_id)
+        try:
+            res = await self._conn.lrange(key, start, end)
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to get the values of {key}", exc_info=e)
+            res = []
+        self.unlock("lrange_" + uniq_id)
+        return [self.to_original(value) for value in res]
+
+    async def rmmany(self, keys: List[str]) -> int:
+        """Remove multiple keys in a single round trip
+
+        :param keys: keys to remove
+        :type keys: List[str]
+        :return: The amount of keys removed
+        :rtype: int
+        """
+        if self._is_stopping or not keys:
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("rmmany_" + uniq_id)
+        try:
+            res = await self._conn.unlink(*keys)
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to remove {len(keys)} keys", exc_info=e)
+            res = 0
+        self.unlock("rmmany_" + uniq_id)
+        return res
+
+    async def smembers_many(self, keys: List[str]) -> List[Set[str]]:
+        """Get the members of multiple sets in a single round trip
+
+        The members are returned as a decoded string, the caller need to convert it
+        back to the original type.
+
+        :param keys: The set keys
+        :type keys: List[str]
+        :return: The members of each set, empty set if the key doesn't exist
+        :rtype: List[Set[str]]
+        """
+        if self._is_stopping or not keys:
+            return [set() for _ in keys]
+        uniq_id = str(uuid.uuid4())
+        self.lock("smembers_" + uniq_id)
+        try:
+            async with self._conn.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.smembers(key)
+                res = await pipe.execute()
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to get members of {len(keys)} sets", exc_info=e)
+            res = [set() for _ in keys]
+        self.unlock("smembers_" + uniq_id)
+        return [{member.decode("utf-8") for member in members} for members in res]
+
+    async def supdate(
+        self,
+        added: Dict[str, Iterable[Any]],
+        removed: Optional[Dict[str, Iterable[Any]]] = None,
+        replace: bool = False,
+    ) -> bool:
+        """Add and remove members of multiple sets in a single transaction
+
+        :param added: A key-members dict of members to add
+        :type added: Dict[str, Iterable[Any]]
+        :param removed: A key-members dict of members to remove, defaults to None
+        :type removed: Optional[Dict[str, Iterable[Any]]], optional
+        :param replace: Delete the sets in ``added`` first, defaults to False
+        :type replace: bool, optional
+        :return: is the execution success or no?
+        :rtype: bool
+        """
+        if self._is_stopping:
+            return False
+        removed = removed or {}
+        uniq_id = str(uuid.uuid4())
+        self.lock("supdate_" + uniq_id)
+        try:
+            async with self._conn.pipeline(transaction=True) as pipe:
+                for key, members in added.items():
+                    if replace:
+                        pipe.delete(key)
+                    members = [self.stringify(member) for member in members]
+                    if members:
+                        pipe.sadd(key, *members)
+                for key, members in removed.items():
+                    members = [self.stringify(member) for member in members]
+                    if members:
+                        pipe.srem(key, *members)
+                await pipe.execute()
+            res = True
+        except aioredis.RedisError as e:
+            self.logger.debug(f"Failed to update {len(added) + len(removed)} sets", exc_info=e)
+            res = False
+        self.unlock("supdate_" + uniq_id)
+        return res
+
     # Aliases
     exist = exists
     delete = rm
 
-    async def bulkrm(self, keys: str) -> None:
+    async def bulkrm(self, keys: str, batch_size: int = 500) -> int:
+        """Remove all keys that match the key pattern
+
+        The keys are collected with `SCAN` and removed with `UNLINK` in a batch of `batch_size`,
+        so the actual memory reclaiming is done in the background by Redis.
+
+        :param keys: The pattern of the keys to remove, using the glob-style patterns
+        :type keys: str
+        :param batch_size: How many keys to remove per round trip
+        :type batch_size: int
+        :return: The amount of keys removed
+        :rtype: int
+        """
         if self._is_stopping:
-            return False
-        collection = await self.keys(keys)
-        for key in collection:
-            await self.rm(key)
+            return 0
+        uniq_id = str(uuid.uuid4())
+        self.lock("bulkrm_" + uniq_id)
+        removed = 0
+        try:
+            # Unlinking an already removed key is a no-op, so there's no need to remember every key.
+            async for batch in self.scan_keys(keys, batch_size, dedupe=False):
+                try:
+                    removed += await self._conn.unlink(*batch)
+                except aioredis.RedisError as e:
+                    self.logger.debug(f"Failed to unlink {len(batch)} keys of {keys}", exc_info=e)
+        finally:
+            self.unlock("bulkrm_" + uniq_id)
+        return removed
 
     bulkdelete = bulkrm
@@ -0,0 +1,325 @@
+"""
+A shared timer scheduler for naoTimes.
+Run a callback at a given time, the timers are kept in a min-heap and persisted in a Redis sorted set.
+
+---
+
+MIT License
+
+Copyright (c) 2019-2021 naoTimesdev
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from .redis import RedisBridge
+
+__all__ = ("ScheduledTimer", "TimerScheduler")
+
+TimerCallback = Callable[["ScheduledTimer"], Awaitable[Any]]
+
+
+class ScheduledTimer:
+    """A single timer of the :class:`TimerScheduler`
+
+    :param kind: The timer kind, used to select the callback
+    :type kind: str
+    :param timer_id: The timer ID, unique per kind
+    :type timer_id: str
+    :param due: The UNIX timestamp of when the timer should fire
+    :type due: float
+    :param payload: Extra data for the callback, must be JSON serializable
+    :type payload: Any
+    :param persist: Is the timer persisted in Redis or not
+    :type persist: bool
+    """
+
+    __slots__ = ("kind", "id", "due", "payload", "persist")
+
+    def __init__(self, kind: str, timer_id: str, due: float, payload: Any = None, persist: bool = True):
+        self.kind = kind
+        self.id = timer_id
+        self.due = due
+        self.payload = payload
+        self.persist = persist
+
+    def __repr__(self):
+        return f"<ScheduledTimer kind={self.kind!r} id={self.id!r} due={self.due}>"
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}:{self.id}"
+
+
+class TimerScheduler:
+    """A shared scheduler that run a callback when a timer is due.
+
+    All of the timers are kept in a min-heap ordered by the due time, so scheduling
+    and cancelling is O(log n), and the runner only wake up when the nearest timer is due.
+    Cancelled timers are removed lazily from the heap.
+
+    The timers are persisted in a Redis sorted set (and the payload in a hash), and
+    removed after the callback finished, so a timer that hasn't been fired (or is still running)
+    when the bot goes down will be fired again after a restart.
+
+    Example usage:
+    ```py
+    scheduler = TimerScheduler(redis_client)
+    await scheduler.start()
+
+    async def remind(timer: ScheduledTimer):
+        print(timer.payload["text"])
+
+    scheduler.register("reminder", remind)
+    await scheduler.schedule("reminder", "1234", time.time() + 60, {"text": "Hello"})
+    ```
+    """
+
+    # Maximum sleep of the runner, to catch up with clock changes
+    MAX_SLEEP = 3600.0
+    # The amount of timers loaded from Redis per request
+    LOAD_BATCH = 1000
+
+    def __init__(self, redis_client: RedisBridge, prefix: str = "nttimers"):
+        self.logger = logging.getLogger("naoTimes.TimerScheduler")
+        self._db = redis_client
+        self._due_key = f"{prefix}_due"
+        self._data_key = f"{prefix}_data"
+
+        self._timers: Dict[str, ScheduledTimer] = {}
+        self._heap: List[Tuple[float, int, ScheduledTimer]] = []
+        self._counter = itertools.count()
+        self._stale = 0
+        self._handlers: Dict[str, TimerCallback] = {}
+        # Due timers that doesn't have any callback registered yet.
+        self._unhandled: Dict[str, Dict[str, ScheduledTimer]] = {}
+
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+
+    def __len__(self):
+        return len(self._timers)
+
+    def __repr__(self):
+        return f"<TimerScheduler timers={len(self._timers)} handlers={list(self._handlers.keys())}>"
+
+    def _push(self, timer: ScheduledTimer):
+        old_timer = self._timers.get(timer.key)
+        if old_timer is not None:
+            self._stale += 1
+        self._timers[timer.key] = timer
+        heapq.heappush(self._heap, (timer.due, next(self._counter), timer))
+        if self._heap[0][2] is timer:
+            # The nearest timer changed, wake the runner so it can sleep again with the new time.
+            self._wakeup.set()
+
+    def _compact(self):
+        """Rebuild the heap when most of it is cancelled timers"""
+        if self._stale < 1024 or self._stale < len(self._timers):
+            return
+        self._heap = [entry for entry in self._heap if self._timers.get(entry[2].key) is entry[2]]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    async def start(self):
+        """Load all of the persisted timers and start the runner"""
+        if self._runner is not None:
+            return
+        offset = 0
+        while True:
+            batch = await self._db.zrange_with_data(self._due_key, self._data_key, offset=offset, count=self.LOAD_BATCH)
+            for member, due, payload in batch:
+                kind, _, timer_id = member.partition(":")
+                self._push(ScheduledTimer(kind, timer_id, due, payload))
+            if len(batch) < self.LOAD_BATCH:
+                break
+            offset += len(batch)
+        self.logger.info(f"Loaded {len(self._timers)} timers, starting runner...")
+        self._runner = asyncio.create_task(self._run(), name="naotimes-timer-scheduler")
+
+    async def close(self):
+        """Stop the runner and all of the running callback.
+
+        The timer of a cancelled callback is kept in Redis, and will be fired again on the next start.
+        """
+        if self._runner is not None:
+            self._runner.cancel()
+            self._runner = None
+        for task in list(self._running):
+            task.cancel()
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def register(self, kind: str, callback: TimerCallback):
+        """Register the callback of a timer kind, replacing the old one.
+
+        Timers of that kind that is already due is fired immediately.
+
+        :param kind: The timer kind
+        :type kind: str
+        :param callback: The async function to call, will receive the :class:`ScheduledTimer`
+        :type callback: TimerCallback
+        """
+        self._handlers[kind] = callback
+        for timer in self._unhandled.pop(kind, {}).values():
+            if self._timers.get(timer.key) is timer:
+                self._dispatch(timer)
+
+    def unregister(self, kind: str):
+        """Remove the callback of a timer kind.
+
+        The timers are kept, and will be fired when a new callback is registered.
+
+        :param kind: The timer kind
+        :type kind: str
+        """
+        self._handlers.pop(kind, None)
+
+    def get(self, kind: str, timer_id: Union[str, int]) -> Optional[ScheduledTimer]:
+        """Get a pending timer
+
+        :param kind: The timer kind
+        :type kind: str
+        :param timer_id: The timer ID
+        :type timer_id: Union[str, int]
+        :return: The timer, or None if it doesn't exist or already fired
+        :rtype: Optional[ScheduledTimer]
+        """
+        return self._timers.get(f"{kind}:{timer_id}")
+
+    def timers(self, kind: str) -> List[ScheduledTimer]:
+        """Get all of the pending timers of a kind
+
+        :param kind: The timer kind
+        :type kind: str
+        :return: The pending timers
+        :rtype: List[ScheduledTimer]
+        """
+        return [timer for timer in self._timers.values() if timer.kind == kind]
+
+    async def schedule(
+        self, kind: str, timer_id: Union[str, int], due: float, payload: Any = None, persist: bool = True
+    ) -> ScheduledTimer:
+        """Schedule a timer, replacing the timer with the same kind and ID.
+
+        :param kind: The timer kind
+        :type kind: str
+        :param timer_id: The timer ID, unique per kind
+        :type timer_id: Union[str, int]
+        :param due: The UNIX timestamp of when the timer should fire
+        :type due: float
+        :param payload: Extra data for the callback, must be JSON serializable, defaults to None
+        :type payload: Any, optional
+        :param persist: Persist the timer in Redis, disable it if the caller has their own storage
+                        and will schedule it again after a restart, defaults to True
+        :type persist: bool, optional
+        :return: The scheduled timer
+        :rtype: ScheduledTimer
+        """
+        if ":" in kind:
+            raise ValueError("Timer kind cannot contain `:`")
+        timer = ScheduledTimer(kind, str(timer_id), float(due), payload, persist)
+        old_timer = self._timers.get(timer.key)
+        self._push(timer)
+        self._compact()
+        if not persist:
+            if old_timer is not None and old_timer.persist:
+                await self._db.zrem_with_data(self._due_key, self._data_key, [timer.key])
+            return timer
+        success = await self._db.zadd_with_data(self._due_key, self._data_key, {timer.key: (timer.due, payload)})
+        if not success:
+            self.logger.warning(f"{timer}: failed to persist timer, it will be lost on restart!")
+        return timer
+
+    async def cancel(self, kind: str, timer_id: Union[str, int]) -> bool:
+        """Cancel a timer
+
+        :param kind: The timer kind
+        :type kind: str
+        :param timer_id: The timer ID
+        :type timer_id: Union[str, int]
+        :return: Is there any timer cancelled?
+        :rtype: bool
+        """
+        key = f"{kind}:{timer_id}"
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            self._stale += 1
+            self._compact()
+        if timer is None or timer.persist:
+            await self._db.zrem_with_data(self._due_key, self._data_key, [key])
+        return timer is not None
+
+    def _dispatch(self, timer: ScheduledTimer):
+        callback = self._handlers.get(timer.kind)
+        if callback is None:
+            self.logger.debug(f"{timer}: no callback registered, waiting for one...")
+            self._unhandled.setdefault(timer.kind, {})[timer.key] = timer
+            return
+        del self._timers[timer.key]
+        task = asyncio.create_task(self._execute(timer, callback), name=f"naotimes-timer-{timer.key}")
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _execute(self, timer: ScheduledTimer, callback: TimerCallback):
+        try:
+            await callback(timer)
+        except asyncio.CancelledError:
+            self.logger.warning(f"{timer}: callback got cancelled, keeping it for the next start")
+            raise
+        except Exception as e:
+            self.logger.error(f"{timer}: callback failed to execute", exc_info=e)
+        if timer.persist and timer.key not in self._timers:
+            # Only remove it if the callback didn't schedule a new timer with the same ID
+            await self._db.zrem_with_data(self._due_key, self._data_key, [timer.key])
+
+    async def _run(self):
+        while True:
+            try:
+                self._wakeup.clear()
+                current_time = time.time()
+                while self._heap and self._heap[0][0] <= current_time:
+                    _, _, timer = heapq.heappop(self._heap)
+                    if self._timers.get(timer.key) is not timer:
+                        # Cancelled or replaced
+                        self._stale = max(self._stale - 1, 0)
+                        continue
+                    self._dispatch(timer)
+
+                sleep_time = self.MAX_SLEEP
+                if self._heap:
+                    sleep_time = min(max(self._heap[0][0] - current_time, 0), sleep_time)
+                # Set the same event when the time is up, so there's no extra task for the timeout.
+                wakeup_handle = asyncio.get_running_loop().call_later(sleep_time, self._wakeup.set)
+                try:
+                    await self._wakeup.wait()
+                finally:
+                    wakeup_handle.cancel()
+            except asyncio.CancelledError:
+                self.logger.info("Got cancel signal, stopping timer runner...")
+                break
+            except Exception as e:
+                self.logger.error("Failed to run the due timers", exc_info=e)
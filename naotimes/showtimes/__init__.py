@@ -13,3 +13,4 @@ from .fsdb import *
 from .helper import *
 from .models import *
 from .queue import *
+from .rssparser import *
@@ -25,7 +25,7 @@ SOFTWARE.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
 
 import arrow
 import disnake
@@ -42,9 +42,7 @@ __all__ = ("ShowtimesCogsBases",)
 
 StrInt = Union[str, int]
 
-anifetch_query = """
-query ($id: Int!) {
-    Media(id: $id, type: ANIME) {
+anifetch_fields = """
         id
         idMal
         title {
@@ -74,9 +72,17 @@ query ($id: Int!) {
             airingAt
             episode
         }
-    }
+"""
+
+anifetch_query = (
+    """
+query ($id: Int!) {
+    Media(id: $id, type: ANIME) {"""
+    + anifetch_fields
+    + """    }
 }
 """
+)
 
 
 def is_minus(x: Union[int, float]) -> bool:
@@ -199,11 +205,24 @@ class ShowtimesCogsBases:
         :rtype: Union[str, dict]
         """
 
-        if isinstance(ani_id, str):
-            ani_id = int(ani_id)
         if current_episode is None and (not return_only_time and not jadwal_only):
             raise ValueError("Current episode is None while the `return_only_xxx` attribute is False")
 
+        entries = await self.fetch_anilist_media(ani_id)
+        if isinstance(entries, str):
+            return entries
+        return self.parse_anilist(entries, current_episode, total_episode, jadwal_only, return_only_time)
+
+    async def fetch_anilist_media(self, ani_id: StrInt) -> Union[str, dict]:
+        """Fetch the raw Anilist media data that can be parsed later with :meth:`parse_anilist`
+
+        :param ani_id: Anilist ID
+        :type ani_id: StrInt
+        :return: The raw media data or an error message
+        :rtype: Union[str, dict]
+        """
+        if isinstance(ani_id, str):
+            ani_id = int(ani_id)
         full_data = await self.anibucket.handle(anifetch_query, {"id": ani_id})
         if len(full_data.errors) > 0:
             self.logger.error("An error occured")
@@ -213,9 +232,63 @@ class ShowtimesCogsBases:
         raw_data = full_data.data
         if raw_data is None:
             return "Tidak ada hasil"
+        media = raw_data.get("Media")
+        if media is None:
+            return "Tidak ada hasil"
+        return media
 
-        entries = raw_data["Media"]
-        self.logger.info(f"Parsing info for {ani_id}")
+    async def fetch_anilist_batch(
+        self,
+        ani_ids: Iterable[StrInt],
+        jadwal_only=False,
+        return_only_time=False,
+    ) -> Dict[str, Union[str, dict]]:
+        """Fetch multiple Anilist data at once, the request will be merged into
+        a single ``id_in`` query for every 50 IDs.
+
+        :param ani_ids: Anilist IDs
+        :type ani_ids: Iterable[StrInt]
+        :param jadwal_only: Return jadwal only, defaults to False
+        :type jadwal_only: bool, optional
+        :param return_only_time: Return only time, defaults to False
+        :type return_only_time: bool, optional
+        :return: A mapping of the Anilist ID and the results or an error message
+        :rtype: Dict[str, Union[str, dict]]
+        """
+        if not return_only_time and not jadwal_only:
+            raise ValueError("Batched fetch need the `return_only_xxx` or `jadwal_only` attribute to be True")
+
+        all_media = await self.anibucket.batch_media(ani_ids, anifetch_fields)
+        results: Dict[str, Union[str, dict]] = {}
+        for ani_id, entries in all_media.items():
+            if entries is None:
+                results[str(ani_id)] = "Tidak ada hasil"
+                continue
+            try:
+                results[str(ani_id)] = self.parse_anilist(
+                    entries, jadwal_only=jadwal_only, return_only_time=return_only_time
+                )
+            except ValueError as exc:
+                self.logger.warning(f"Failed to parse {ani_id}: {exc}")
+                results[str(ani_id)] = "Tidak ada hasil"
+        return results
+
+    def parse_anilist(
+        self,
+        entries: dict,
+        current_episode: Optional[StrInt] = None,
+        total_episode: Optional[StrInt] = None,
+        jadwal_only=False,
+        return_only_time=False,
+    ) -> dict:
+        """Parse the raw Anilist media data, see :meth:`fetch_anilist` for the parameters
+
+        :param entries: The raw media data
+        :type entries: dict
+        :return: Return results
+        :rtype: dict
+        """
+        self.logger.info(f"Parsing info for {entries['id']}")
         real_title = complex_walk(entries, "title.romaji")
         if real_title is None:
             real_title = complex_walk(entries, "title.english")
@@ -237,6 +310,8 @@ class ShowtimesCogsBases:
                 air_data["episode"] = complex_walk(next_air_episode, "episode")
                 airing_at = complex_walk(next_air_episode, "airingAt")
                 if airing_at is not None:
+                    # The data might be cached, so recalculate it from the absolute time.
+                    air_data["time_until"] = airing_at - arrow.utcnow().int_timestamp
                     compiled_data["episode_status"] = utctime_to_timeleft(airing_at)
             compiled_data["next_airing"] = air_data
             return compiled_data
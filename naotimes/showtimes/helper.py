@@ -24,14 +24,16 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from odmantic import AIOEngine
 from odmantic.exceptions import DocumentNotFoundError
-from pymongo.errors import PyMongoError
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
 from ..models import ShowAdminSchema, ShowtimesSchema, ShowtimesUISchema, ShowUIPrivilege
 from ..utils import generate_custom_code
@@ -42,6 +44,16 @@ if TYPE_CHECKING:
 
 __all__ = ("naoTimesDB",)
 
+SyncResult = Tuple[bool, str]
+
+
+def _to_mongo_paths(paths: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the dirty paths value to the same type as the stored document"""
+    announce_channel = paths.get("announce_channel")
+    if announce_channel is not None:
+        paths["announce_channel"] = str(announce_channel)
+    return paths
+
 
 class naoTimesDB:
     """
@@ -80,6 +92,22 @@ class naoTimesDB:
         self.srv_re = {"name": {"$regex": r"^srv"}}
         self._lock_collection: Dict[str, ShowtimesLock] = {}
 
+        # Sync engine, dirty server are coalesced and written in bulk.
+        self._sync_debounce = 0.25
+        self._sync_max_retries = 5
+        self._sync_pending: Dict[str, Showtimes] = {}
+        self._sync_waiters: Dict[str, List[asyncio.Future[SyncResult]]] = {}
+        self._sync_retries: Dict[str, int] = {}
+        # The server that failed to be written is retried after this time (monotonic)
+        self._sync_retry_at: Dict[str, float] = {}
+        self._sync_wakeup: Optional[asyncio.TimerHandle] = None
+        # The server that is known to be in the database with the same data as the model it was loaded from,
+        # the partial update is only safe for these server, the other will be fully replaced.
+        self._sync_known: Dict[str, Any] = {}
+        self._sync_replace: Set[str] = set()
+        self._sync_event: Optional[asyncio.Event] = None
+        self._sync_task: Optional[asyncio.Task] = None
+
     def generate_url(self):
         self._url = "mongodb"
         if self._tls:
@@ -201,6 +229,7 @@ class naoTimesDB:
         json_data = {}
         as_json = []
         for data in all_data:
+            self._sync_known[data.id] = data.mongo_id
             as_json.append(data.dict())
         json_data["servers"] = as_json
         json_data["supermod"] = await self.get_top_admin()
@@ -210,11 +239,200 @@ class naoTimesDB:
     async def get_server(self, server: str):
         server = str(server)
         real_data, _ = await self.fetch_data(server)
+        self._sync_known[server] = real_data.mongo_id
         return Showtimes.from_dict(real_data.dict())
 
-    async def update_server(self, data: Showtimes):
-        show_dict = data.serialize()
-        return await self.update_data(show_dict)
+    def queue_server(self, data: Showtimes) -> asyncio.Future[SyncResult]:
+        """Mark a server as dirty and queue it to the sync engine
+
+        Multiple call for the same server before it's written will be coalesced,
+        only the latest data will be written to the database.
+
+        :param data: The server data
+        :type data: Showtimes
+        :return: A future that will be resolved when the data is persisted or failed to be persisted
+        :rtype: asyncio.Future[Tuple[bool, str]]
+        """
+        loop = asyncio.get_event_loop()
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_event = asyncio.Event()
+            self._sync_task = loop.create_task(self._sync_jobs())
+        server_id = str(data.id)
+        waiter = loop.create_future()
+        pending = self._sync_pending.get(server_id)
+        if pending is not None and pending is not data:
+            # The changes of the older object is not tracked by the newer one.
+            self._sync_replace.add(server_id)
+        self._sync_pending[server_id] = data
+        self._sync_waiters.setdefault(server_id, []).append(waiter)
+        self._sync_event.set()
+        return waiter
+
+    async def update_server(self, data: Showtimes) -> SyncResult:
+        """Update a server data, this will wait until the data is persisted
+
+        :param data: The server data
+        :type data: Showtimes
+        :return: The status of the update and the message
+        :rtype: Tuple[bool, str]
+        """
+        return await self.queue_server(data)
+
+    async def update_servers(self, datas: List[Showtimes]) -> List[SyncResult]:
+        """Update multiple server data at once, this will wait until all of the data is persisted
+
+        :param datas: The servers data
+        :type datas: List[Showtimes]
+        :return: The status of the update and the message, in the same order as the provided data
+        :rtype: List[Tuple[bool, str]]
+        """
+        return list(await asyncio.gather(*[self.queue_server(data) for data in datas]))
+
+    def _resolve_sync(self, waiters: List[asyncio.Future[SyncResult]], result: SyncResult):
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(result)
+
+    def _build_sync_operation(self, server_id: str, data: Showtimes):
+        """Create the write operation of a server
+
+        The partial update is created from the dirty paths of the model, and the model is
+        marked clean once the operation is built so the changes made while writing is tracked
+        for the next sync.
+        If the database state is unknown, the whole document is replaced instead.
+        """
+        if server_id in self._sync_replace or self._sync_known.get(server_id) != data.mongo_id:
+            document = ShowtimesSchema.parse_doc(data.serialize()).doc()
+            data.mark_clean()
+            self._sync_replace.discard(server_id)
+            return ReplaceOne({"_id": document["_id"]}, document, upsert=True)
+        changed = data.dirty_paths()
+        if not changed:
+            return None
+        operation = UpdateOne({"_id": data.mongo_id}, {"$set": _to_mongo_paths(changed)})
+        data.mark_clean()
+        return operation
+
+    async def _flush_sync(self, force: bool = False) -> bool:
+        """Write all the pending dirty server, returns True if everything is written.
+
+        Server that is still in the retry backoff is skipped unless ``force`` is True.
+        """
+        current = time.monotonic()
+        batch: Dict[str, Showtimes] = {}
+        waiters: Dict[str, List[asyncio.Future[SyncResult]]] = {}
+        for server_id in list(self._sync_pending.keys()):
+            if not force and self._sync_retry_at.get(server_id, 0.0) > current:
+                continue
+            batch[server_id] = self._sync_pending.pop(server_id)
+            waiters[server_id] = self._sync_waiters.pop(server_id, [])
+
+        operations = []
+        operation_ids: List[str] = []
+        for server_id, data in batch.items():
+            try:
+                operation = self._build_sync_operation(server_id, data)
+            except Exception as e:
+                self.logger.error(f"{server_id}: failed to validate data for sync", exc_info=e)
+                # The model might be already marked clean, replace the whole document next time.
+                self._sync_replace.add(server_id)
+                self._resolve_sync(waiters.get(server_id, []), (False, f"Data tidak valid: {e}"))
+                continue
+            if operation is None:
+                self._resolve_sync(waiters.get(server_id, []), (True, "Sukses"))
+                continue
+            operations.append(operation)
+            operation_ids.append(server_id)
+
+        if not operations:
+            return True
+
+        self.logger.info(f"Syncing {len(operations)} server to database...")
+        failed_ids: Dict[str, str] = {}
+        try:
+            await self._db["showtimesdatas"].bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed_ids[operation_ids[write_error["index"]]] = write_error.get("errmsg", str(e))
+        except PyMongoError as e:
+            for server_id in operation_ids:
+                failed_ids[server_id] = e._message
+
+        for server_id in operation_ids:
+            server_waiters = waiters.get(server_id, [])
+            if server_id not in failed_ids:
+                self._sync_known[server_id] = batch[server_id].mongo_id
+                self._sync_retries.pop(server_id, None)
+                self._sync_retry_at.pop(server_id, None)
+                self._resolve_sync(server_waiters, (True, "Sukses"))
+                continue
+            retries = self._sync_retries.get(server_id, 0) + 1
+            message = failed_ids[server_id]
+            # Unknown state of the document and the model is already marked clean, do full replace on the next write.
+            self._sync_replace.add(server_id)
+            if retries >= self._sync_max_retries:
+                self.logger.error(f"{server_id}: failed to sync after {retries} tries: {message}")
+                self._sync_retries.pop(server_id, None)
+                self._sync_retry_at.pop(server_id, None)
+                self._resolve_sync(
+                    server_waiters,
+                    (False, f"Terjadi kesalahan ketika ingin mengupdate database, pesan dari MongoDB: {message}"),
+                )
+                continue
+            self.logger.warning(f"{server_id}: failed to sync (try {retries}), retrying later: {message}")
+            self._sync_retries[server_id] = retries
+            # Only this server is delayed, other server is still written as usual.
+            self._sync_retry_at[server_id] = time.monotonic() + min(2 ** (retries - 1), 30.0)
+            # Put it back, unless there's a newer data queued already.
+            if server_id not in self._sync_pending:
+                self._sync_pending[server_id] = batch[server_id]
+            self._sync_waiters.setdefault(server_id, [])[:0] = server_waiters
+        return not failed_ids
+
+    def _schedule_sync_retry(self):
+        """Wake the sync engine when the earliest failed server can be retried"""
+        if self._sync_wakeup is not None:
+            self._sync_wakeup.cancel()
+            self._sync_wakeup = None
+        if not self._sync_pending:
+            return
+        current = time.monotonic()
+        retry_at = min(self._sync_retry_at.get(server_id, current) for server_id in self._sync_pending)
+        if retry_at <= current:
+            self._sync_event.set()
+            return
+        loop = asyncio.get_event_loop()
+        self._sync_wakeup = loop.call_later(retry_at - current, self._sync_event.set)
+
+    async def _sync_jobs(self):
+        self.logger.info("Starting sync engine task...")
+        while True:
+            try:
+                await self._sync_event.wait()
+                await asyncio.sleep(self._sync_debounce)
+                self._sync_event.clear()
+                await self._flush_sync()
+                self._schedule_sync_retry()
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                self.logger.error("An error occured while syncing database", exc_info=e)
+
+    async def close(self):
+        """Stop the sync engine and flush all of the pending dirty server"""
+        if self._sync_wakeup is not None:
+            self._sync_wakeup.cancel()
+        if self._sync_task is not None and not self._sync_task.done():
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+        if self._sync_pending:
+            self.logger.info(f"Flushing {len(self._sync_pending)} pending sync...")
+            # Avoid retrying forever on shutdown.
+            self._sync_retries = {server_id: self._sync_max_retries for server_id in self._sync_pending}
+            await self._flush_sync(force=True)
 
     async def get_admin(self, user_id: str):
         user_id = str(user_id)
@@ -234,6 +452,12 @@ class naoTimesDB:
 
         show_dict = data.serialize()
         parsed_model = ShowtimesSchema.parse_doc(show_dict)
+        self._sync_pending.pop(server, None)
+        self._sync_retries.pop(server, None)
+        self._sync_retry_at.pop(server, None)
+        self._sync_known.pop(server, None)
+        self._sync_replace.discard(server)
+        self._resolve_sync(self._sync_waiters.pop(server, []), (False, "Server telah dihapus"))
 
         try:
             await self._engine.delete(parsed_model)
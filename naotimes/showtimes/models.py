@@ -28,7 +28,8 @@ import asyncio
 import logging
 import re
 from datetime import timedelta
-from typing import Any, Generator, List, Literal, NamedTuple, Optional, Tuple, Type, Union
+from difflib import SequenceMatcher
+from typing import Any, Dict, Generator, Iterable, List, Literal, Optional, Set, Tuple, Type, Union
 
 import arrow
 import disnake
@@ -54,6 +55,7 @@ __all__ = (
     "ShowtimesLock",
     "ShowtimesPoster",
     "ShowtimesProject",
+    "ShowtimesTracked",
     "ShowtimesOwner",
     "ShowtimesServer",
     "ShowAliases",
@@ -74,23 +76,38 @@ Looped = Generator[T, None, None]
 DiscordUser = (disnake.User, disnake.Member)
 
 
+_BOOL_QUICK_MAP = {
+    "y": True,
+    "yes": True,
+    "1": True,
+    1: True,
+    "true": True,
+    "n": False,
+    "no": False,
+    "0": False,
+    0: False,
+    "false": False,
+}
+# The bit of every role on ShowtimesEpisodeStatusChild flags
+_ROLE_BITS: Tuple[Tuple[ShowRolesUx, int], ...] = (
+    ("TL", 1 << 0),
+    ("TLC", 1 << 1),
+    ("ENC", 1 << 2),
+    ("ED", 1 << 3),
+    ("TM", 1 << 4),
+    ("TS", 1 << 5),
+    ("QC", 1 << 6),
+)
+_ROLE_BITS_MAP = dict(_ROLE_BITS)
+
+
 def to_bool(data: Any) -> bool:
-    quick_map = {
-        "y": True,
-        "yes": True,
-        "1": True,
-        1: True,
-        "true": True,
-        "n": False,
-        "no": False,
-        "0": False,
-        0: False,
-        "false": False,
-    }
+    if data is True or data is False:
+        return data
     if data is not None:
         if isinstance(data, str):
             data = data.lower()
-            return quick_map.get(data, False)
+            return _BOOL_QUICK_MAP.get(data, False)
         elif isinstance(data, int):
             if data > 0:
                 return True
@@ -100,7 +117,126 @@ def to_bool(data: Any) -> bool:
     return False
 
 
-class ShowtimesKonfirmasi:
+class ShowtimesTracked:
+    """A base class for Showtimes models that track their changes.
+
+    Every setter or mutating function marks the serialized key as dirty,
+    which then can be used to emit only the changed paths instead of the full document.
+
+    The change is also propagated to the parent model, so clean subtree can be skipped
+    without walking all of the nested model.
+    """
+
+    __slots__ = ("_dirty", "_parent", "_child_dirty")
+
+    def _mark_dirty(self, *fields: str) -> None:
+        dirty: Optional[Set[str]] = getattr(self, "_dirty", None)
+        if dirty is None:
+            self._dirty = set(fields)
+        else:
+            dirty.update(fields)
+        self._propagate_dirty()
+
+    def _propagate_dirty(self) -> None:
+        parent: Optional[ShowtimesTracked] = getattr(self, "_parent", None)
+        while parent is not None and not getattr(parent, "_child_dirty", False):
+            parent._child_dirty = True
+            parent = getattr(parent, "_parent", None)
+
+    def _attach(self, *children: Optional[ShowtimesTracked]) -> None:
+        """Set the parent of the nested model, must be called every time a nested model is stored."""
+        for child in children:
+            if child is None:
+                continue
+            child._parent = self
+            if getattr(child, "_dirty", None) or getattr(child, "_child_dirty", False):
+                self._child_dirty = True
+                self._propagate_dirty()
+
+    def _dirty_fields(self) -> Set[str]:
+        return getattr(self, "_dirty", None) or set()
+
+    def _dirty_children(self) -> Iterable[Tuple[str, ShowtimesTracked]]:
+        """Yield the key and the nested tracked model"""
+        return []
+
+    def _serialize_field(self, field: str) -> Any:
+        return self.serialize()[field]
+
+    @property
+    def is_dirty(self) -> bool:
+        """bool: Check if the model or any of the nested model has been modified"""
+        if self._dirty_fields():
+            return True
+        if not getattr(self, "_child_dirty", False):
+            return False
+        return any(child.is_dirty for _, child in self._dirty_children())
+
+    def mark_clean(self) -> None:
+        """Mark the model and all of the nested model as clean, call this after the data is saved."""
+        if not self._dirty_fields() and not getattr(self, "_child_dirty", False):
+            return
+        self._dirty = set()
+        self._child_dirty = False
+        for _, child in self._dirty_children():
+            child.mark_clean()
+
+    def dirty_paths(self, prefix: str = "") -> Dict[str, Any]:
+        """Get all of the modified paths with the serialized value of it
+
+        The path is separated with dot, list index is used as the key.
+        If a list is modified (added/removed), the whole list will be emitted.
+
+        :param prefix: The prefix for all of the paths
+        :type prefix: str
+        :return: A dict of the dotted paths and the new value
+        :rtype: Dict[str, Any]
+        """
+        dirty_fields = self._dirty_fields()
+        changed = {}
+        for field in dirty_fields:
+            if "." in field and field.split(".", 1)[0] in dirty_fields:
+                # The whole field is going to be replaced anyway
+                continue
+            changed[prefix + field] = self._serialize_field(field)
+        if not getattr(self, "_child_dirty", False):
+            return changed
+        for key, child in self._dirty_children():
+            if not child._dirty_fields() and not getattr(child, "_child_dirty", False):
+                continue
+            if key in dirty_fields or key.split(".", 1)[0] in dirty_fields:
+                continue
+            changed.update(child.dirty_paths(f"{prefix}{key}."))
+        return changed
+
+    def to_set_document(self) -> Dict[str, Dict[str, Any]]:
+        """Create a MongoDB ``$set`` update document of the modified paths
+
+        :return: The update document, empty if nothing changed
+        :rtype: Dict[str, Dict[str, Any]]
+        """
+        changed = self.dirty_paths()
+        if not changed:
+            return {}
+        return {"$set": changed}
+
+    def to_json_patch(self) -> List[Dict[str, Any]]:
+        """Create a JSON Patch (RFC 6902) operations of the modified paths
+
+        :return: A list of patch operations
+        :rtype: List[Dict[str, Any]]
+        """
+        operations = []
+        for path, value in self.dirty_paths().items():
+            pointer = "/" + "/".join(part.replace("~", "~0").replace("/", "~1") for part in path.split("."))
+            # `add` will replace existing member and create it if missing
+            operations.append({"op": "add", "path": pointer, "value": value})
+        return operations
+
+
+class ShowtimesKonfirmasi(ShowtimesTracked):
+    __slots__ = ("_id", "_server_id", "_anime_id")
+
     def __init__(self, id: str, server_id: int, anime_id: str):
         self._id = id
         self._server_id = server_id
@@ -123,6 +259,7 @@ class ShowtimesKonfirmasi:
     @id.setter
     def id(self, data: str) -> None:
         self._id = data
+        self._mark_dirty("id")
 
     @property
     def server(self) -> int:
@@ -131,6 +268,7 @@ class ShowtimesKonfirmasi:
     @server.setter
     def server(self, data: int) -> None:
         self._server_id = data
+        self._mark_dirty("server_id")
 
     @property
     def anime(self) -> str:
@@ -139,6 +277,7 @@ class ShowtimesKonfirmasi:
     @anime.setter
     def anime(self, data: str) -> None:
         self._anime_id = data
+        self._mark_dirty("anime_id")
 
     def copy(self) -> ShowtimesKonfirmasi:
         return self.from_dict(self.serialize())
@@ -164,7 +303,9 @@ class ShowtimesKonfirmasi:
         return {"id": self.id, "server_id": str(self.server), "anime_id": self.anime}
 
 
-class ShowtimesAssignee:
+class ShowtimesAssignee(ShowtimesTracked):
+    __slots__ = ("_id", "_name")
+
     def __init__(self, id: str = None, name: str = None):
         self._id = id
         self._name = name
@@ -179,11 +320,17 @@ class ShowtimesAssignee:
     @id.setter
     def id(self, data: str) -> None:
         self._id = data
+        self._mark_dirty("id")
 
     @property
     def name(self) -> str:
         return self._name
 
+    @name.setter
+    def name(self, data: str) -> None:
+        self._name = data
+        self._mark_dirty("name")
+
     def copy(self) -> ShowtimesAssignee:
         return self.from_dict(self.serialize())
 
@@ -206,7 +353,9 @@ class ShowtimesAssignee:
         return {"id": id_, "name": self.name}
 
 
-class ShowtimesAssignment:
+class ShowtimesAssignment(ShowtimesTracked):
+    __slots__ = ("_tlor", "_tlcer", "_encoder", "_editor", "_timer", "_tser", "_qcer")
+
     tlor: ShowtimesAssignee
     tlcer: ShowtimesAssignee
     encoder: ShowtimesAssignee
@@ -232,6 +381,7 @@ class ShowtimesAssignment:
         self._timer = timer
         self._tser = tser
         self._qcer = qcer
+        self._attach(tlor, tlcer, encoder, editor, timer, tser, qcer)
 
     def __iter__(self) -> Looped[Tuple[ShowRolesUx, ShowtimesAssignee]]:
         for role, staff in self.serialize().items():
@@ -258,20 +408,29 @@ class ShowtimesAssignment:
             return
         if isinstance(data, ShowtimesAssignee):
             setattr(self, mapping, data)
+            self._attach(data)
+            self._mark_dirty(attr.upper())
         elif isinstance(data, str):
             mapped: Optional[ShowtimesAssignee] = getattr(self, mapping, None)
             if mapped is None:
                 mapped = ShowtimesAssignee(name=data)
+                self._attach(mapped)
+                self._mark_dirty(attr.upper())
             mapped.name = data
             setattr(self, mapping, mapped)
         elif isinstance(data, int):
             mapped: Optional[ShowtimesAssignee] = getattr(self, mapping, None)
             if mapped is None:
                 mapped = ShowtimesAssignee(id=data)
+                self._attach(mapped)
+                self._mark_dirty(attr.upper())
             mapped.id = data
             setattr(self, mapping, mapped)
         elif isinstance(data, DiscordUser):
-            setattr(self, mapping, ShowtimesAssignee(id=data.id, name=data.name))
+            mapped = ShowtimesAssignee(id=data.id, name=data.name)
+            setattr(self, mapping, mapped)
+            self._attach(mapped)
+            self._mark_dirty(attr.upper())
 
     @property
     def tlor(self) -> ShowtimesAssignee:
@@ -357,6 +516,15 @@ class ShowtimesAssignment:
             ShowtimesAssignee(),
         )
 
+    def _dirty_children(self) -> Iterable[Tuple[str, ShowtimesTracked]]:
+        yield "TL", self._tlor
+        yield "TLC", self._tlcer
+        yield "ENC", self._encoder
+        yield "ED", self._editor
+        yield "TM", self._timer
+        yield "TS", self._tser
+        yield "QC", self._qcer
+
     def serialize(self) -> showmodel._ShowtimesProjectAssignmentsDict:
         return {
             "TL": self._tlor.serialize(),
@@ -395,7 +563,14 @@ class ShowtimesAssignment:
         return False
 
 
-class ShowtimesEpisodeStatusChild:
+class ShowtimesEpisodeStatusChild(ShowtimesTracked):
+    """The progress of every role of an episode.
+
+    All of the role are stored as a bitmask, see ``_ROLE_BITS`` for the bit of every role.
+    """
+
+    __slots__ = ("_flags",)
+
     def __init__(
         self,
         tl: bool = False,
@@ -406,20 +581,17 @@ class ShowtimesEpisodeStatusChild:
         ts: bool = False,
         qc: bool = False,
     ):
-        self._tl = tl
-        self._tlc = tlc
-        self._enc = enc
-        self._ed = ed
-        self._tm = tm
-        self._ts = ts
-        self._qc = qc
+        flags = 0
+        for (_, bit), value in zip(_ROLE_BITS, (tl, tlc, enc, ed, tm, ts, qc)):
+            if value:
+                flags |= bit
+        self._flags = flags
 
     def __len__(self):
-        serialized = filter(lambda x: x, self.serialize().values())
-        return len(serialized)
+        return bin(self._flags).count("1")
 
     def __bool__(self):
-        return any(self.serialize().values())
+        return self._flags != 0
 
     def __iter__(self) -> Looped[Tuple[ShowRolesUx, bool]]:
         for status, is_done in self.serialize().items():
@@ -431,133 +603,117 @@ class ShowtimesEpisodeStatusChild:
             infotaiment.append(f"{key}={'true' if value else 'false'}")
         return f"<ShowtimesEpisodeStatusChild {' '.join(infotaiment)}>"
 
+    def _set_flag(self, role: ShowRolesUx, data: Any) -> None:
+        bit = _ROLE_BITS_MAP[role]
+        if to_bool(data):
+            self._flags |= bit
+        else:
+            self._flags &= ~bit
+        self._mark_dirty(role)
+
     @property
     def TL(self) -> bool:
-        return self._tl
+        return bool(self._flags & 1)
 
     @TL.setter
     def TL(self, data: bool) -> None:
-        self._tl = to_bool(data)
+        self._set_flag("TL", data)
 
     @property
     def TLC(self) -> bool:
-        return self._tlc
+        return bool(self._flags & 2)
 
     @TLC.setter
     def TLC(self, data: bool) -> None:
-        self._tlc = to_bool(data)
+        self._set_flag("TLC", data)
 
     @property
     def Encode(self) -> bool:
-        return self._enc
+        return bool(self._flags & 4)
 
     @Encode.setter
     def Encode(self, data: bool) -> None:
-        self._enc = to_bool(data)
+        self._set_flag("ENC", data)
 
     @property
     def Edit(self) -> bool:
-        return self._ed
+        return bool(self._flags & 8)
 
     @Edit.setter
     def Edit(self, data: bool):
-        self._ed = to_bool(data)
+        self._set_flag("ED", data)
 
     @property
     def Timing(self):
-        return self._tm
+        return bool(self._flags & 16)
 
     @Timing.setter
     def Timing(self, data: bool) -> None:
-        self._tm = to_bool(data)
+        self._set_flag("TM", data)
 
     @property
     def TS(self) -> bool:
-        return self._ts
+        return bool(self._flags & 32)
 
     @TS.setter
     def TS(self, data: bool) -> None:
-        self._ts = to_bool(data)
+        self._set_flag("TS", data)
 
     @property
     def QC(self) -> bool:
-        return self._qc
+        return bool(self._flags & 64)
 
     @QC.setter
     def QC(self, data: bool) -> None:
-        self._qc = to_bool(data)
+        self._set_flag("QC", data)
 
     def copy(self) -> ShowtimesEpisodeStatusChild:
-        return self.from_dict(self.serialize())
+        return self._from_flags(self._flags)
+
+    @classmethod
+    def _from_flags(cls: Type[ShowtimesEpisodeStatusChild], flags: int) -> ShowtimesEpisodeStatusChild:
+        new_cls = cls.__new__(cls)
+        new_cls._flags = flags
+        return new_cls
 
     @classmethod
     def from_dict(
         cls: Type[ShowtimesEpisodeStatusChild], data: showmodel._ShowtimesProjectEpisodeStatusProgressDict
     ) -> ShowtimesEpisodeStatusChild:
-        tl = data.get("TL", False)
-        tlc = data.get("TLC", False)
-        enc = data.get("ENC", False)
-        ed = data.get("ED", False)
-        tm = data.get("TM", False)
-        ts = data.get("TS", False)
-        qc = data.get("QC", False)
-        return cls(
-            to_bool(tl),
-            to_bool(tlc),
-            to_bool(enc),
-            to_bool(ed),
-            to_bool(tm),
-            to_bool(ts),
-            to_bool(qc),
-        )
+        flags = 0
+        for role, bit in _ROLE_BITS:
+            value = data.get(role)
+            if value and to_bool(value):
+                flags |= bit
+        return cls._from_flags(flags)
 
     def serialize(self) -> showmodel._ShowtimesProjectEpisodeStatusProgressDict:
+        flags = self._flags
         return {
-            "TL": self._tl,
-            "TLC": self._tlc,
-            "ENC": self._enc,
-            "ED": self._ed,
-            "TM": self._tm,
-            "TS": self._ts,
-            "QC": self._qc,
+            "TL": flags & 1 != 0,
+            "TLC": flags & 2 != 0,
+            "ENC": flags & 4 != 0,
+            "ED": flags & 8 != 0,
+            "TM": flags & 16 != 0,
+            "TS": flags & 32 != 0,
+            "QC": flags & 64 != 0,
         }
 
     def toggle(self, role: ShowRoles, target: bool):
         role = role.upper()
-        if role == "TL":
-            self.TL = target
-        elif role == "TLC":
-            self.TLC = target
-        elif role == "ENC":
-            self.Encode = target
-        elif role == "ED":
-            self.Edit = target
-        elif role == "TM":
-            self.Timing = target
-        elif role == "TS":
-            self.TS = target
-        elif role == "QC":
-            self.QC = target
+        if role in _ROLE_BITS_MAP:
+            self._set_flag(role, target)
 
     def get(self, role: ShowRoles) -> bool:
-        role = role.upper()
-        if role == "TL":
-            return self.TL
-        elif role == "TLC":
-            return self.TLC
-        elif role == "ENC":
-            return self.Encode
-        elif role == "ED":
-            return self.Edit
-        elif role == "TM":
-            return self.Timing
-        elif role == "TS":
-            return self.TS
-        elif role == "QC":
-            return self.QC
-
-
-class ShowtimesEpisodeStatus:
+        bit = _ROLE_BITS_MAP.get(role.upper())
+        if bit is None:
+            return None
+        return bool(self._flags & bit)
+
+
+class ShowtimesEpisodeStatus(ShowtimesTracked):
+    __slots__ = ("_ep", "_progress", "_is_finished", "_airtime")
+
     def __init__(
         self,
         episode: int,
@@ -569,6 +725,7 @@ class ShowtimesEpisodeStatus:
         self._progress = progress
         self._is_finished = is_finished
         self._airtime = airtime
+        self._attach(progress)
 
     def __eq__(self, other: Union[ShowtimesEpisodeStatus, int]) -> bool:
         if isinstance(other, ShowtimesEpisodeStatus):
@@ -609,6 +766,7 @@ class ShowtimesEpisodeStatus:
     @episode.setter
     def episode(self, data: int) -> None:
         self._ep = data
+        self._mark_dirty("episode")
 
     @property
     def progress(self) -> ShowtimesEpisodeStatusChild:
@@ -618,8 +776,12 @@ class ShowtimesEpisodeStatus:
     def progress(self, data: Union[dict, ShowtimesEpisodeStatusChild]) -> None:
         if isinstance(data, dict):
             self._progress = ShowtimesEpisodeStatusChild.from_dict(data)
+            self._attach(self._progress)
+            self._mark_dirty("progress")
         elif isinstance(data, ShowtimesEpisodeStatusChild):
             self._progress = data
+            self._attach(data)
+            self._mark_dirty("progress")
 
     @property
     def finished(self) -> bool:
@@ -628,6 +790,7 @@ class ShowtimesEpisodeStatus:
     @finished.setter
     def finished(self, data: bool) -> None:
         self._is_finished = data
+        self._mark_dirty("is_done")
 
     @property
     def airtime(self) -> int:
@@ -636,6 +799,7 @@ class ShowtimesEpisodeStatus:
     @airtime.setter
     def airtime(self, data: int) -> None:
         self._airtime = data
+        self._mark_dirty("airtime")
 
     def copy(self) -> ShowtimesEpisodeStatus:
         return self.from_dict(self.serialize())
@@ -644,11 +808,18 @@ class ShowtimesEpisodeStatus:
     def from_dict(
         cls: Type[ShowtimesEpisodeStatus], data: showmodel.ShowtimesProjectEpisodeStatusDict
     ) -> ShowtimesEpisodeStatus:
-        episode = data.get("episode")
-        is_done = data.get("is_done", False)
-        progress = ShowtimesEpisodeStatusChild.from_dict(data.get("progress", {}))
-        airtime = data.get("airtime", None)
-        return cls(episode, progress, airtime, is_done)
+        progress = ShowtimesEpisodeStatusChild.from_dict(data.get("progress") or {})
+        # Skip the __init__ since this is called for every episode of every project
+        new_cls = cls.__new__(cls)
+        new_cls._ep = data.get("episode")
+        new_cls._is_finished = data.get("is_done", False)
+        new_cls._airtime = data.get("airtime", None)
+        new_cls._progress = progress
+        progress._parent = new_cls
+        return new_cls
+
+    def _dirty_children(self) -> Iterable[Tuple[str, ShowtimesTracked]]:
+        yield "progress", self._progress
 
     def serialize(self) -> showmodel.ShowtimesProjectEpisodeStatusDict:
         return {
@@ -659,7 +830,9 @@ class ShowtimesEpisodeStatus:
         }
 
 
-class ShowtimesPoster:
+class ShowtimesPoster(ShowtimesTracked):
+    __slots__ = ("_url", "_color")
+
     def __init__(self, url: str, color: int = 0x1EB5A6):
         self._url = url
         self._color = color
@@ -674,6 +847,7 @@ class ShowtimesPoster:
     @url.setter
     def url(self, data: str) -> None:
         self._url = data
+        self._mark_dirty("url")
 
     @property
     def color(self) -> int:
@@ -682,6 +856,7 @@ class ShowtimesPoster:
     @color.setter
     def color(self, data: int) -> None:
         self._color = data
+        self._mark_dirty("color")
 
     def copy(self) -> ShowtimesPoster:
         return self.from_dict(self.serialize())
@@ -696,7 +871,9 @@ class ShowtimesPoster:
         return {"url": self._url, "color": self._color}
 
 
-class ShowtimesFSDB:
+class ShowtimesFSDB(ShowtimesTracked):
+    __slots__ = ("_uuid", "_anime_id")
+
     def __init__(self, uuid: int, anime_id: int):
         self._uuid = uuid
         self._anime_id = anime_id
@@ -711,6 +888,7 @@ class ShowtimesFSDB:
     @id.setter
     def id(self, data: int) -> None:
         self._uuid = data
+        self._mark_dirty("id")
 
     @property
     def anime(self) -> int:
@@ -719,6 +897,7 @@ class ShowtimesFSDB:
     @anime.setter
     def anime(self, data: int) -> None:
         self._anime_id = data
+        self._mark_dirty("ani_id")
 
     def copy(self) -> ShowtimesFSDB:
         return self.from_dict(self.serialize())
@@ -737,7 +916,22 @@ class ShowtimesFSDB:
         return cls(None, None)
 
 
-class ShowtimesProject:
+class ShowtimesProject(ShowtimesTracked):
+    __slots__ = (
+        "_id",
+        "_title",
+        "_mal_id",
+        "_role_id",
+        "_start_time",
+        "_assignment",
+        "_status",
+        "_poster_data",
+        "_aliases",
+        "_kolaborasi",
+        "_fsdb_data",
+        "_last_update",
+    )
+
     def __init__(
         self,
         id: str,
@@ -764,6 +958,7 @@ class ShowtimesProject:
         self._aliases = aliases
         self._kolaborasi = kolaborasi
         self._fsdb_data = fsdb_data
+        self._attach(assignment, poster_data, fsdb_data, *status)
         if last_update is None:
             self._last_update = arrow.utcnow().int_timestamp
         else:
@@ -801,6 +996,9 @@ class ShowtimesProject:
                     merged.append(m)
         for o in merged:
             self._status.append(o)
+            self._attach(o)
+        if merged:
+            self._mark_dirty("status")
         return self
 
     def __sub__(
@@ -834,6 +1032,7 @@ class ShowtimesProject:
 
     def _updated(self):
         self._last_update = arrow.utcnow().int_timestamp
+        self._mark_dirty("last_update")
 
     update_time = _updated
 
@@ -843,7 +1042,10 @@ class ShowtimesProject:
 
     @id.setter
     def id(self, data: str):
+        old_id = self._id
         self._id = data
+        self._mark_dirty("id")
+        self._reindex(old_id)
 
     @property
     def title(self) -> str:
@@ -852,6 +1054,8 @@ class ShowtimesProject:
     @title.setter
     def title(self, data: str):
         self._title = data
+        self._mark_dirty("title")
+        self._reindex()
 
     @property
     def mal_id(self) -> int:
@@ -860,6 +1064,7 @@ class ShowtimesProject:
     @mal_id.setter
     def mal_id(self, data: int) -> None:
         self._mal_id = int(data)
+        self._mark_dirty("mal_id")
 
     @property
     def role(self):
@@ -869,8 +1074,10 @@ class ShowtimesProject:
     def role(self, data: Union[disnake.Role, int]) -> None:
         if isinstance(data, int):
             self._role_id = data
+            self._mark_dirty("role_id")
         elif isinstance(data, disnake.Role):
             self._role_id = data.id
+            self._mark_dirty("role_id")
 
     @property
     def start_time(self) -> int:
@@ -879,6 +1086,7 @@ class ShowtimesProject:
     @start_time.setter
     def start_time(self, data: int) -> None:
         self._start_time = data
+        self._mark_dirty("start_time")
 
     @property
     def assignment(self) -> ShowtimesAssignment:
@@ -888,10 +1096,14 @@ class ShowtimesProject:
     def assignment(self, data: ShowtimesAssignment) -> None:
         if isinstance(data, ShowtimesAssignment):
             self._assignment = data
+            self._attach(data)
+            self._mark_dirty("assignments")
 
     def update_assignment(self, role: str, data: Union[ShowtimesAssignee, MemberContext, str, int]):
         if not self._assignment:
             self._assignment = ShowtimesAssignment.from_dict({})
+            self._attach(self._assignment)
+            self._mark_dirty("assignments")
         self._assignment._set_assignee(role, data)
 
     @property
@@ -902,6 +1114,8 @@ class ShowtimesProject:
     def status(self, data: Union[ShowtimesEpisodeStatus, List[ShowtimesEpisodeStatus]]) -> None:
         if isinstance(data, list):
             self._status = data
+            self._attach(*data)
+            self._mark_dirty("status")
             self._updated()
         elif isinstance(data, ShowtimesEpisodeStatus):
             ep_index = -1
@@ -910,7 +1124,10 @@ class ShowtimesProject:
                     ep_index = n
                     break
             if ep_index >= 0:
+                if self._status[ep_index] is not data:
+                    self._mark_dirty(f"status.{ep_index}")
                 self._status[ep_index] = data
+                self._attach(data)
                 self._updated()
 
     @property
@@ -927,6 +1144,8 @@ class ShowtimesProject:
         is_episode = self.get_episode(episode.episode)
         if not is_episode:
             self._status.append(episode)
+            self._attach(episode)
+            self._mark_dirty("status")
             self._updated()
 
     def remove_episode(self, episode: Union[ShowtimesEpisodeStatus, int]):
@@ -940,6 +1159,7 @@ class ShowtimesProject:
                 break
         if ep_index >= 0:
             del self._status[ep_index]
+            self._mark_dirty("status")
             self._updated()
 
     def get_current(self) -> Optional[ShowtimesEpisodeStatus]:
@@ -971,9 +1191,13 @@ class ShowtimesProject:
     def poster(self, data: Union[ShowtimesPoster, str, int]) -> None:
         if isinstance(data, ShowtimesPoster):
             self._poster_data = data
+            self._attach(data)
+            self._mark_dirty("poster_data")
         elif isinstance(data, str):
             if self._poster_data is None:
                 self._poster_data = ShowtimesPoster(data)
+                self._attach(self._poster_data)
+                self._mark_dirty("poster_data")
             else:
                 self._poster_data.url = data
         elif isinstance(data, int):
@@ -988,10 +1212,20 @@ class ShowtimesProject:
     def add_alias(self, alias: str):
         if alias not in self._aliases:
             self._aliases.append(alias)
+            self._mark_dirty("aliases")
+            self._reindex()
 
     def remove_alias(self, alias: str):
         if alias in self._aliases:
             self._aliases.remove(alias)
+            self._mark_dirty("aliases")
+            self._reindex()
+
+    def _reindex(self, old_id: Optional[str] = None):
+        """Notify the parent search index that the searchable fields of this project changed."""
+        parent = getattr(self, "_parent", None)
+        if isinstance(parent, Showtimes):
+            parent._reindex_project(self, old_id)
 
     @property
     def kolaborasi(self) -> ShowKolaborasi:
@@ -1003,14 +1237,17 @@ class ShowtimesProject:
             self.add_kolaborator(data)
         elif isinstance(data, list):
             self._kolaborasi = data
+            self._mark_dirty("kolaborasi")
 
     def add_kolaborator(self, kolaborator: int):
         if kolaborator not in self._kolaborasi:
             self._kolaborasi.append(kolaborator)
+            self._mark_dirty("kolaborasi")
 
     def remove_kolaborator(self, kolaborator: int) -> Optional[int]:
         if kolaborator in self._kolaborasi:
             self._kolaborasi.remove(kolaborator)
+            self._mark_dirty("kolaborasi")
             return kolaborator
         return None
 
@@ -1021,6 +1258,8 @@ class ShowtimesProject:
     @fsdb.setter
     def fsdb(self, data: ShowtimesFSDB) -> None:
         self._fsdb_data = data
+        self._attach(data)
+        self._mark_dirty("fsdb_data")
 
     @property
     def last_update(self) -> int:
@@ -1044,9 +1283,7 @@ class ShowtimesProject:
             role_id = None
         start_time = data.get("start_time")
         assignements = ShowtimesAssignment.from_dict(data.get("assignments"))
-        all_status = []
-        for status_data in data.get("status", []):
-            all_status.append(ShowtimesEpisodeStatus.from_dict(status_data))
+        all_status = list(map(ShowtimesEpisodeStatus.from_dict, data.get("status", [])))
         aliases = data.get("aliases", [])
         poster_data = ShowtimesPoster.from_dict(data.get("poster_data", {}))
         fsdb_data = None
@@ -1088,6 +1325,41 @@ class ShowtimesProject:
             None,
         )
 
+    def _dirty_children(self) -> Iterable[Tuple[str, ShowtimesTracked]]:
+        if self._assignment is not None:
+            yield "assignments", self._assignment
+        if self._poster_data is not None:
+            yield "poster_data", self._poster_data
+        if self._fsdb_data is not None:
+            yield "fsdb_data", self._fsdb_data
+        for index, status in enumerate(self._status):
+            yield f"status.{index}", status
+
+    def _serialize_field(self, field: str) -> Any:
+        if field.startswith("status."):
+            return self._status[int(field[7:])].serialize()
+        if field == "status":
+            return [status.serialize() for status in self._status]
+        if field == "assignments":
+            return self._assignment.serialize()
+        if field == "poster_data":
+            return self._poster_data.serialize()
+        if field == "fsdb_data":
+            return self._fsdb_data.serialize() if self._fsdb_data is not None else None
+        if field == "role_id":
+            return str(self._role_id) if self._role_id else self._role_id
+        if field == "kolaborasi":
+            return list(map(str, self._kolaborasi))
+        simple_fields = {
+            "id": self._id,
+            "mal_id": self._mal_id,
+            "title": self._title,
+            "start_time": self._start_time,
+            "aliases": self._aliases,
+            "last_update": self._last_update,
+        }
+        return simple_fields[field]
+
     def serialize(self) -> showmodel.ShowtimesProjectDict:
         all_status: List[showmodel.ShowtimesProjectEpisodeStatusDict] = []
         for status in self._status:
@@ -1116,6 +1388,7 @@ class ShowtimesProject:
         return self.from_dict(self.serialize())
 
     def update(self, data: ShowtimesProject, only_data: bool = True):
+        old_id = self._id
         self._id = data.id
         self._mal_id = data.mal_id
         self._title = data.title
@@ -1125,30 +1398,248 @@ class ShowtimesProject:
         self._poster_data = data.poster
         self._aliases = data.aliases
         self._kolaborasi = data.kolaborasi
+        self._attach(self._assignment, self._poster_data, *self._status)
+        self._mark_dirty(
+            "id", "mal_id", "title", "start_time", "assignments", "status", "poster_data", "aliases", "kolaborasi"
+        )
         self._updated()
+        self._reindex(old_id)
 
         if not only_data:
             self._role_id = data.role
             self._fsdb_data = data.fsdb
+            self._attach(self._fsdb_data)
+            self._mark_dirty("role_id", "fsdb_data")
+
+
+class ShowtimesSearchIndex:
+    """A per-server search index of the project titles and aliases.
+
+    The index is built once and updated incrementally every time a project
+    is added, removed, renamed or got a new alias, so searching does not need
+    to rebuild and recompile every title on each call.
+
+    Every title and alias is split into trigrams, a query of 3 or more characters
+    only check the project that have all of the query trigrams. Shorter query will
+    check every project, which is O(n) to the amount of project in the server.
+
+    Matches are ranked in this order: exact match, prefix, word prefix, substring.
+    Fuzzy matching is only used if it's requested and nothing else matched.
+    """
+
+    __slots__ = (
+        "_projects",
+        "_entries",
+        "_titles",
+        "_indexed_titles",
+        "_grams",
+        "_project_grams",
+        "_order",
+        "_counter",
+        "fuzzy_cutoff",
+    )
+
+    GRAM_SIZE = 3
+
+    def __init__(self, projects: Iterable[ShowtimesProject] = [], fuzzy_cutoff: float = 0.6):
+        self._projects: Dict[str, ShowtimesProject] = {}
+        self._entries: Dict[str, List[Tuple[str, bool]]] = {}
+        self._titles: Dict[str, List[str]] = {}
+        self._indexed_titles: Dict[str, str] = {}
+        self._grams: Dict[str, Set[str]] = {}
+        self._project_grams: Dict[str, Set[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._counter = 0
+        self.fuzzy_cutoff = fuzzy_cutoff
+        for project in projects:
+            self.add(project)
 
+    def __len__(self) -> int:
+        return len(self._projects)
 
-class ShowtimesSearch(NamedTuple):
-    id: str
-    index: int
-    title: str
-    real_title: str = None
-    type: Literal["real", "alias"] = "real"
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self._projects
 
-    def match(self, target: str) -> bool:
-        target_clean = re.escape(target)
-        target_compiler = re.compile("({})".format(target_clean), re.IGNORECASE)
-        matched = target_compiler.search(self.title)
-        if matched is None:
-            return False
-        return True
+    def _add_title(self, title: str, project_id: str):
+        self._titles.setdefault(title, []).append(project_id)
+
+    def _remove_title(self, title: str, project_id: str):
+        title_ids = self._titles.get(title)
+        if title_ids is None:
+            return
+        try:
+            title_ids.remove(project_id)
+        except ValueError:
+            pass
+        if not title_ids:
+            del self._titles[title]
+
+    @classmethod
+    def _split_grams(cls, text: str) -> Set[str]:
+        return {text[i : i + cls.GRAM_SIZE] for i in range(len(text) - cls.GRAM_SIZE + 1)}
+
+    def _remove_grams(self, project_id: str):
+        for gram in self._project_grams.pop(project_id, ()):
+            gram_ids = self._grams.get(gram)
+            if gram_ids is None:
+                continue
+            gram_ids.discard(project_id)
+            if not gram_ids:
+                del self._grams[gram]
+
+    def add(self, project: ShowtimesProject):
+        """Add or replace a project in the index
+
+        :param project: The project to be indexed
+        :type project: ShowtimesProject
+        """
+        indexed_title = self._indexed_titles.get(project.id)
+        if indexed_title is not None:
+            self._remove_title(indexed_title, project.id)
+        self._projects[project.id] = project
+        entries = [(project.title.casefold(), False)]
+        for alias in project.aliases:
+            entries.append((alias.casefold(), True))
+        self._entries[project.id] = entries
+        self._indexed_titles[project.id] = project.title
+        self._add_title(project.title, project.id)
+        self._remove_grams(project.id)
+        project_grams: Set[str] = set()
+        for text, _ in entries:
+            project_grams.update(self._split_grams(text))
+        for gram in project_grams:
+            self._grams.setdefault(gram, set()).add(project.id)
+        self._project_grams[project.id] = project_grams
+        if project.id not in self._order:
+            self._order[project.id] = self._counter
+            self._counter += 1
+
+    def remove(self, project_id: str) -> Optional[ShowtimesProject]:
+        """Remove a project from the index
+
+        :param project_id: The project ID
+        :type project_id: str
+        :return: The removed project, or None if it's not indexed
+        :rtype: Optional[ShowtimesProject]
+        """
+        project = self._projects.pop(project_id, None)
+        if project is None:
+            return None
+        self._entries.pop(project_id, None)
+        self._order.pop(project_id, None)
+        self._remove_grams(project_id)
+        self._remove_title(self._indexed_titles.pop(project_id, project.title), project_id)
+        return project
+
+    def update(self, project: ShowtimesProject, old_id: Optional[str] = None):
+        """Reindex a project after the title, aliases or ID is changed
+
+        :param project: The changed project
+        :type project: ShowtimesProject
+        :param old_id: The previous ID if the ID is changed, defaults to None
+        :type old_id: Optional[str], optional
+        """
+        indexed_id = project.id if old_id is None else old_id
+        # Ignore stale project that has been replaced or removed from the server.
+        if self._projects.get(indexed_id) is not project:
+            return
+        if indexed_id != project.id:
+            self.remove(indexed_id)
+        self.add(project)
 
+    def get(self, project_id: str) -> Optional[ShowtimesProject]:
+        return self._projects.get(project_id)
+
+    def exact(self, title: str) -> Optional[ShowtimesProject]:
+        title_ids = self._titles.get(title)
+        if not title_ids:
+            return None
+        return self._projects.get(title_ids[0])
+
+    def _candidates(self, needle: str) -> Iterable[str]:
+        if len(needle) < self.GRAM_SIZE:
+            return self._entries.keys()
+        postings = []
+        for gram in self._split_grams(needle):
+            gram_ids = self._grams.get(gram)
+            if not gram_ids:
+                return []
+            postings.append(gram_ids)
+        postings.sort(key=len)
+        return set.intersection(*postings)
+
+    def search(self, query: str, ignore_alias: bool = False, fuzzy: bool = False) -> List[ShowtimesProject]:
+        """Search the index for a project, case-insensitive.
+
+        :param query: The title or part of the title to search
+        :type query: str
+        :param ignore_alias: Do not match against the project aliases, defaults to False
+        :type ignore_alias: bool, optional
+        :param fuzzy: Fallback to fuzzy matching if nothing matched, defaults to False
+        :type fuzzy: bool, optional
+        :return: A ranked list of the matching projects, best match first
+        :rtype: List[ShowtimesProject]
+        """
+        needle = query.casefold()
+        ranked: Dict[str, Tuple[int, bool, int, int, int]] = {}
+        for project_id in self._candidates(needle):
+            entries = self._entries[project_id]
+            best = None
+            for text, is_alias in entries:
+                if is_alias and ignore_alias:
+                    continue
+                position = text.find(needle)
+                if position < 0:
+                    continue
+                if position == 0:
+                    tier = 0 if len(text) == len(needle) else 1
+                elif not text[position - 1].isalnum():
+                    tier = 2
+                else:
+                    tier = 3
+                rank = (tier, is_alias, position, len(text), self._order[project_id])
+                if best is None or rank < best:
+                    best = rank
+            if best is not None:
+                ranked[project_id] = best
+
+        if fuzzy and not ranked and needle and self.fuzzy_cutoff < 1.0:
+            matcher = SequenceMatcher()
+            matcher.set_seq2(needle)
+            for project_id, entries in self._entries.items():
+                best = None
+                for text, is_alias in entries:
+                    if is_alias and ignore_alias:
+                        continue
+                    matcher.set_seq1(text)
+                    if matcher.real_quick_ratio() < self.fuzzy_cutoff or matcher.quick_ratio() < self.fuzzy_cutoff:
+                        continue
+                    ratio = matcher.ratio()
+                    if ratio < self.fuzzy_cutoff:
+                        continue
+                    rank = (4, is_alias, -int(ratio * 1000), len(text), self._order[project_id])
+                    if best is None or rank < best:
+                        best = rank
+                if best is not None:
+                    ranked[project_id] = best
+
+        # The same rank will use the project insertion order.
+        return [self._projects[project_id] for project_id in sorted(ranked, key=ranked.__getitem__)]
+
+
+class Showtimes(ShowtimesTracked):
+    __slots__ = (
+        "_mongo_id",
+        "_id",
+        "_projects",
+        "_admins",
+        "_confirmations",
+        "_announce_channel",
+        "_name",
+        "_fsdb_id",
+        "_search_index",
+    )
 
-class Showtimes:
     def __init__(
         self,
         id: int,
@@ -1167,6 +1658,8 @@ class Showtimes:
         self._announce_channel = announce_channel
         self._name = name
         self._fsdb_id = fsdb_id
+        self._search_index: Optional[ShowtimesSearchIndex] = None
+        self._attach(*projects, *konfirmasi)
 
     def __eq__(self, other: Union[Showtimes, int]) -> bool:
         if isinstance(other, Showtimes):
@@ -1216,14 +1709,16 @@ class Showtimes:
     def __len__(self) -> int:
         return len(self._projects)
 
-    def __propagate_all_titles(self, ignore_alias: bool = False) -> List[ShowtimesSearch]:
-        propagated = []
-        for index, anime_data in enumerate(self._projects):
-            propagated.append(ShowtimesSearch(anime_data.id, index, anime_data.title, "real"))
-            if not ignore_alias:
-                for alias in anime_data.aliases:
-                    propagated.append(ShowtimesSearch(anime_data.id, index, alias, anime_data.title, "alias"))
-        return propagated
+    @property
+    def search_index(self) -> ShowtimesSearchIndex:
+        """The search index of the projects, lazily built on first access."""
+        if self._search_index is None:
+            self._search_index = ShowtimesSearchIndex(self._projects)
+        return self._search_index
+
+    def _reindex_project(self, project: ShowtimesProject, old_id: Optional[str] = None):
+        if self._search_index is not None:
+            self._search_index.update(project, old_id)
 
     @property
     def id(self) -> int:
@@ -1247,27 +1742,17 @@ class Showtimes:
         return self._projects
 
     def get_project(self, other: Union[str, ShowtimesProject]) -> Optional[ShowtimesProject]:
-        for project in self._projects:
-            if project == other:
-                return project
-        return None
+        if isinstance(other, ShowtimesProject):
+            other = other.id
+        if not isinstance(other, str):
+            return None
+        return self.search_index.get(other)
 
-    def find_projects(self, title: str, ignore_alias: bool = False) -> List[ShowtimesProject]:
-        propagated = self.__propagate_all_titles(ignore_alias)
-        matched = list(filter(lambda x: x.match(title), propagated))
-        deduplicated: List[ShowtimesProject] = []
-        dedup_idx: List[int] = []
-        for match in matched:
-            if match.index not in dedup_idx:
-                deduplicated.append(self._projects[match.index])
-                dedup_idx.append(match.index)
-        return deduplicated
+    def find_projects(self, title: str, ignore_alias: bool = False, fuzzy: bool = False) -> List[ShowtimesProject]:
+        return self.search_index.search(title, ignore_alias, fuzzy)
 
     def exact_match(self, title: str) -> Optional[ShowtimesProject]:
-        for project in self._projects:
-            if project.title == title:
-                return project
-        return None
+        return self.search_index.exact(title)
 
     def update_project(self, project: ShowtimesProject, only_data: bool = True):
         index = -1
@@ -1279,13 +1764,24 @@ class Showtimes:
             old_project = self._projects[index].copy()
             old_project.update(project, only_data)
             self._projects[index] = old_project
+            self._attach(old_project)
+            self._mark_dirty(f"anime.{index}")
+            if self._search_index is not None:
+                self._search_index.add(old_project)
         else:
             self._projects.append(project)
+            self._attach(project)
+            self._mark_dirty("anime")
+            if self._search_index is not None:
+                self._search_index.add(project)
 
     def add_project(self, project: ShowtimesProject):
-        if project.id in [p.id for p in self._projects]:
+        if project.id in self.search_index:
             return
         self._projects.append(project)
+        self._attach(project)
+        self._mark_dirty("anime")
+        self._search_index.add(project)
 
     def remove_project(self, project: Union[str, ShowtimesProject]):
         proj_id: str = project
@@ -1298,6 +1794,9 @@ class Showtimes:
                 break
         if index >= 0:
             del self._projects[index]
+            self._mark_dirty("anime")
+            if self._search_index is not None:
+                self._search_index.remove(proj_id)
 
     @property
     def admins(self) -> ShowtimesOwner:
@@ -1314,17 +1813,21 @@ class Showtimes:
         if isinstance(user, int):
             if user not in self._admins:
                 self._admins.append(user)
+                self._mark_dirty("serverowner")
         elif isinstance(user, DiscordUser):
             if user.id not in self._admins:
                 self._admins.append(user.id)
+                self._mark_dirty("serverowner")
 
     def remove_admin(self, user: Union[int, MemberContext]):
         if isinstance(user, int):
             if user in self._admins:
                 self._admins.remove(user)
+                self._mark_dirty("serverowner")
         elif isinstance(user, DiscordUser):
             if user.id in self._admins:
                 self._admins.remove(user.id)
+                self._mark_dirty("serverowner")
 
     @property
     def konfirmasi(self) -> List[ShowtimesKonfirmasi]:
@@ -1340,6 +1843,8 @@ class Showtimes:
         matched = len(list(filter(lambda x: x == konfirm, self._confirmations)))
         if matched < 1:
             self._confirmations.append(konfirm)
+            self._attach(konfirm)
+            self._mark_dirty("konfirmasi")
 
     def remove_konfirm(self, konfirm: Union[ShowtimesKonfirmasi, str]):
         idx = -1
@@ -1349,6 +1854,7 @@ class Showtimes:
                 break
         if idx >= 0:
             del self._confirmations[idx]
+            self._mark_dirty("konfirmasi")
 
     @property
     def announcer(self) -> Optional[int]:
@@ -1358,8 +1864,10 @@ class Showtimes:
     def announcer(self, data: Union[int, disnake.TextChannel]):
         if isinstance(data, disnake.TextChannel):
             self._announce_channel = data.id
+            self._mark_dirty("announce_channel")
         elif isinstance(data, int):
             self._announce_channel = data
+            self._mark_dirty("announce_channel")
 
     @property
     def name(self) -> Optional[str]:
@@ -1368,6 +1876,7 @@ class Showtimes:
     @name.setter
     def name(self, data: str):
         self._name = data
+        self._mark_dirty("name")
 
     @property
     def fsdb_id(self) -> Optional[int]:
@@ -1376,6 +1885,7 @@ class Showtimes:
     @fsdb_id.setter
     def fsdb_id(self, data: int):
         self._fsdb_id = data
+        self._mark_dirty("fsdb_id")
 
     def copy(self) -> Showtimes:
         return self.from_dict(self.serialize())
@@ -1392,14 +1902,8 @@ class Showtimes:
                 announcer = None
         server_owner = data.get("serverowner", [])
         server_owner = list(map(int, server_owner))
-        projects = data.get("anime", [])
-        parsed_project = []
-        for project in projects:
-            parsed_project.append(ShowtimesProject.from_dict(project))
-        konfirmasi = data.get("konfirmasi", [])
-        parsed_konfirm = []
-        for konfirm in konfirmasi:
-            parsed_konfirm.append(ShowtimesKonfirmasi.from_dict(konfirm))
+        parsed_project = list(map(ShowtimesProject.from_dict, data.get("anime", [])))
+        parsed_konfirm = list(map(ShowtimesKonfirmasi.from_dict, data.get("konfirmasi", [])))
         fsdb_id = data.get("fsdb_id")
         db_id = data.get("_id", data.get("mongo_id"))
         if db_id is None:
@@ -1418,6 +1922,26 @@ class Showtimes:
         new_cls.mongo_id = db_id
         return new_cls
 
+    def _dirty_children(self) -> Iterable[Tuple[str, ShowtimesTracked]]:
+        for index, project in enumerate(self._projects):
+            yield f"anime.{index}", project
+        for index, konfirm in enumerate(self._confirmations):
+            yield f"konfirmasi.{index}", konfirm
+
+    def _serialize_field(self, field: str) -> Any:
+        if field.startswith("anime."):
+            return self._projects[int(field[6:])].serialize()
+        if field == "anime":
+            return [project.serialize() for project in self._projects]
+        if field == "konfirmasi":
+            return [konfirm.serialize() for konfirm in self._confirmations]
+        if field == "serverowner":
+            return list(map(str, self._admins))
+        if field == "announce_channel":
+            return self._announce_channel if isinstance(self._announce_channel, int) else None
+        simple_fields = {"id": str(self.id), "name": self._name, "fsdb_id": self._fsdb_id}
+        return simple_fields[field]
+
     def serialize(self) -> showmodel.ShowtimesDict:
         all_projects = list(map(lambda x: x.serialize(), self._projects))
         all_confirms = list(map(lambda x: x.serialize(), self._confirmations))
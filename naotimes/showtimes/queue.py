@@ -24,7 +24,9 @@ SOFTWARE.
 
 import asyncio
 import logging
-from typing import Dict
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
 
 import aioredis
 
@@ -34,33 +36,173 @@ from .models import Showtimes, ShowtimesLock
 __all__ = ("ShowtimesQueue",)
 
 
+class ShowtimesCache:
+    """A bounded LRU cache of deserialized :class:`Showtimes` with TTL.
+
+    The cached object is shared between every reader, so it must not be modified.
+    """
+
+    def __init__(self, max_size: int = 128, ttl: float = 300.0):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, Showtimes]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, server_id: str):
+        return str(server_id) in self._data
+
+    def get(self, server_id: str) -> Optional[Showtimes]:
+        server_id = str(server_id)
+        cached = self._data.get(server_id)
+        if cached is None:
+            self.misses += 1
+            return None
+        expires_at, data = cached
+        if expires_at < time.monotonic():
+            del self._data[server_id]
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._data.move_to_end(server_id)
+        self.hits += 1
+        return data
+
+    def set(self, server_id: str, data: Showtimes):
+        server_id = str(server_id)
+        self._data[server_id] = (time.monotonic() + self._ttl, data)
+        self._data.move_to_end(server_id)
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, server_id: str = None):
+        if server_id is None:
+            self._data.clear()
+            return
+        self._data.pop(str(server_id), None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._data),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+
 class ShowtimesQueue:
     """A helper to queue save local showtimes database.
 
-    Use asyncio.Queue and asyncio.Task
+    The save is done in the background with coalescing write-behind, only the latest
+    snapshot of every server is kept, and all of the pending servers are written
+    in a single Redis round trip after a short debounce window.
+
+    Read-only fetch will be served from an in-process LRU cache of the deserialized data,
+    the cache will be invalidated every time a new save job is added or when the data is saved.
     """
 
     _PREFIX = "showtimes_"
+    # The maximum delay between retrying a failed flush
+    MAX_RETRY_DELAY = 60.0
+    # Only log the failed flush once per this many seconds
+    FAILURE_LOG_INTERVAL = 60.0
 
-    def __init__(self, redis_client: RedisBridge, loop=None):
+    def __init__(
+        self,
+        redis_client: RedisBridge,
+        loop=None,
+        cache_size: int = 128,
+        cache_ttl: float = 300.0,
+        debounce: float = 0.5,
+    ):
         self._db: RedisBridge = redis_client
 
         self._loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
         self._logger = logging.getLogger("naoTimes.Showtimes.Queue")
 
-        self._showqueue = asyncio.Queue[Showtimes]()
+        self._debounce = debounce
+        self._pending: Dict[str, Showtimes] = {}
+        # The serialized snapshot and the read-only copy of the pending data, reset on every add_job
+        self._pending_serialized: Dict[str, dict] = {}
+        self._pending_views: Dict[str, Showtimes] = {}
+        self._pending_event = asyncio.Event()
         self._showtasks: asyncio.Task = asyncio.Task(self.background_jobs(), loop=self._loop)
 
         self._lock_collection: Dict[str, ShowtimesLock] = {}
+        self._cache = ShowtimesCache(cache_size, cache_ttl)
+
+        self._flush_count = 0
+        self._flush_failed = 0
+        self._consecutive_failures = 0
+        self._last_failure_log = 0.0
+        self._written_count = 0
+        self._coalesced_count = 0
+        self._last_flush_latency = 0.0
+        self._total_flush_latency = 0.0
+        self._max_flush_latency = 0.0
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Dict[str, int]: The hit/miss/eviction counter of the read cache"""
+        return self._cache.stats()
+
+    @property
+    def queue_stats(self) -> Dict[str, Union[int, float]]:
+        """Dict[str, Union[int, float]]: The queue depth and flush latency (in seconds) of the save queue"""
+        average_latency = self._total_flush_latency / self._flush_count if self._flush_count > 0 else 0.0
+        return {
+            "depth": len(self._pending),
+            "flushes": self._flush_count,
+            "failed": self._flush_failed,
+            "written": self._written_count,
+            "coalesced": self._coalesced_count,
+            "last_latency": self._last_flush_latency,
+            "average_latency": average_latency,
+            "max_latency": self._max_flush_latency,
+        }
+
+    def invalidate(self, server_id: str = None):
+        """Invalidate the cached data of a server, or everything if `server_id` is not provided.
+
+        Call this if you modify the ``showtimes_`` key directly without using :meth:`add_job`
+
+        :param server_id: The server ID to invalidate
+        :type server_id: str, optional
+        """
+        if server_id is not None:
+            server_id = self._strip_prefix(server_id)
+        self._cache.invalidate(server_id)
+
+    def _strip_prefix(self, server_id: str) -> str:
+        server_id = str(server_id)
+        if server_id.startswith(self._PREFIX):
+            server_id = server_id[len(self._PREFIX) :]
+        return server_id
 
     async def shutdown(self):
         """
-        Teardown everything
+        Teardown everything, and flush all the pending save.
         """
         self._logger.info("Cancelling all tasks...")
         self._showtasks.cancel()
+        try:
+            await self._showtasks
+        except asyncio.CancelledError:
+            pass
         for _, locked in self._lock_collection.items():
             await locked.release()
+        if self._pending:
+            self._logger.info(f"Flushing {len(self._pending)} pending save...")
+            await self._flush()
         self._logger.info("finished awaiting cancelled tasks, stopping...")
 
     def _get_lock(self, server_id: str) -> ShowtimesLock:
@@ -69,16 +211,107 @@ class ShowtimesQueue:
             self._lock_collection[server_id] = ShowtimesLock(server_id)
         return self._lock_collection[server_id]
 
-    async def _dumps_data(self, data: Showtimes):
-        self._logger.info(f"dumping db {data.id}")
-        async with self._get_lock(data.id) as locked_id:
-            try:
-                await self._db.set(f"{self._PREFIX}{locked_id}", data.serialize())
-            except aioredis.RedisError as e:
-                self._logger.error("Failed to dumps database...")
-                self._logger.error(e)
+    def _serialize_pending(self, server_id: str) -> dict:
+        """Serialize the pending data once, the result is shared by the reader and the writer"""
+        serialized = self._pending_serialized.get(server_id)
+        if serialized is None:
+            serialized = self._pending[server_id].serialize()
+            self._pending_serialized[server_id] = serialized
+        return serialized
+
+    def _clear_pending_snapshot(self, server_id: str):
+        self._pending_serialized.pop(server_id, None)
+        self._pending_views.pop(server_id, None)
+
+    async def _flush(self) -> bool:
+        """Write all of the pending snapshot to Redis in one go
+
+        :return: False if the write failed and the snapshot is kept for the next flush
+        :rtype: bool
+        """
+        batch = dict(self._pending)
+        if not batch:
+            return True
+        self._logger.info(f"dumping {len(batch)} db: {', '.join(batch.keys())}")
+        start_time = time.perf_counter()
+        locks = [self._get_lock(server_id) for server_id in sorted(batch.keys())]
+        for lock in locks:
+            await lock.hold()
+        try:
+            serialized = {
+                f"{self._PREFIX}{server_id}": self._serialize_pending(server_id) for server_id in batch.keys()
+            }
+            success = await self._db.setmany(serialized)
+        finally:
+            for lock in locks:
+                await lock.release()
+        elapsed = time.perf_counter() - start_time
+        self._flush_count += 1
+        self._last_flush_latency = elapsed
+        self._total_flush_latency += elapsed
+        self._max_flush_latency = max(self._max_flush_latency, elapsed)
+        if not success:
+            # Keep it in the pending list, the next flush will retry it.
+            self._flush_failed += 1
+            self._consecutive_failures += 1
+            current = time.monotonic()
+            if current - self._last_failure_log >= self.FAILURE_LOG_INTERVAL:
+                self._last_failure_log = current
+                self._logger.error(
+                    f"Failed to dumps {len(batch)} database ({self._consecutive_failures} failed attempt in a row)"
+                )
+            return False
+
+        if self._consecutive_failures > 0:
+            self._logger.info(f"Database dumped after {self._consecutive_failures} failed attempt")
+            self._consecutive_failures = 0
+            self._last_failure_log = 0.0
+        self._written_count += len(batch)
+        for server_id, data in batch.items():
+            # Only remove if there's no newer snapshot added while we're writing.
+            if self._pending.get(server_id) is data:
+                del self._pending[server_id]
+                self._clear_pending_snapshot(server_id)
+            # Invalidate again, a read might cache the old data while we're waiting for the job
+            self._cache.invalidate(server_id)
+        return True
+
+    async def flush(self):
+        """Write all of the pending save right now, use this before reading the ``showtimes_`` key directly"""
+        await self._flush()
 
-    async def fetch_database(self, server_id: str):
+    async def fetch_database(self, server_id: str, readonly: bool = False) -> Optional[Showtimes]:
+        """Fetch the showtimes data of a server
+
+        If `readonly` is True, the data will be served from the cache if possible.
+        The returned object is shared with other readers and MUST NOT be modified or saved.
+
+        If the server have a pending save, the data is created from the pending snapshot,
+        it's never the same object that is passed to :meth:`add_job`.
+
+        :param server_id: The server ID to fetch
+        :type server_id: str
+        :param readonly: Use the cached data, defaults to False
+        :type readonly: bool, optional
+        :return: The showtimes data, or None if the server doesn't exist
+        :rtype: Optional[Showtimes]
+        """
+        server_id = self._strip_prefix(server_id)
+        pending = self._pending.get(server_id)
+        if pending is not None:
+            # The data is not yet written, use the pending snapshot instead.
+            # The snapshot is serialized once per add_job, and it's reused when flushing.
+            if readonly:
+                view = self._pending_views.get(server_id)
+                if view is None:
+                    view = Showtimes.from_dict(self._serialize_pending(server_id))
+                    self._pending_views[server_id] = view
+                return view
+            return Showtimes.from_dict(self._serialize_pending(server_id))
+        if readonly:
+            cached = self._cache.get(server_id)
+            if cached is not None:
+                return cached
         async with self._get_lock(server_id) as locked_id:
             try:
                 self._logger.info(f"opening db {server_id}")
@@ -90,18 +323,58 @@ class ShowtimesQueue:
                 self._logger.error("Failed to read database...")
                 self._logger.error(e)
                 json_data = None
+        if readonly and json_data is not None:
+            self._cache.set(server_id, json_data)
         return json_data
 
     async def background_jobs(self):
         self._logger.info("Starting ShowtimesQueue Task...")
         while True:
             try:
-                sq_data: Showtimes = await self._showqueue.get()
-                self._logger.info(f"job get, running: {sq_data.id}")
-                await self._dumps_data(sq_data)
-                self._showqueue.task_done()
+                await self._pending_event.wait()
+                # Wait a bit so burst of save can be coalesced into a single write.
+                await asyncio.sleep(self._debounce)
+                self._pending_event.clear()
+                success = await self._flush()
+                if not success:
+                    # Back off exponentially so a broken Redis connection is not hammered.
+                    delay = min(self._debounce * 2**self._consecutive_failures, self.MAX_RETRY_DELAY)
+                    await asyncio.sleep(delay)
+                if self._pending:
+                    # Failed or new data added while flushing, retry on the next run.
+                    self._pending_event.set()
             except asyncio.CancelledError:
                 return
+            except Exception as e:
+                self._logger.error("An error occured while dumping database", exc_info=e)
+                await asyncio.sleep(self._debounce)
 
     async def add_job(self, save_data: Showtimes):
-        await self._showqueue.put(save_data)
+        """Queue the showtimes data to be saved
+
+        The data might be serialized before it's written, so call this again
+        if you modify the data after adding it.
+
+        :param save_data: The showtimes data to save
+        :type save_data: Showtimes
+        """
+        server_id = str(save_data.id)
+        self._cache.invalidate(server_id)
+        if server_id in self._pending:
+            self._coalesced_count += 1
+        self._pending[server_id] = save_data
+        self._clear_pending_snapshot(server_id)
+        self._pending_event.set()
+
+    async def remove(self, server_id: str):
+        """Remove the showtimes data of a server, including the pending save
+
+        :param server_id: The server ID to remove
+        :type server_id: str
+        """
+        server_id = self._strip_prefix(server_id)
+        self._pending.pop(server_id, None)
+        self._clear_pending_snapshot(server_id)
+        async with self._get_lock(server_id) as locked_id:
+            await self._db.rm(f"{self._PREFIX}{locked_id}")
+        self._cache.invalidate(server_id)
@@ -0,0 +1,121 @@
+"""
+MIT License
+
+Copyright (c) 2019-2021 naoTimesdev
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from naotimes_workers.rssparser import FansubRSSParsedFeed, cleanup_encoding_error, normalize_rss_data, parse_rss_feed
+
+__all__ = (
+    "FansubRSSParsedFeed",
+    "FansubRSSParser",
+    "cleanup_encoding_error",
+    "normalize_rss_data",
+    "parse_rss_feed",
+)
+
+
+class FansubRSSParser:
+    """A dedicated process pool to parse and normalize RSS feed outside the event loop.
+
+    Parsing and the markdown conversion is CPU heavy, running it on a thread would
+    still hold the GIL against the gateway. Raw bytes goes in and the normalized
+    entries goes out. The amount of pending parse job is limited by ``max_queue``,
+    any more feed will be rejected and should be retried on the next poll.
+
+    The workers are started with ``forkserver`` (or ``spawn``), never forked from the
+    running bot, and only import :mod:`naotimes_workers.rssparser`. The entrypoint is
+    re-imported on the worker too, so it must be guarded with ``if __name__ == "__main__"``
+    and must not import ``naotimes`` at the module level.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 8):
+        self.logger = logging.getLogger("Showtimes.FansubRSSParser")
+        self._max_workers = max_workers
+        self._max_queue = max_queue
+        self._pending = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def max_queue(self) -> int:
+        return self._max_queue
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is not None:
+            return self._executor
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            # Import the parser once in the server process, the workers is forked from it.
+            context.set_forkserver_preload([parse_rss_feed.__module__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(max_workers=self._max_workers, mp_context=context)
+        return self._executor
+
+    async def parse(self, raw_data: bytes, content_type: str = "") -> Optional[FansubRSSParsedFeed]:
+        """Parse the raw feed on the worker pool.
+
+        :param raw_data: The raw feed body
+        :type raw_data: bytes
+        :param content_type: The response Content-Type, defaults to ""
+        :type content_type: str, optional
+        :return: The normalized entries, or None if the feed is invalid, the queue is full or the worker died
+        :rtype: Optional[FansubRSSParsedFeed]
+        """
+        if self._pending >= self._max_queue:
+            self.logger.warning(f"Parser queue is full ({self._pending} pending), skipping feed")
+            return None
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        queued_at = time.perf_counter()
+        executor = self._get_executor()
+        try:
+            parsed = await loop.run_in_executor(executor, parse_rss_feed, raw_data, content_type)
+        except BrokenProcessPool:
+            self.logger.error("Parser worker died, recreating the pool...")
+            if self._executor is executor:
+                self._executor = None
+            executor.shutdown(wait=False)
+            return None
+        finally:
+            self._pending -= 1
+        if parsed is None:
+            return None
+        # Time spent waiting for a free worker and transferring the data
+        wait_time = max(time.perf_counter() - queued_at - parsed.parse_time, 0.0)
+        return parsed._replace(wait_time=wait_time)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
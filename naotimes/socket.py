@@ -35,18 +35,18 @@ import inspect
 import logging
 import platform
 import socket
+import struct
 import traceback
 from base64 import b64encode
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from inspect import signature
 from time import struct_time
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypedDict, Union
 
 import arrow
 import orjson
 from bson import ObjectId
 
-from .t import T
 from .utils import get_indexed
 
 __all__ = ("EventManager", "SocketServer", "ntevent", "ntsocket")
@@ -83,17 +83,89 @@ async def maybe_asyncute(func: Union[SServerFunc, EventFunc], *args, **kwargs):
     return result
 
 
+def _create_socket_adapter(func: SServerFunc) -> Callable[[str, Any], Any]:
+    """Create a function that always accept ``(sid, data)`` and pass what the callback need"""
+    required = sum(1 for param in signature(func).parameters.values() if param.default == param.empty)
+    if required == 0:
+        return lambda sid, data: func()
+    if required == 1:
+        return lambda sid, data: func(sid)
+    return func
+
+
 @dataclass
 class SocketEvent:
     callback: SServerFunc
     is_auth: bool = True
+    invoke: Callable[[str, Any], Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Resolve the callback arguments once, instead of on every message.
+        self.invoke = _create_socket_adapter(self.callback)
+
+
+class EventCallback:
+    """A ntevent callback with the parameters resolved at registration time"""
+
+    __slots__ = ("callback", "_params")
+
+    def __init__(self, callback: EventFunc):
+        self.callback = callback
+        self._params: List[Tuple[int, str, Any]] = [
+            (idx, param.name, param.default) for idx, param in enumerate(signature(callback).parameters.values())
+        ]
+
+    def __repr__(self):
+        return repr(self.callback)
+
+    def bind(self, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Map the dispatched arguments to the callback keyword arguments
+
+        :param args: The positional arguments of the dispatch
+        :type args: Tuple[Any, ...]
+        :param kwargs: The keyword arguments of the dispatch
+        :type kwargs: Dict[str, Any]
+        :return: The keyword arguments, or None if a required argument is missing
+        :rtype: Optional[Dict[str, Any]]
+        """
+        valid_kwargs = {}
+        total_args = len(args)
+        for idx, name, default in self._params:
+            if default is not inspect.Parameter.empty:
+                kw = kwargs.get(name)
+                valid_kwargs[name] = default if kw is None else kw
+                continue
+            value = args[idx] if idx < total_args else None
+            if value is None:
+                return None
+            valid_kwargs[name] = value
+        return valid_kwargs
 
 
 class SocketServer:
     """
     A simple external socket server
+
+    The server speaks two protocol:
+
+    - The legacy one, a single JSON request terminated with ``\\x04`` per connection,
+      the server answer back the same way and close the connection.
+    - The framed one, the client open with ``FRAME_MAGIC`` (the server echo it back) and keep the
+      connection open. Every request and answer is a frame of ``>II`` header (payload length and
+      request ID) followed by the JSON payload. Multiple request can be in-flight at the same time,
+      the answer is sent back with the same request ID as soon as it's done, while the answer of
+      the same request ID is kept in order.
     """
 
+    FRAME_MAGIC = b"\x00ntsf"
+    FRAME_HEADER = struct.Struct(">II")
+    # Maximum payload size of a single frame
+    MAX_FRAME_SIZE = 16 * 1024 * 1024
+    # Maximum in-flight request per connection, we stop reading until one of them is done.
+    MAX_INFLIGHT = 64
+    # Close the framed connection if there's no new request after this many seconds.
+    IDLE_TIMEOUT = 300.0
+
     def __init__(
         self,
         port: int,
@@ -200,7 +272,7 @@ class SocketServer:
         return orjson.loads(decoded)
 
     @staticmethod
-    def _encode_message(any_data: Any) -> bytes:
+    def _dump_message(any_data: Any) -> bytes:
         def _OrJsonDefault(obj: Any):
             if isinstance(obj, ObjectId):
                 return str(obj)
@@ -215,24 +287,20 @@ class SocketServer:
         elif isinstance(any_data, (int, float)):
             any_data = str(any_data)
         elif isinstance(any_data, bytes):
-            if b"\x04" != any_data[-len(b"\x04") :]:
-                any_data = any_data + b"\x04"
             return any_data
-        return any_data.encode("utf-8") + b"\x04"
+        return any_data.encode("utf-8")
 
-    @staticmethod
-    def __create_argument(func: Callable[..., T], sid: str, data: str):
-        available_args = []
-        sigmaballs = signature(func)
-        for param in sigmaballs.parameters.values():
-            if param.default != param.empty:
-                continue
-            available_args.append(param)
-        if len(available_args) == 0:
-            return []
-        if len(available_args) == 1:
-            return [sid]
-        return [sid, data]
+    @classmethod
+    def _encode_message(cls, any_data: Any) -> bytes:
+        encoded = cls._dump_message(any_data)
+        if b"\x04" != encoded[-len(b"\x04") :]:
+            encoded = encoded + b"\x04"
+        return encoded
+
+    @classmethod
+    def _encode_frame(cls, request_id: int, any_data: Any) -> bytes:
+        encoded = cls._dump_message(any_data)
+        return cls.FRAME_HEADER.pack(len(encoded), request_id) + encoded
 
     def _check_auth(self, sid: str) -> bool:
         if self._password is None:
@@ -289,8 +357,7 @@ class SocketServer:
 
         # Try to execute callback
         try:
-            generated_args = self.__create_argument(callback.callback, sid, content)
-            res = await maybe_asyncute(callback.callback, *generated_args)
+            res = await maybe_asyncute(callback.invoke, sid, content)
         except Exception as e:
             self.logger.exception(e)
             err_msg = "An error occured while trying to execute callback"
@@ -309,12 +376,24 @@ class SocketServer:
         return {"message": res, "success": 1, "event": event}
 
     async def _handle_message(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            first_byte = await reader.readexactly(1)
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        # A JSON message would never start with the null byte, so we can use it to pick the protocol.
+        if first_byte == self.FRAME_MAGIC[:1]:
+            await self._handle_framed(reader, writer)
+        else:
+            await self._handle_legacy(first_byte, reader, writer)
+
+    async def _handle_legacy(self, first_byte: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         self.logger.info("Message received, reading message...")
         start = arrow.utcnow().timestamp()
         uuid = "UNKNOWN_UUID"
         answer = {"message": "An unknown error occured", "success": 0}
         try:
-            data = await reader.readuntil(b"\x04")
+            data = first_byte + await reader.readuntil(b"\x04")
             addr = writer.get_extra_info("peername")
             uuid = self._hash_ip(addr)
             answer = await self._on_message(uuid, data)
@@ -330,6 +409,101 @@ class SocketServer:
         self.log(uuid, event_name, answer["success"], answer, end - start)
         writer.close()
 
+    async def _answer_frame(
+        self,
+        uuid: str,
+        request_id: int,
+        payload: bytes,
+        previous: Optional[asyncio.Task],
+        writer: asyncio.StreamWriter,
+        write_lock: asyncio.Lock,
+    ):
+        start = arrow.utcnow().timestamp()
+        try:
+            answer = await self._on_message(uuid, payload)
+        except Exception as e:
+            self.logger.error(f"failed to process request {request_id} from {uuid}", exc_info=e)
+            answer = {"message": "invalid message received", "success": 0, "event": None}
+        if previous is not None:
+            # Keep the answer of the same request ID in order
+            await asyncio.gather(previous, return_exceptions=True)
+        event_name = answer.get("event") or "UNKNOWN"
+        async with write_lock:
+            writer.write(self._encode_frame(request_id, answer))
+            await writer.drain()
+        end = arrow.utcnow().timestamp()
+        self.log(uuid, event_name, answer["success"], answer, end - start)
+
+    async def _handle_framed(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        uuid = self._hash_ip(writer.get_extra_info("peername"))
+        try:
+            magic = await reader.readexactly(len(self.FRAME_MAGIC) - 1)
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        if self.FRAME_MAGIC[:1] + magic != self.FRAME_MAGIC:
+            self.logger.error(f"invalid protocol header from {uuid}, closing connection")
+            writer.close()
+            return
+
+        self.logger.info(f"Opening framed connection with {uuid}")
+        writer.write(self.FRAME_MAGIC)
+        await writer.drain()
+
+        write_lock = asyncio.Lock()
+        inflight = asyncio.Semaphore(self.MAX_INFLIGHT)
+        pending: Set[asyncio.Task] = set()
+        last_by_id: Dict[int, asyncio.Task] = {}
+
+        def _request_done(request_id: int, task: asyncio.Task):
+            pending.discard(task)
+            inflight.release()
+            if last_by_id.get(request_id) is task:
+                del last_by_id[request_id]
+            if not task.cancelled() and task.exception() is not None:
+                self.logger.error(f"failed to answer request {request_id} to {uuid}", exc_info=task.exception())
+
+        try:
+            while True:
+                # Stop reading new frame when the client send too much request at once.
+                await inflight.acquire()
+                try:
+                    header = await asyncio.wait_for(
+                        reader.readexactly(self.FRAME_HEADER.size), timeout=self.IDLE_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    inflight.release()
+                    if pending:
+                        continue
+                    self.logger.info(f"Closing idle framed connection with {uuid}")
+                    break
+                except Exception:
+                    inflight.release()
+                    raise
+                size, request_id = self.FRAME_HEADER.unpack(header)
+                if size > self.MAX_FRAME_SIZE:
+                    inflight.release()
+                    self.logger.error(f"frame from {uuid} is too big ({size} bytes), closing connection")
+                    break
+                try:
+                    payload = await asyncio.wait_for(reader.readexactly(size), timeout=self.IDLE_TIMEOUT)
+                except BaseException:
+                    inflight.release()
+                    raise
+                task = asyncio.create_task(
+                    self._answer_frame(uuid, request_id, payload, last_by_id.get(request_id), writer, write_lock),
+                    name=f"naoTimesSocket: {uuid}-{request_id}",
+                )
+                pending.add(task)
+                last_by_id[request_id] = task
+                task.add_done_callback(lambda t, rid=request_id: _request_done(rid, t))
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+            pass
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self.logger.info(f"Closing framed connection with {uuid}")
+        writer.close()
+
     def _bind_function_attr(
         self, bind_this: SServerFunc, name: str, lock: bool = True, installed: bool = True
     ):
@@ -403,7 +577,7 @@ class EventManager:
     def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         """A simple event manager to dispatch a event to another cogs"""
         self.logger = logging.getLogger("naoTimes.EventManager")
-        self._event_map: Dict[str, List[EventFunc]] = {}
+        self._event_map: Dict[str, List[EventCallback]] = {}
 
         self._loop = loop or asyncio.get_event_loop()
         self._blocking = False
@@ -477,35 +651,6 @@ class EventManager:
 
         return event_map
 
-    def __create_kwarguments(self, callback: EventFunc, *args, **kwargs):
-        valid_kwargs = {}
-        missing_kwargs = []
-        sigmaballs = signature(callback)
-        for idx, param in enumerate(sigmaballs.parameters.values()):
-            kw = kwargs.get(param.name)
-            if param.default != param.empty:
-                if kw is not None:
-                    valid_kwargs[param.name] = kw
-                else:
-                    valid_kwargs[param.name] = param.default
-                continue
-
-            args_index = get_indexed(args, idx)
-            if args_index is not None:
-                valid_kwargs[param.name] = args_index
-            else:
-                missing_kwargs.append(
-                    {
-                        "index": idx,
-                        "name": param.name,
-                    }
-                )
-
-        if len(missing_kwargs) > 0:
-            return False, None
-
-        return True, valid_kwargs
-
     def dispatch(self, event: str, *args, **kwargs) -> None:
         """Dispatch an event to all registered callbacks"""
         if self._blocking:
@@ -517,18 +662,14 @@ class EventManager:
             self.logger.warning(f"event {event} not found, ignoring...")
             return
 
-        if isinstance(callbacks, list):
-            for callback in callbacks:
-                self.logger.info(f"Trying to dispatch event: {event}, callback: {callback}")
-                valid, real_kwargs = self.__create_kwarguments(callback, *args, **kwargs)
-                if not valid:
-                    continue
-                self._internal_scheduler(event, callback, *[], **real_kwargs)
-        else:
-            self.logger.info(f"Trying to dispatch event: {event}, callback: {callbacks}")
-            valid, real_kwargs = self.__create_kwarguments(callbacks, *args, **kwargs)
-            if valid:
-                self._internal_scheduler(event, callbacks, *[], **real_kwargs)
+        if not isinstance(callbacks, list):
+            callbacks = [callbacks]
+        for callback in callbacks:
+            self.logger.info(f"Trying to dispatch event: {event}, callback: {callback}")
+            real_kwargs = callback.bind(args, kwargs)
+            if real_kwargs is None:
+                continue
+            self._internal_scheduler(event, callback.callback, **real_kwargs)
 
     @staticmethod
     def __extract_fn_name(fn: EventFunc):
@@ -577,10 +718,11 @@ class EventManager:
             raise ValueError("Cannot use `realfn_` as starting event name because it's reserved!")
         event_map = self._event_map.get(event, [])
         self._bind_function_attr(callback, event)
-        event_map.append(callback)
+        event_callback = EventCallback(callback)
+        event_map.append(event_callback)
         fn_name = self.__extract_fn_name(callback)
         self._event_map[event] = event_map
-        self._event_map["realfn_" + fn_name] = [callback]
+        self._event_map["realfn_" + fn_name] = [event_callback]
 
     def off(self, event: str) -> None:
         """Unbind event, if it's doesnt exist log and do nothing"""
@@ -591,7 +733,7 @@ class EventManager:
         self.logger.warning(f"unbinding event {event}")
         event_list = self._event_map[event]
         for evcb in event_list:
-            self._bind_function_attr(evcb, event, False)
+            self._bind_function_attr(evcb.callback, event, False)
         del self._event_map[event]
 
 
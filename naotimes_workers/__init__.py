@@ -0,0 +1,11 @@
+"""
+naotimes_workers
+~~~~~~~~~~~~~~~~~
+Modules that is run on the worker processes.
+
+Everything in here must stay importable without importing ``naotimes``,
+so the worker does not need to load the whole bot.
+
+:copyright: (c) 2019-2021 naoTimesdev
+:license: MIT, see LICENSE for more details.
+"""
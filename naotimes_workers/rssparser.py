@@ -0,0 +1,207 @@
+"""
+The RSS feed parser that is run on the FansubRSS worker process.
+
+This module must not import anything from ``naotimes``, importing it would load
+the whole bot stack (disnake, motor, wavelink, etc.) on every worker process.
+
+---
+
+MIT License
+
+Copyright (c) 2019-2021 naoTimesdev
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import re
+import time
+from typing import Any, List, NamedTuple, Optional
+from urllib.parse import urlparse
+
+import feedparser
+from markdownify import markdownify as mdparse
+
+__all__ = (
+    "FansubRSSParsedFeed",
+    "cleanup_encoding_error",
+    "normalize_rss_data",
+    "parse_rss_feed",
+)
+
+ImageExtract = re.compile(r"!\[[^\]]*\]\((?P<filename>.*?)(?=\"|\))(?P<optionalpart>\".*\")?\)", re.I)
+
+
+def cleanup_encoding_error(text: str) -> str:
+    """
+    Fix encoding errors in text.
+    """
+    replace_data = {
+        "â€™": "’",
+    }
+    for key, value in replace_data.items():
+        text = text.replace(key, value)
+    return text.strip()
+
+
+def first_match_in_list(targets: list, key: str):
+    for data in targets:
+        try:
+            valid = data[key]
+            return valid
+        except Exception:
+            pass
+    return None
+
+
+def normalize_rss_data(entries: dict, base_url: str = "") -> dict:
+    """Remove unnecessary tags that basically useless for the bot."""
+    KEYS_TO_REMOVE = [
+        "title_detail",
+        "links",
+        "authors",
+        "author_detail",
+        "content",
+        "updated",
+        "guidislink",
+        "summary_detail",
+        "comments",
+        "href",
+        "wfw_commentrss",
+        "slash_comments",
+    ]
+
+    if base_url.endswith("/"):
+        base_url = base_url[:-1]
+
+    for KEY in KEYS_TO_REMOVE:
+        try:
+            del entries[KEY]
+        except KeyError:
+            pass
+
+    tagar = entries.get("tags", [])
+    proper_tag = []
+    for tag in tagar:
+        proper_tag.append(tag["term"])
+    entries["tags"] = proper_tag
+
+    if "media_thumbnail" in entries:
+        try:
+            matching_image = first_match_in_list(entries["media_thumbnail"], "url")
+            if matching_image is None:
+                entries["media_thumbnail"] = ""
+            else:
+                entries["media_thumbnail"] = matching_image
+        except IndexError:
+            entries["media_thumbnail"] = ""
+        except KeyError:
+            entries["media_thumbnail"] = ""
+    else:
+        entries["media_thumbnail"] = ""
+
+    if "summary" in entries:
+        parsed_summary = cleanup_encoding_error(mdparse(entries["summary"]))
+        extracted_images = list(ImageExtract.finditer(parsed_summary))
+        first_image_link = None
+        for extracted in extracted_images:
+            if extracted:
+                filename_match = extracted.group("filename")
+                all_match = extracted.group()
+                parsed_summary = parsed_summary.replace(all_match, "")
+                parse_url = urlparse(filename_match)
+                if parse_url.netloc == "":
+                    real_url = parse_url.path
+                    if real_url.startswith("/"):
+                        real_url = real_url[1:]
+                    query_params = parse_url.query
+                    first_image_link = f"{base_url}/{real_url}"
+                    if query_params != "":
+                        first_image_link += f"?{query_params}"
+                else:
+                    skema_url = parse_url.scheme
+                    if skema_url == "":
+                        skema_url = "http"
+                    first_image_link = f"{skema_url}://{parse_url.netloc}{parse_url.path}"
+                    if parse_url.query != "":
+                        first_image_link += f"?{parse_url.query}"
+        entries["summary"] = cleanup_encoding_error(parsed_summary)
+        if first_image_link is not None and not entries["media_thumbnail"]:
+            entries["media_thumbnail"] = first_image_link
+
+    if "description" in entries:
+        parsed_description = cleanup_encoding_error(mdparse(entries["description"]))
+        entries["description"] = parsed_description
+
+    if "media_content" in entries:
+        media_url = entries["media_content"]
+        if media_url:
+            matching_image = first_match_in_list(media_url, "url")
+            if matching_image is not None:
+                entries["media_content"] = matching_image
+        else:
+            del entries["media_content"]
+
+    return entries
+
+
+def _compact(data: Any) -> Any:
+    # FeedParserDict is heavier to pickle and to keep around than a plain dict.
+    if isinstance(data, dict):
+        return {key: _compact(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_compact(value) for value in data]
+    return data
+
+
+class FansubRSSParsedFeed(NamedTuple):
+    entries: List[dict]
+    base_url: str
+    parse_time: float
+    wait_time: float = 0.0
+
+
+def parse_rss_feed(raw_data: bytes, content_type: str = "") -> Optional[FansubRSSParsedFeed]:
+    """Parse and normalize a raw RSS feed.
+
+    This is the function that is run on the worker process, so it must stay picklable
+    and only return plain data.
+
+    :param raw_data: The raw feed body
+    :type raw_data: bytes
+    :param content_type: The response Content-Type, defaults to ""
+    :type content_type: str, optional
+    :return: The normalized entries, or None if the feed is invalid
+    :rtype: Optional[FansubRSSParsedFeed]
+    """
+    start = time.perf_counter()
+    response_headers = {"content-type": content_type} if content_type else None
+    feed = feedparser.parse(raw_data, response_headers=response_headers)
+    if not feed:
+        return None
+
+    base_url = feed["feed"].get("link", "")
+    parsed_base_url = urlparse(base_url)
+
+    skema_uri = parsed_base_url.scheme
+    if skema_uri == "":
+        skema_uri = "http"
+    base_url_for_real = f"{skema_uri}://{parsed_base_url.netloc}"
+
+    entries = [_compact(normalize_rss_data(entry, base_url_for_real)) for entry in feed.entries]
+    return FansubRSSParsedFeed(entries, base_url_for_real, time.perf_counter() - start)